@@ -13,7 +13,7 @@ from pathlib import Path
 import numpy as np
 from sklearn.cluster import DBSCAN
 
-from llm_consortium.db import get_embedding_records_for_run
+from llm_consortium.db import decode_embedding, get_embedding_records_for_run
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("analyze_results")
@@ -26,13 +26,13 @@ def compute_clusters(records, eps=0.5, min_samples=2):
     embeddings = []
     vector_ids = []
     for r in records:
-        if r.get("embedding_json"):
-            try:
-                vec = json.loads(r["embedding_json"])
-                embeddings.append(vec)
-                vector_ids.append(r["response_id"])
-            except:
-                pass
+        try:
+            vec = decode_embedding(r)
+        except Exception:
+            vec = None
+        if vec is not None:
+            embeddings.append(vec)
+            vector_ids.append(r["response_id"])
                 
     if not embeddings:
         return 0, {}
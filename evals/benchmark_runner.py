@@ -10,8 +10,10 @@ import time
 import concurrent.futures
 import multiprocessing
 from pathlib import Path
+from types import SimpleNamespace
 
 from llm_consortium import create_consortium
+from llm_consortium.embeddings import preload_backends
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("benchmark_runner")
@@ -38,7 +40,10 @@ def run_strategy(strategy_name, prompt_data, models, str_params=None, arbiter=No
     orch.config.expected_agreement = expected_agreement
 
     start_t = time.time()
-    result = orch.orchestrate(prompt_text)
+    try:
+        result = orch.orchestrate(prompt_text)
+    finally:
+        orch.close()
     elapsed = time.time() - start_t
 
     synthesis = result.get("synthesis", {})
@@ -81,6 +86,12 @@ def _run_main():
         return
 
     results = []
+
+    # Load the embedding model once and keep it alive for every semantic run
+    embedding_leases = preload_backends(
+        [SimpleNamespace(embedding_backend=args.embedding_backend, embedding_model=args.embedding_model)],
+        background=False,
+    )
     
     max_workers = min(5, multiprocessing.cpu_count())
     logger.info(f"Running benchmarks with {max_workers} concurrent parallel workers")
@@ -117,13 +128,17 @@ def _run_main():
             }
         }
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(process_prompt, p_data, i): i for i, p_data in enumerate(prompts)}
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                results.append(future.result())
-            except Exception as e:
-                logger.error(f"Error executing prompt: {e}")
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(process_prompt, p_data, i): i for i, p_data in enumerate(prompts)}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"Error executing prompt: {e}")
+    finally:
+        for lease in embedding_leases:
+            lease.release()
 
     # Summary Output
     default_failures = sum(1 for r in results if r["runs"]["default"]["status"] != "success")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark for embedding storage precision.
+Reports cache memory, embed/cache-hit latency and cosine-similarity error for
+each precision policy on synthetic vectors of a realistic width.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from llm_consortium.embeddings.backends import BaseEmbeddingBackend
+from llm_consortium.embeddings.precision import PRECISIONS
+from llm_consortium.embeddings.service import EmbeddingService
+
+
+class TableBackend(BaseEmbeddingBackend):
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def embed(self, text):
+        return self.vectors[text]
+
+    def dimension(self):
+        return next(iter(self.vectors.values())).shape[0]
+
+
+def _cosine_matrix(vectors):
+    matrix = np.vstack(vectors).astype(np.float64)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix @ matrix.T
+
+
+def run(count, dimensions, truncate, repeats):
+    rng = np.random.default_rng(42)
+    vectors = {f"response-{i}": rng.standard_normal(dimensions) for i in range(count)}
+    texts = list(vectors)
+    reference = _cosine_matrix([vectors[text] for text in texts])
+
+    rows = []
+    for precision in PRECISIONS:
+        service = EmbeddingService(TableBackend(vectors), cache_size=count, precision=precision, dimensions=truncate)
+
+        start = time.perf_counter()
+        embedded = service.embed_batch(texts)
+        miss_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            service.embed_batch(texts)
+        hit_seconds = (time.perf_counter() - start) / repeats
+
+        start = time.perf_counter()
+        similarity = _cosine_matrix(embedded)
+        matrix_seconds = time.perf_counter() - start
+
+        error = float(np.max(np.abs(similarity - reference))) if truncate is None else float("nan")
+        rows.append((precision, service.cache_nbytes(), miss_seconds, hit_seconds, matrix_seconds, error))
+
+    baseline_bytes = rows[0][1]
+    print(f"{count} vectors x {dimensions} dims" + (f" truncated to {truncate}" if truncate else ""))
+    print(f"{'precision':<10}{'cache KiB':>12}{'vs f64':>9}{'miss ms':>10}{'hit ms':>10}{'matrix ms':>11}{'max |dcos|':>12}")
+    for precision, nbytes, miss, hit, matrix, error in rows:
+        print(
+            f"{precision:<10}{nbytes / 1024:>12.1f}{baseline_bytes / nbytes:>8.1f}x"
+            f"{miss * 1e3:>10.2f}{hit * 1e3:>10.3f}{matrix * 1e3:>11.3f}{error:>12.2e}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=256, help="Number of cached vectors")
+    parser.add_argument("--dimensions", type=int, default=1536, help="Backend vector width")
+    parser.add_argument("--truncate", type=int, default=None, help="Matryoshka truncation width")
+    parser.add_argument("--repeats", type=int, default=20, help="Cache-hit passes to average")
+    args = parser.parse_args()
+    run(args.count, args.dimensions, args.truncate, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the vectorized response geometry.
+Compares the per-vector loop used previously (mean centroid, one cosine
+distance per response, per-cluster recomputation) against ResponseGeometry,
+which derives the same quantities from one Gram matrix.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from llm_consortium.geometry import ResponseGeometry, _cosine_distance
+
+
+def _loop_geometry(vectors, labels):
+    centroid = np.mean(np.vstack(vectors), axis=0)
+    distances = [_cosine_distance(vector, centroid) for vector in vectors]
+    confidence = 1.0 - float(np.mean(distances))
+    mean, std = float(np.mean(distances)), float(np.std(distances))
+    outliers = [i for i, distance in enumerate(distances) if std and distance > mean + 2.0 * std]
+    for cluster_id in set(labels) - {-1}:
+        members = [vector for vector, label in zip(vectors, labels) if label == cluster_id]
+        cluster_centroid = np.mean(np.vstack(members), axis=0)
+        [_cosine_distance(vector, cluster_centroid) for vector in members]
+    pairwise = [[_cosine_distance(a, b) for b in vectors] for a in vectors]
+    return confidence, outliers, pairwise
+
+
+def _matrix_geometry(vectors, labels):
+    geometry = ResponseGeometry(vectors)
+    confidence = geometry.confidence()
+    outliers = geometry.outliers()
+    geometry.cluster_stats(labels)
+    pairwise = geometry.cosine_distance_matrix()
+    return confidence, outliers, pairwise
+
+
+def _time(function, repeats, *args):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = function(*args)
+    return (time.perf_counter() - start) / repeats, result
+
+
+def run(sizes, dimensions, repeats):
+    rng = np.random.default_rng(42)
+    print(f"{dimensions} dims, mean of {repeats} runs")
+    print(f"{'N':>6}{'loop ms':>12}{'matrix ms':>12}{'speedup':>10}{'|dconf|':>11}")
+    for count in sizes:
+        vectors = [rng.standard_normal(dimensions) for _ in range(count)]
+        labels = [i % 3 for i in range(count)]
+        loop_repeats = repeats if count <= 128 else 1
+        loop_seconds, (loop_confidence, _, _) = _time(_loop_geometry, loop_repeats, vectors, labels)
+        matrix_seconds, (matrix_confidence, _, _) = _time(_matrix_geometry, repeats, vectors, labels)
+        print(
+            f"{count:>6}{loop_seconds * 1e3:>12.2f}{matrix_seconds * 1e3:>12.3f}"
+            f"{loop_seconds / matrix_seconds:>9.1f}x{abs(loop_confidence - matrix_confidence):>11.1e}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="3,8,32,128,512", help="Comma-separated response counts")
+    parser.add_argument("--dimensions", type=int, default=1536, help="Embedding width")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs to average per size")
+    args = parser.parse_args()
+    run([int(size) for size in args.sizes.split(",")], args.dimensions, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
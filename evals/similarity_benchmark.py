@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark for voting similarity grouping.
+Times VotingStrategy grouping with each similarity_method on a synthetic
+corpus of paraphrased answers and reports the number of groups found.
+"""
+import argparse
+import random
+import string
+import time
+from unittest.mock import Mock
+
+from llm_consortium.strategies.voting import VotingStrategy
+
+
+def paraphrase_corpus(count, length, edits, seed=3):
+    """Four base answers, each repeated with a few word-level edits."""
+    rng = random.Random(seed)
+    vocabulary = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))) for _ in range(300)]
+    bases = [" ".join(rng.choice(vocabulary) for _ in range(length // 6)) for _ in range(4)]
+    responses = []
+    for index in range(count):
+        words = bases[index % 4].split()
+        for _ in range(edits):
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        responses.append({"model": f"model-{index}", "response": " ".join(words)})
+    return responses
+
+
+def run(counts, length, edits, threshold):
+    print(f"{'responses':>10}{'method':>10}{'groups':>8}{'ms':>10}")
+    for count in counts:
+        responses = paraphrase_corpus(count, length, edits)
+        for method in VotingStrategy.SIMILARITY_METHODS:
+            strategy = VotingStrategy(Mock(), {"similarity_threshold": threshold, "similarity_method": method})
+            start = time.perf_counter()
+            groups = strategy._group_similar_responses(responses)
+            elapsed = time.perf_counter() - start
+            print(f"{count:>10}{method:>10}{len(groups):>8}{elapsed * 1e3:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--counts", default="8,48,128", help="Comma-separated numbers of responses")
+    parser.add_argument("--length", type=int, default=1200, help="Approximate characters per response")
+    parser.add_argument("--edits", type=int, default=6, help="Word edits per paraphrase")
+    parser.add_argument("--threshold", type=float, default=0.6, help="similarity_threshold")
+    args = parser.parse_args()
+    run([int(count) for count in args.counts.split(",")], args.length, args.edits, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
@@ -196,6 +196,7 @@ def cns_vote_binary():
             "require_majority": True,
             "fallback_to_all": False,
             "answer_length": 50,
+            "answer_extractor": "boolean",
         },
     )
     return orch.orchestrate(
@@ -571,6 +572,7 @@ def cns_json_only():
         max_iterations=2,
         minimum_iterations=1,
         strategy="default",
+        judging_method="json",
         system_prompt=(
             "You must respond ONLY with valid JSON. No markdown, no explanation, no prose. "
             "Your entire response must be parseable by json.loads(). "
@@ -749,6 +751,7 @@ def cns_math_olympiad():
             "require_majority": True,
             "fallback_to_all": True,
             "answer_length": 100,
+            "answer_extractor": "tag,number",
         },
         system_prompt=(
             "Solve step by step. Show all work. State the final numerical answer "
@@ -62,6 +62,7 @@ logger = logging.getLogger(__name__)
 @llm.hookimpl
 def register_models(register):
     """Register all saved consortiums as models."""
+    preload = os.environ.get('LLM_CONSORTIUM_PRELOAD_EMBEDDINGS') == '1'
     try:
         db = DatabaseConnection.get_connection()
         if "consortium_configs" not in db.table_names():
@@ -74,6 +75,8 @@ def register_models(register):
                     config_data = json.loads(row.get("config", "{}"))
                     config = ConsortiumConfig.from_dict(config_data)
                     model = ConsortiumModel(name, config)
+                    if preload:
+                        model.preload_embeddings()
                     register(model)
                     logger.debug(f"Registered consortium model: {name}")
                 except Exception as e:
@@ -0,0 +1,139 @@
+"""Final-answer extraction for exact voting.
+
+An extractor takes a response text and returns a canonical answer string, or
+None when it cannot find one. Canonical forms are chosen so that equal answers
+compare equal as plain strings: numbers become reduced fractions or integers
+("0.50", "1/2" -> "1/2"; "1,000" -> "1000"), booleans become "yes"/"no" and
+choices become an upper-case letter.
+
+Extractors are looked up by name; register custom ones with
+:func:`register_answer_extractor`.
+"""
+import re
+from fractions import Fraction
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .similarity import normalize_answer
+
+AnswerExtractor = Callable[[str, Dict[str, Any]], Optional[str]]
+
+_NUMBER = re.compile(r"(?<![\w.])[-+]?\d[\d,]*(?:\.\d+)?(?:\s*/\s*\d+)?(?![\w])|(?<![\w.])[-+]?\.\d+")
+_BOOLEAN_WORD = r"(yes|no|true|false|correct|incorrect)\b"
+_BOOLEAN = re.compile(r"\b" + _BOOLEAN_WORD, re.IGNORECASE)
+# A boolean opening a line or following "answer"/"verdict"/"conclusion" states the verdict
+_BOOLEAN_VERDICT = re.compile(
+    r"^[^\w\n]*" + _BOOLEAN_WORD + r"|\b(?:answer|verdict|conclusion)\b[^\w\n]*(?:is\b[^\w\n]*)?" + _BOOLEAN_WORD,
+    re.IGNORECASE | re.MULTILINE,
+)
+_BOOLEAN_VALUES = {"yes": "yes", "true": "yes", "correct": "yes", "no": "no", "false": "no", "incorrect": "no"}
+# Choice letters are upper case unless bracketed; a bare "A" or "I" followed by a
+# lower-case word is the article or pronoun, not a choice
+_CHOICE_PATTERNS = [
+    re.compile(r"(?i:\banswer)\s*(?:is|:)?\s*\(([A-Ja-j])\)"),
+    re.compile(r"(?i:\banswer)\s*(?:is|:)?\s*([B-HJ]|[AI](?!\s+[a-z]))(?=[\s.,;:)]|$)"),
+    re.compile(r"(?i:\banswer\b)[^\n]*?\(([A-J])\)"),
+    re.compile(r"^\s*\(?([A-J])[\).:](?:\s|$)", re.MULTILINE),
+    re.compile(r"\(([A-J])\)"),
+]
+
+
+def canonical_number(text: str) -> Optional[str]:
+    """Exact canonical form of a numeric literal, or None if ``text`` is not one."""
+    text = text.strip().rstrip(".").replace(",", "").replace(" ", "")
+    try:
+        value = Fraction(text)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return str(value.numerator) if value.denominator == 1 else f"{value.numerator}/{value.denominator}"
+
+
+def _canonical_text(text: str) -> Optional[str]:
+    text = text.strip().strip("$").strip()
+    if not text:
+        return None
+    return canonical_number(text) or normalize_answer(text) or None
+
+
+def extract_tag(text: str, options: Dict[str, Any]) -> Optional[str]:
+    """Last ``<answer>...</answer>`` block, else the last ``ANSWER: ...`` line."""
+    tag = re.escape(str(options.get("answer_tag") or "answer"))
+    blocks = re.findall(rf"<{tag}>(.*?)</{tag}>", text, re.IGNORECASE | re.DOTALL)
+    if not blocks:
+        blocks = re.findall(rf"^\W*{tag}\W*[:=]\s*(.+?)\s*$", text, re.IGNORECASE | re.MULTILINE)
+    return _canonical_text(blocks[-1]) if blocks else None
+
+
+def extract_regex(text: str, options: Dict[str, Any]) -> Optional[str]:
+    """Last match of ``answer_pattern`` (its first group if it has one)."""
+    pattern = options.get("answer_pattern")
+    if not pattern:
+        return None
+    matches = list(re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE))
+    if not matches:
+        return None
+    match = matches[-1]
+    return _canonical_text(match.group(1) if match.groups() else match.group(0))
+
+
+def extract_number(text: str, options: Dict[str, Any]) -> Optional[str]:
+    numbers = _NUMBER.findall(text)
+    return canonical_number(numbers[-1]) if numbers else None
+
+
+def extract_boolean(text: str, options: Dict[str, Any]) -> Optional[str]:
+    """Last stated verdict ("YES. The query ...", "the verdict is no"), else the last boolean word."""
+    verdicts = [next(group for group in match.groups() if group) for match in _BOOLEAN_VERDICT.finditer(text)]
+    words = verdicts or _BOOLEAN.findall(text)
+    return _BOOLEAN_VALUES[words[-1].lower()] if words else None
+
+
+def extract_choice(text: str, options: Dict[str, Any]) -> Optional[str]:
+    for pattern in _CHOICE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1).upper()
+    return None
+
+
+_extractor_registry: Dict[str, AnswerExtractor] = {
+    "tag": extract_tag,
+    "regex": extract_regex,
+    "number": extract_number,
+    "boolean": extract_boolean,
+    "choice": extract_choice,
+}
+
+
+def register_answer_extractor(name: str, extractor: AnswerExtractor) -> None:
+    _extractor_registry[name.strip().lower()] = extractor
+
+
+def available_answer_extractors() -> List[str]:
+    return sorted(_extractor_registry)
+
+
+def parse_extractor_names(value: Any) -> List[str]:
+    """Accept "tag,number", ["tag", "number"] or None; validate against the registry."""
+    if value is None or value == "":
+        return []
+    names = value if isinstance(value, (list, tuple)) else str(value).split(",")
+    names = [str(name).strip().lower() for name in names if str(name).strip()]
+    if names in (["none"], ["off"]):
+        return []
+    unknown = [name for name in names if name not in _extractor_registry]
+    if unknown:
+        raise ValueError(
+            f"Unknown answer extractor(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(available_answer_extractors())}"
+        )
+    return names
+
+
+def extract_answer(text: str, extractors: Sequence[str], options: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Run extractors in order and return the first canonical answer found."""
+    options = options or {}
+    for name in extractors:
+        answer = _extractor_registry[name](text or "", options)
+        if answer:
+            return answer
+    return None
@@ -61,6 +61,69 @@ def register_commands(cli):
         help="Model to use as arbiter",
         required=True
     )
+    @click.option(
+        "--ensemble-arbiter", "arbiter_ensemble",
+        multiple=True,
+        help="Additional arbiter model run in parallel with --arbiter. Can be provided multiple times."
+    )
+    @click.option(
+        "--arbiter-quorum",
+        type=int,
+        help="Number of ensemble arbiters that must parse before the run proceeds (default: a majority)."
+    )
+    @click.option(
+        "--pre-arbiter",
+        help="Small, fast model that scores responses before the arbiter sees them."
+    )
+    @click.option(
+        "--pre-arbiter-top-k",
+        type=int,
+        help="Forward only the k best-scored responses to the arbiter."
+    )
+    @click.option(
+        "--pre-arbiter-min-score",
+        type=float,
+        help="Forward only responses the pre-arbiter scores at least this high (0.0-1.0)."
+    )
+    @click.option(
+        "--pre-arbiter-batch-size",
+        type=int,
+        default=1,
+        help="Responses scored per pre-arbiter call."
+    )
+    @click.option(
+        "--arbiter-top-k",
+        type=int,
+        help="Cap the arbiter's input at k responses, chosen for relevance and diversity (MMR)."
+    )
+    @click.option(
+        "--mmr-lambda",
+        type=float,
+        default=0.5,
+        help="Relevance/diversity trade-off for --arbiter-top-k (1.0 = relevance only, 0.0 = diversity only)."
+    )
+    @click.option(
+        "--drop-outliers/--keep-outliers",
+        default=False,
+        help="Withhold geometric outlier responses from the arbiter (needs embeddings)."
+    )
+    @click.option(
+        "--dedupe/--no-dedupe",
+        "dedupe_responses",
+        default=True,
+        help="Show the arbiter identical member responses once, with the members that gave them."
+    )
+    @click.option(
+        "--arbiter-response-tokens",
+        type=int,
+        default=None,
+        help="Compact member responses longer than this many tokens before the arbiter reads them."
+    )
+    @click.option(
+        "--compaction-model",
+        default=None,
+        help="Model that summarizes over-budget responses (default: structure-aware truncation)."
+    )
     @click.option(
         "--confidence-threshold",
         type=float,
@@ -85,9 +148,55 @@ def register_commands(cli):
     )
     @click.option(
         "--judging-method",
-        type=click.Choice(["default", "rank"], case_sensitive=False),
+        type=click.Choice(["default", "rank", "json", "hierarchical"], case_sensitive=False),
         default="default",
-        help="Judging method for the arbiter (default=synthesis, rank)."
+        help="Judging method for the arbiter (default=synthesis, rank, json=field-level consensus of JSON answers, "
+             "hierarchical=tree-reduce groups of responses through sub-arbiters)."
+    )
+    @click.option(
+        "--arbiter-group-size",
+        type=int,
+        default=5,
+        help="Responses per sub-arbiter call with --judging-method hierarchical."
+    )
+    @click.option(
+        "--json-schema",
+        help="JSON Schema (file path or inline JSON) guiding --judging-method json merging and validation."
+    )
+    @click.option(
+        "--refinement",
+        type=click.Choice(["all", "targeted"], case_sensitive=False),
+        default="all",
+        help="Iterations 2+: re-prompt all members, or only those that dissent from the synthesis (targeted)."
+    )
+    @click.option(
+        "--refinement-threshold",
+        type=float,
+        default=0.8,
+        help="Similarity to the synthesis at which a member's response is carried forward with --refinement targeted."
+    )
+    @click.option(
+        "--iteration-prompt",
+        type=click.Choice(["full", "delta"], case_sensitive=False),
+        default="full",
+        help="Iterations 2+: send members the whole previous synthesis, or only refinement areas, dissent and what their answer lacks (delta, automatic context)."
+    )
+    @click.option(
+        "--revision-max-tokens",
+        type=int,
+        default=None,
+        help="Token limit for members' revised answers in iterations 2+ (passed as max_tokens where the model supports it)."
+    )
+    @click.option(
+        "--history-tokens", "history_token_budget",
+        type=int,
+        default=None,
+        help="Summarize older conversation turns once the history sent to members exceeds this many tokens."
+    )
+    @click.option(
+        "--history-summary-model",
+        default=None,
+        help="Model that summarizes older conversation turns (default: structure-aware truncation)."
     )
     @click.option(
         "--manual-context/--auto-context",
@@ -101,18 +210,35 @@ def register_commands(cli):
     )
     @click.option(
         "--embedding-backend",
-        type=click.Choice(["openai", "sentence-transformers", "chutes"], case_sensitive=False),
+        type=click.Choice(["openai", "sentence-transformers", "chutes", "hashing"], case_sensitive=False),
         default=None,
-        help="Embedding backend (openai, sentence-transformers, chutes)."
+        help="Embedding backend (openai, sentence-transformers, chutes, hashing)."
     )
     @click.option(
         "--embedding-model",
         default=None,
         help="Specific embedding model name."
     )
+    @click.option(
+        "--embedding-option", "embedding_options_list",
+        multiple=True,
+        help="Embedding backend option, format KEY=VALUE (e.g. timeout=10, max_concurrency=8, http2=true)."
+    )
+    @click.option(
+        "--embedding-precision",
+        type=click.Choice(["float64", "float32", "float16", "int8"], case_sensitive=False),
+        default="float32",
+        help="Storage precision for cached and persisted embeddings."
+    )
+    @click.option(
+        "--embedding-dimensions",
+        type=int,
+        default=None,
+        help="Truncate embeddings to their first N dimensions (Matryoshka-style)."
+    )
     @click.option(
         "--clustering-algorithm",
-        type=click.Choice(["dbscan", "hdbscan", "tropical"], case_sensitive=False),
+        type=click.Choice(["dbscan", "agglomerative", "tropical", "hdbscan"], case_sensitive=False),
         default=None,
         help="Semantic clustering algorithm to use."
     )
@@ -133,9 +259,15 @@ def register_commands(cli):
         multiple=True,
         help="Parameters for the strategy, format KEY=VALUE. Can be provided multiple times.",
     )
-    def save_command(name, models, count, arbiter, confidence_threshold, max_iterations,
-                     min_iterations, system_prompt_content, judging_method, manual_context, strategy,
-                     embedding_backend, embedding_model, clustering_algorithm, cluster_eps, cluster_min_samples,
+    def save_command(name, models, count, arbiter, arbiter_ensemble, arbiter_quorum, pre_arbiter,
+                     pre_arbiter_top_k, pre_arbiter_min_score, pre_arbiter_batch_size, arbiter_top_k,
+                     mmr_lambda, drop_outliers, dedupe_responses, arbiter_response_tokens, compaction_model,
+                     confidence_threshold, max_iterations, min_iterations,
+                     system_prompt_content, judging_method, arbiter_group_size, json_schema, refinement,
+                     refinement_threshold, iteration_prompt, revision_max_tokens, history_token_budget,
+                     history_summary_model, manual_context, strategy,
+                     embedding_backend, embedding_model, embedding_options_list, embedding_precision,
+                     embedding_dimensions, clustering_algorithm, cluster_eps, cluster_min_samples,
                      strategy_params_list):
         """Save a consortium configuration to be used as a model."""
         
@@ -146,6 +278,14 @@ def register_commands(cli):
             strategy_params["eps"] = cluster_eps
             strategy_params["min_samples"] = cluster_min_samples
 
+        schema = None
+        if json_schema:
+            schema_path = pathlib.Path(json_schema).expanduser()
+            try:
+                schema = json.loads(schema_path.read_text() if schema_path.is_file() else json_schema)
+            except (OSError, ValueError) as e:
+                raise click.UsageError(f"Invalid --json-schema: {e}")
+
         if confidence_threshold > 1.0:
              if confidence_threshold <= 100.0:
                   confidence_threshold /= 100.0
@@ -153,19 +293,60 @@ def register_commands(cli):
                   raise click.UsageError("Confidence threshold must be between 0.0 and 1.0 (or 0 and 100).")
         elif confidence_threshold < 0.0:
              raise click.UsageError("Confidence threshold must be non-negative.")
+        if arbiter_group_size < 2:
+             raise click.UsageError("--arbiter-group-size must be at least 2.")
+        if arbiter_quorum is not None and arbiter_quorum < 1:
+             raise click.UsageError("--arbiter-quorum must be at least 1.")
+        if pre_arbiter_top_k is not None and pre_arbiter_top_k < 1:
+             raise click.UsageError("--pre-arbiter-top-k must be at least 1.")
+        if pre_arbiter_batch_size < 1:
+             raise click.UsageError("--pre-arbiter-batch-size must be at least 1.")
+        if arbiter_top_k is not None and arbiter_top_k < 1:
+             raise click.UsageError("--arbiter-top-k must be at least 1.")
+        if not 0.0 <= mmr_lambda <= 1.0:
+             raise click.UsageError("--mmr-lambda must be between 0.0 and 1.0.")
+        if arbiter_response_tokens is not None and arbiter_response_tokens < 1:
+             raise click.UsageError("--arbiter-response-tokens must be at least 1.")
+        if revision_max_tokens is not None and revision_max_tokens < 1:
+             raise click.UsageError("--revision-max-tokens must be at least 1.")
+        if history_token_budget is not None and history_token_budget < 1:
+             raise click.UsageError("--history-tokens must be at least 1.")
 
         config = ConsortiumConfig(
             models=model_dict,
             arbiter=arbiter,
+            arbiter_ensemble=list(arbiter_ensemble),
+            arbiter_quorum=arbiter_quorum,
+            pre_arbiter=pre_arbiter,
+            pre_arbiter_top_k=pre_arbiter_top_k,
+            pre_arbiter_min_score=pre_arbiter_min_score,
+            pre_arbiter_batch_size=pre_arbiter_batch_size,
+            arbiter_top_k=arbiter_top_k,
+            mmr_lambda=mmr_lambda,
+            drop_outliers=drop_outliers,
+            dedupe_responses=dedupe_responses,
+            arbiter_response_tokens=arbiter_response_tokens,
+            compaction_model=compaction_model,
             confidence_threshold=confidence_threshold,
             max_iterations=max_iterations,
             minimum_iterations=min_iterations,
             system_prompt=system_prompt_content,
             judging_method=judging_method,
+            arbiter_group_size=arbiter_group_size,
+            json_schema=schema,
+            refinement=refinement,
+            refinement_threshold=refinement_threshold,
+            iteration_prompt=iteration_prompt,
+            revision_max_tokens=revision_max_tokens,
+            history_token_budget=history_token_budget,
+            history_summary_model=history_summary_model,
             strategy=strategy,
             strategy_params=strategy_params,
             embedding_backend=embedding_backend,
             embedding_model=embedding_model,
+            embedding_options=_parse_strategy_params(embedding_options_list) or None,
+            embedding_precision=embedding_precision,
+            embedding_dimensions=embedding_dimensions,
             manual_context=manual_context
         )
         try:
@@ -204,6 +385,11 @@ def register_commands(cli):
 
         click.echo(f"  Models: {', '.join(f'{k}:{v}' for k, v in config.models.items())}")
         click.echo(f"  Arbiter: {config.arbiter}")
+        if config.arbiter_ensemble:
+            quorum = f" (quorum {config.arbiter_quorum})" if config.arbiter_quorum else ""
+            click.echo(f"  Ensemble Arbiters: {', '.join(config.arbiter_ensemble)}{quorum}")
+        if config.pre_arbiter:
+            click.echo(f"  Pre-arbiter: {config.pre_arbiter}")
         
         # Combine iterations for brevity
         if config.minimum_iterations == config.max_iterations:
@@ -224,7 +410,7 @@ def register_commands(cli):
         click.echo(f"  System Prompt: {system_prompt_display or 'Default'}")
         
         if config.embedding_backend:
-             click.echo(f"  Embedding: {config.embedding_backend} ({config.embedding_model or 'default'})")
+             click.echo(f"  Embedding: {config.embedding_backend} ({config.embedding_model or 'default'}, {config.embedding_precision})")
 
     @consortium.command(name="list")
     @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
@@ -362,7 +548,7 @@ def register_commands(cli):
         decisions = list(db.query(
             "SELECT ad.*, r.response as full_response FROM arbiter_decisions ad "
             "JOIN responses r ON ad.response_id = r.id "
-            "WHERE ad.run_id = ? ORDER BY ad.iteration", 
+            "WHERE ad.run_id = ? ORDER BY ad.iteration, ad.node", 
             [consortium_id]
         ))
 
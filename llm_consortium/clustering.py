@@ -0,0 +1,152 @@
+"""Small-N clustering on a precomputed cosine distance matrix.
+
+Consortium iterations cluster a handful to a few hundred responses, so these
+are direct NumPy implementations over :meth:`ResponseGeometry.cosine_distance_matrix`
+(``1 - cos``, the scale sklearn's ``metric='cosine'`` uses) rather than calls
+into sklearn. ``eps`` is a cosine distance for every algorithm. Labels follow
+the sklearn convention: clusters are numbered from 0 in order of discovery and
+noise is ``-1``.
+
+``hdbscan`` is used only when that optional package is installed.
+"""
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from .geometry import ResponseGeometry, TropicalConsensus
+
+ClusteringFunction = Callable[..., List[int]]
+
+
+def dbscan(geometry: ResponseGeometry, eps: float, min_samples: int, **options) -> List[int]:
+    """DBSCAN with sklearn semantics: neighbours within ``eps`` (inclusive, self included)."""
+    count = len(geometry)
+    if count == 0:
+        return []
+    neighbours = geometry.cosine_distance_matrix() <= eps
+    core = neighbours.sum(axis=1) >= min_samples
+    labels = np.full(count, -1, dtype=np.int64)
+    cluster_id = 0
+    for seed in range(count):
+        if labels[seed] != -1 or not core[seed]:
+            continue
+        labels[seed] = cluster_id
+        frontier = [seed]
+        while frontier:
+            point = frontier.pop()
+            if not core[point]:
+                continue
+            for neighbour in np.flatnonzero(neighbours[point] & (labels == -1)):
+                labels[neighbour] = cluster_id
+                frontier.append(neighbour)
+        cluster_id += 1
+    return labels.tolist()
+
+
+def agglomerative(geometry: ResponseGeometry, eps: float, min_samples: int,
+                  linkage: str = "average", **options) -> List[int]:
+    """Merge the closest clusters until no pair is within ``eps``; clusters below ``min_samples`` are noise."""
+    count = len(geometry)
+    if count == 0:
+        return []
+    if linkage not in ("single", "complete", "average"):
+        raise ValueError(f"Unsupported linkage '{linkage}'. Choose from: single, complete, average")
+
+    distance = geometry.cosine_distance_matrix().astype(np.float64)
+    np.fill_diagonal(distance, np.inf)
+    sizes = np.ones(count)
+    active = np.ones(count, dtype=bool)
+    members = {index: [index] for index in range(count)}
+
+    while active.sum() > 1:
+        masked = np.where(np.outer(active, active), distance, np.inf)
+        left, right = np.unravel_index(np.argmin(masked), masked.shape)
+        if masked[left, right] > eps:
+            break
+        left, right = min(left, right), max(left, right)
+        # Lance-Williams update for the merged cluster
+        if linkage == "single":
+            merged = np.minimum(distance[left], distance[right])
+        elif linkage == "complete":
+            merged = np.maximum(distance[left], distance[right])
+        else:
+            merged = (sizes[left] * distance[left] + sizes[right] * distance[right]) / (sizes[left] + sizes[right])
+        distance[left, :] = merged
+        distance[:, left] = merged
+        distance[left, left] = np.inf
+        sizes[left] += sizes[right]
+        active[right] = False
+        members[left].extend(members.pop(right))
+
+    labels = np.full(count, -1, dtype=np.int64)
+    cluster_id = 0
+    for root in sorted(members, key=lambda index: min(members[index])):
+        if len(members[root]) < min_samples:
+            continue
+        labels[members[root]] = cluster_id
+        cluster_id += 1
+    return labels.tolist()
+
+
+def tropical(geometry: ResponseGeometry, eps: float, min_samples: int, **options) -> List[int]:
+    """One consensus cluster around a max-plus (tropical) centroid.
+
+    Starting from the medoid, members are the responses within ``eps`` of the
+    tropical centroid of the current members; the centroid is recomputed until
+    membership is stable. Fewer than ``min_samples`` members means no consensus.
+    """
+    count = len(geometry)
+    if count == 0:
+        return []
+    members = np.array([geometry.medoid()])
+    for _ in range(count):
+        centroid = TropicalConsensus.compute_tropical_centroid([geometry.matrix[index] for index in members])
+        denominator = geometry.norms * np.linalg.norm(centroid)
+        similarity = np.divide(geometry.matrix @ centroid, denominator,
+                               out=np.zeros(count), where=denominator > 0)
+        updated = np.flatnonzero((1.0 - similarity) <= eps)
+        if np.array_equal(updated, members) or updated.size == 0:
+            break
+        members = updated
+
+    labels = np.full(count, -1, dtype=np.int64)
+    if members.size >= min_samples:
+        labels[members] = 0
+    return labels.tolist()
+
+
+def hdbscan_clusters(geometry: ResponseGeometry, eps: float, min_samples: int, **options) -> List[int]:
+    try:
+        import hdbscan
+    except ImportError:
+        raise ImportError(
+            "The 'hdbscan' clustering algorithm requires the hdbscan package.\n"
+            "Install the embeddings extras:\n"
+            "  pip install llm-consortium[embeddings]\n"
+        )
+    if len(geometry) < 2:
+        return [-1] * len(geometry)
+    clusterer = hdbscan.HDBSCAN(
+        metric="precomputed",
+        min_cluster_size=max(2, min_samples),
+        cluster_selection_epsilon=float(eps),
+    )
+    return clusterer.fit_predict(geometry.cosine_distance_matrix().astype(np.float64)).tolist()
+
+
+CLUSTERING_ALGORITHMS: Dict[str, ClusteringFunction] = {
+    "dbscan": dbscan,
+    "agglomerative": agglomerative,
+    "tropical": tropical,
+    "hdbscan": hdbscan_clusters,
+}
+
+
+def cluster(algorithm: str, geometry: ResponseGeometry, eps: float, min_samples: int, **options) -> List[int]:
+    try:
+        function = CLUSTERING_ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported clustering algorithm '{algorithm}'. Choose from: {', '.join(CLUSTERING_ALGORITHMS)}"
+        )
+    return function(geometry, eps, min_samples, **options)
@@ -0,0 +1,107 @@
+"""Structure-aware compaction of long member responses.
+
+Token counts are estimated at four characters per token, which is close
+enough for budgeting across providers without a tokenizer dependency.
+Truncation works on blocks (paragraphs, list runs and whole fenced code
+blocks): it keeps leading blocks while they fit, keeps the final block when it
+fits (answers often end with their conclusion), and marks what was omitted.
+
+:func:`novel_sentences` is the compact diff used by delta iteration prompts:
+the sentences of a synthesis that a member's own answer does not already make.
+"""
+import re
+from typing import List
+
+from .similarity import dice, shingle_hashes
+
+CHARS_PER_TOKEN = 4
+
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_LIST_MARKER = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+")
+_NON_WORD = re.compile(r"[^\w\s]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of ``text``."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_blocks(text: str) -> List[str]:
+    """Split ``text`` at blank lines, keeping fenced code blocks whole."""
+    blocks: List[str] = []
+    current: List[str] = []
+    in_fence = False
+    for line in text.splitlines():
+        if _FENCE.match(line):
+            in_fence = not in_fence
+        if not line.strip() and not in_fence:
+            if current:
+                blocks.append("\n".join(current))
+                current = []
+            continue
+        current.append(line)
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def _cut(block: str, max_chars: int) -> str:
+    """The longest prefix of ``block`` within ``max_chars`` ending at a sentence or line break."""
+    if len(block) <= max_chars:
+        return block
+    head = block[:max_chars]
+    breaks = [m.end() for m in _SENTENCE_END.finditer(head)] + [i + 1 for i, ch in enumerate(head) if ch == "\n"]
+    end = max(breaks, default=0)
+    return head[:end].rstrip() if end > max_chars // 2 else head.rstrip()
+
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    """``text`` cut to about ``budget`` tokens at block boundaries, with an omission marker."""
+    if estimate_tokens(text) <= budget:
+        return text
+    blocks = split_blocks(text)
+    max_chars = budget * CHARS_PER_TOKEN
+    marker = "[... {} tokens omitted ...]"
+    reserve = len(marker) + 8
+
+    tail = blocks[-1] if len(blocks) > 1 and len(blocks[-1]) + reserve <= max_chars // 3 else ""
+    room = max_chars - reserve - (len(tail) + 2 if tail else 0)
+    kept: List[str] = []
+    used = 0
+    for block in blocks[:-1] if tail else blocks:
+        if used + len(block) + 2 > room:
+            if not kept:
+                kept.append(_cut(block, room))
+            break
+        kept.append(block)
+        used += len(block) + 2
+
+    omitted = estimate_tokens(text) - estimate_tokens("\n\n".join(kept + ([tail] if tail else [])))
+    parts = kept + [marker.format(max(omitted, 1))] + ([tail] if tail else [])
+    return "\n\n".join(parts)
+
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences and list items of ``text``, without list markers."""
+    sentences = []
+    for line in text.splitlines():
+        line = _LIST_MARKER.sub("", line).strip()
+        sentences.extend(part.strip() for part in _SENTENCE_END.split(line) if part.strip())
+    return sentences
+
+
+def novel_sentences(text: str, reference: str, threshold: float = 0.6) -> List[str]:
+    """Sentences of ``text`` with no counterpart in ``reference``.
+
+    A sentence has a counterpart when the Dice similarity of its character
+    shingles to some sentence of ``reference`` reaches ``threshold``.
+    """
+    def shingles(sentence: str) -> frozenset:
+        return frozenset(shingle_hashes(" ".join(_NON_WORD.sub(" ", sentence.lower()).split()), 3).tolist())
+
+    known = [shingles(sentence) for sentence in split_sentences(reference)]
+    return [
+        sentence for sentence in split_sentences(text)
+        if not any(dice(shingles(sentence), other) >= threshold for other in known)
+    ]
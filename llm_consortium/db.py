@@ -1,7 +1,7 @@
 import logging
 import threading
 import sqlite_utils
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 import datetime
 import json
 import sqlite3
@@ -76,12 +76,14 @@ class DatabaseConnection:
                     refinement_areas TEXT,
                     geometric_confidence REAL,
                     centroid_vector TEXT,
-                    PRIMARY KEY (run_id, iteration),
+                    node TEXT NOT NULL DEFAULT '',
+                    PRIMARY KEY (run_id, iteration, node),
                     FOREIGN KEY (run_id) REFERENCES consortium_runs(id),
                     FOREIGN KEY (response_id) REFERENCES responses(id),
                     FOREIGN KEY (chosen_response_id) REFERENCES responses(id)
                 )
             """)
+            _migrate_arbiter_decisions(db)
             db.execute("""
                 CREATE TABLE IF NOT EXISTS consortium_configs (
                     name TEXT PRIMARY KEY,
@@ -91,6 +93,14 @@ class DatabaseConnection:
             """)
         return cls._thread_local.db
 
+def _migrate_arbiter_decisions(db: sqlite_utils.Database) -> None:
+    """Key decisions by (run_id, iteration, node) so hierarchical sub-decisions fit beside the final one."""
+    table = db["arbiter_decisions"]
+    if "node" in {column.name for column in table.columns}:
+        return
+    table.add_column("node", str, not_null_default="")
+    table.transform(pk=("run_id", "iteration", "node"))
+
 def log_response(response, model: str, consortium_run_id: Optional[str] = None):
     """Log model response to database and log file."""
     try:
@@ -209,6 +219,38 @@ def save_consortium_member(
     except Exception as e:
         logger.error(f"Error saving consortium member: {e}")
 
+def save_screening_scores(run_id: str, scores: Dict[str, float]) -> None:
+    """Store pre-arbiter screening scores on the members' ``consortium_members`` rows."""
+    try:
+        db = DatabaseConnection.get_connection()
+        member_columns = {column.name for column in db["consortium_members"].columns}
+        if "screening_score" not in member_columns:
+            db["consortium_members"].add_column("screening_score", float)
+        for response_id, score in scores.items():
+            db.execute(
+                "UPDATE consortium_members SET screening_score = ? WHERE run_id = ? AND response_id = ?",
+                [score, run_id, response_id],
+            )
+        db.conn.commit()
+    except Exception as e:
+        logger.error(f"Error saving screening scores: {e}")
+
+def save_compaction_ratios(run_id: str, ratios: Dict[str, float]) -> None:
+    """Store how far each member's response was compacted for the arbiter (compacted / original tokens)."""
+    try:
+        db = DatabaseConnection.get_connection()
+        member_columns = {column.name for column in db["consortium_members"].columns}
+        if "compaction_ratio" not in member_columns:
+            db["consortium_members"].add_column("compaction_ratio", float)
+        for response_id, ratio in ratios.items():
+            db.execute(
+                "UPDATE consortium_members SET compaction_ratio = ? WHERE run_id = ? AND response_id = ?",
+                [ratio, run_id, response_id],
+            )
+        db.conn.commit()
+    except Exception as e:
+        logger.error(f"Error saving compaction ratios: {e}")
+
 def save_arbiter_decision(
     run_id: str,
     iteration: int,
@@ -217,7 +259,9 @@ def save_arbiter_decision(
     judging_method: str,
     geometric_confidence: Optional[float] = None,
     centroid_vector: Optional[List[float]] = None,
+    node: str = "",
 ):
+    """Record an arbiter decision; ``node`` names a hierarchical sub-decision (e.g. "L1.G0"), "" the final one."""
     try:
         db = DatabaseConnection.get_connection()
         chosen_id = parsed_result.get('chosen_response_id')
@@ -233,44 +277,165 @@ def save_arbiter_decision(
             "refinement_areas": json.dumps(parsed_result.get('refinement_areas', [])),
             "geometric_confidence": geometric_confidence,
             "centroid_vector": json.dumps(centroid_vector) if centroid_vector is not None else None,
+            "node": node,
         }, ignore=True, alter=True)
         db.conn.commit()
     except Exception as e:
         logger.error(f"Error logging arbiter decision: {e}")
 
 
+def get_model_rewards(scope: str) -> Dict[str, Dict[str, Any]]:
+    """Accumulated bandit reward statistics per model for ``scope``."""
+    try:
+        db = DatabaseConnection.get_connection()
+        if "model_rewards" not in db.table_names():
+            return {}
+        return {
+            row["model"]: dict(row)
+            for row in db.query("SELECT * FROM model_rewards WHERE scope = ?", [scope])
+        }
+    except Exception as e:
+        logger.error(f"Error loading model rewards: {e}")
+        return {}
+
+
+def save_model_reward(scope: str, model: str, stats: Dict[str, Any]) -> None:
+    """Persist the reward statistics for one model, replacing the previous row."""
+    try:
+        db = DatabaseConnection.get_connection()
+        db["model_rewards"].insert({
+            "scope": scope,
+            "model": model,
+            "pulls": int(stats.get("pulls", 0)),
+            "reward_sum": float(stats.get("reward_sum", 0.0)),
+            "latency_sum": float(stats.get("latency_sum", 0.0)),
+            "updated_at": datetime.datetime.utcnow().isoformat(),
+        }, pk=("scope", "model"), replace=True, alter=True)
+        db.conn.commit()
+    except Exception as e:
+        logger.error(f"Error saving model reward: {e}")
+
+
+def get_conversation_summary(conversation_id: str) -> Optional[Dict[str, Any]]:
+    """The stored summary of a conversation's earlier exchanges, if any."""
+    try:
+        db = DatabaseConnection.get_connection()
+        if "conversation_summaries" not in db.table_names():
+            return None
+        rows = list(db.query("SELECT * FROM conversation_summaries WHERE conversation_id = ?", [conversation_id]))
+        return dict(rows[0]) if rows else None
+    except Exception as e:
+        logger.error(f"Error loading conversation summary: {e}")
+        return None
+
+
+def save_conversation_summary(conversation_id: str, summary: str, summarized_turns: int) -> None:
+    """Persist the summary of a conversation's first ``summarized_turns`` exchanges, replacing the previous one."""
+    try:
+        db = DatabaseConnection.get_connection()
+        db["conversation_summaries"].insert({
+            "conversation_id": conversation_id,
+            "summary": summary,
+            "summarized_turns": int(summarized_turns),
+            "updated_at": datetime.datetime.utcnow().isoformat(),
+        }, pk="conversation_id", replace=True, alter=True)
+        db.conn.commit()
+    except Exception as e:
+        logger.error(f"Error saving conversation summary: {e}")
+
+
+def save_tier_usage(run_id: str, usage: Dict[str, Any]) -> None:
+    """Record the calls, latency and spend of one cascade tier in one iteration."""
+    try:
+        db = DatabaseConnection.get_connection()
+        db["cascade_tiers"].insert({
+            "run_id": run_id,
+            "iteration": usage.get("iteration"),
+            "tier": usage.get("tier"),
+            "models": json.dumps(usage.get("models", [])),
+            "calls": usage.get("calls", 0),
+            "errors": usage.get("errors", 0),
+            "latency_total": usage.get("latency_total", 0.0),
+            "latency_max": usage.get("latency_max", 0.0),
+            "input_tokens": usage.get("input_tokens", 0),
+            "output_tokens": usage.get("output_tokens", 0),
+            "spend": usage.get("spend", 0.0),
+            "confidence": usage.get("confidence"),
+            "agreement": usage.get("agreement"),
+            "escalated": 1 if usage.get("escalated") else 0,
+        }, pk=("run_id", "iteration"), replace=True, alter=True)
+        db.conn.commit()
+    except Exception as e:
+        logger.error(f"Error saving cascade tier usage: {e}")
+
+
 def save_response_embedding(
     response_id: str,
     run_id: str,
-    vector: List[float],
+    vector: Union[List[float], np.ndarray],
     model: str,
     embedding_model: Optional[str] = None,
 ) -> None:
+    """Persist a response embedding.
+
+    NumPy arrays are stored as a raw little-endian blob in their own dtype
+    (e.g. 4 bytes per dimension for float32); plain lists are stored as JSON.
+    """
     try:
         db = DatabaseConnection.get_connection()
-        db["response_embeddings"].insert({
+        record = {
             "response_id": response_id,
             "run_id": run_id,
             "model": model,
-            "embedding_json": json.dumps(vector),
+            "embedding_json": None,
+            "embedding_blob": None,
+            "embedding_dtype": None,
             "embedding_model": embedding_model,
             "created_at": datetime.datetime.utcnow().isoformat(),
-        }, pk="response_id", replace=True, alter=True)
+        }
+        if isinstance(vector, np.ndarray):
+            array = np.ascontiguousarray(vector.reshape(-1))
+            array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+            record["embedding_blob"] = array.tobytes()
+            record["embedding_dtype"] = array.dtype.str
+        else:
+            record["embedding_json"] = json.dumps(vector)
+        db["response_embeddings"].insert(record, pk="response_id", replace=True, alter=True)
         db.conn.commit()
     except Exception as e:
         logger.error(f"Error saving response embedding: {e}")
 
 
+def decode_embedding(record: Dict[str, Any]) -> Optional[np.ndarray]:
+    """Decode a response_embeddings row stored either as a blob or as JSON."""
+    blob = record.get("embedding_blob")
+    if blob is not None:
+        return np.frombuffer(blob, dtype=np.dtype(record["embedding_dtype"])).astype(float)
+    if record.get("embedding_json"):
+        return np.array(json.loads(record["embedding_json"]), dtype=float)
+    return None
+
+
+def _embedding_payload_columns(db: sqlite_utils.Database, alias: str = "") -> str:
+    existing = {column.name for column in db["response_embeddings"].columns}
+    prefix = f"{alias}." if alias else ""
+    return ", ".join(
+        f"{prefix}{column}" if column in existing else f"NULL AS {column}"
+        for column in ("embedding_json", "embedding_blob", "embedding_dtype")
+    )
+
+
 def get_embeddings_for_run(run_id: str) -> List[np.ndarray]:
     db = DatabaseConnection.get_connection()
     if "response_embeddings" not in db.table_names():
         return []
 
     rows = list(db.query(
-        "SELECT embedding_json FROM response_embeddings WHERE run_id = ? ORDER BY created_at, response_id",
+        f"SELECT {_embedding_payload_columns(db)} FROM response_embeddings "
+        "WHERE run_id = ? ORDER BY created_at, response_id",
         [run_id],
     ))
-    return [np.array(json.loads(row["embedding_json"]), dtype=float) for row in rows]
+    return [vector for vector in (decode_embedding(row) for row in rows) if vector is not None]
 
 
 def get_embedding_records_for_run(run_id: str) -> List[Dict[str, Any]]:
@@ -281,11 +446,12 @@ def get_embedding_records_for_run(run_id: str) -> List[Dict[str, Any]]:
     return [
         dict(row)
         for row in db.query(
-            "SELECT re.response_id, re.run_id, re.model, re.embedding_json, re.embedding_model, re.created_at, "
+            f"SELECT re.response_id, re.run_id, re.model, {_embedding_payload_columns(db, 're')}, "
+            "re.embedding_model, re.created_at, "
             "cm.iteration, cm.member_index, ad.geometric_confidence "
             "FROM response_embeddings re "
             "LEFT JOIN consortium_members cm ON cm.response_id = re.response_id AND cm.run_id = re.run_id "
-            "LEFT JOIN arbiter_decisions ad ON ad.run_id = re.run_id AND ad.iteration = cm.iteration "
+            "LEFT JOIN arbiter_decisions ad ON ad.run_id = re.run_id AND ad.iteration = cm.iteration AND ad.node = '' "
             "WHERE re.run_id = ? ORDER BY cm.iteration, cm.member_index, re.response_id",
             [run_id],
         )
@@ -1,16 +1,35 @@
 from .backends import (
     BaseEmbeddingBackend,
     ChutesBackend,
+    HashingBackend,
     OpenAIBackend,
+    PooledHTTPBackend,
     SentenceTransformerBackend,
 )
+from .precision import PRECISIONS, PrecisionPolicy
+from .registry import (
+    BackendLease,
+    EmbeddingBackendRegistry,
+    acquire_backend,
+    default_registry,
+    preload_backends,
+)
 from .service import EmbeddingService, create_embedding_service
 
 __all__ = [
+    "BackendLease",
     "BaseEmbeddingBackend",
     "ChutesBackend",
+    "EmbeddingBackendRegistry",
     "EmbeddingService",
+    "HashingBackend",
     "OpenAIBackend",
+    "PRECISIONS",
+    "PooledHTTPBackend",
+    "PrecisionPolicy",
     "SentenceTransformerBackend",
+    "acquire_backend",
     "create_embedding_service",
+    "default_registry",
+    "preload_backends",
 ]
\ No newline at end of file
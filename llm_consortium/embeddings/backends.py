@@ -1,11 +1,26 @@
 import abc
+import asyncio
+import concurrent.futures
+import logging
 import os
-from typing import Optional, Protocol
+import re
+import threading
+import time
+import zlib
+from typing import Any, Callable, List, Optional, Protocol, Sequence, Tuple, Union
 
 import httpx
 import numpy as np
 import openai
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+DEFAULT_MAX_CONCURRENCY = 4
+_RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
 
 class EmbeddingBackend(Protocol):
     def embed(self, text: str) -> np.ndarray:
@@ -24,23 +39,183 @@ class BaseEmbeddingBackend(abc.ABC):
     def dimension(self) -> int:
         raise NotImplementedError
 
+    def embed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        return [self.embed(text) for text in texts]
+
+    async def aembed(self, text: str) -> np.ndarray:
+        return await asyncio.to_thread(self.embed, text)
+
+    async def aembed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        return list(await asyncio.gather(*(self.aembed(text) for text in texts)))
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        self.close()
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+def _with_retries(call: Callable[[], Any], max_retries: int, backoff: float) -> Any:
+    attempt = 0
+    while True:
+        try:
+            return call()
+        except Exception as exc:
+            if attempt >= max_retries or not _is_retryable(exc):
+                raise
+            delay = backoff * (2 ** attempt)
+            logger.warning("Embedding request failed (%s); retrying in %.2fs", exc, delay)
+            time.sleep(delay)
+            attempt += 1
+
+
+async def _awith_retries(call: Callable[[], Any], max_retries: int, backoff: float) -> Any:
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except Exception as exc:
+            if attempt >= max_retries or not _is_retryable(exc):
+                raise
+            delay = backoff * (2 ** attempt)
+            logger.warning("Embedding request failed (%s); retrying in %.2fs", exc, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+class PooledHTTPBackend(BaseEmbeddingBackend):
+    """Shared connection pool, timeout, retry and concurrency handling for remote backends.
+
+    One sync and one async ``httpx`` client are created lazily and reused for every
+    request. The async client is bound to the event loop that first uses it, so async
+    callers should ``await backend.aclose()`` before that loop ends.
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        http2: bool = False,
+    ):
+        self.timeout = float(timeout)
+        self.max_retries = int(max_retries)
+        self.backoff = float(backoff)
+        self.max_concurrency = int(max_concurrency)
+        self.http2 = str(http2).lower() == "true" if isinstance(http2, str) else bool(http2)
+
+        if self.timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
 
-class OpenAIBackend(BaseEmbeddingBackend):
-    def __init__(self, model: str = "text-embedding-3-small"):
+        self._client_lock = threading.Lock()
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
+
+    def _build_http_client(self) -> httpx.Client:
+        try:
+            return httpx.Client(limits=self._limits(), timeout=self.timeout, http2=self.http2)
+        except ImportError as exc:
+            raise ImportError("http2=True requires the h2 package: pip install 'httpx[http2]'") from exc
+
+    def _build_async_http_client(self) -> httpx.AsyncClient:
+        try:
+            return httpx.AsyncClient(limits=self._limits(), timeout=self.timeout, http2=self.http2)
+        except ImportError as exc:
+            raise ImportError("http2=True requires the h2 package: pip install 'httpx[http2]'") from exc
+
+    def embed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        if len(texts) <= 1 or self.max_concurrency == 1:
+            return [self.embed(text) for text in texts]
+        workers = min(len(texts), self.max_concurrency)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.embed, texts))
+
+    async def aembed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(text: str) -> np.ndarray:
+            async with semaphore:
+                return await self.aembed(text)
+
+        return list(await asyncio.gather(*(bounded(text) for text in texts)))
+
+
+class OpenAIBackend(PooledHTTPBackend):
+    def __init__(
+        self,
+        model: str = "text-embedding-3-small",
+        client: Optional[Any] = None,
+        async_client: Optional[Any] = None,
+        **pool_options: Any,
+    ):
+        super().__init__(**pool_options)
         self.model = model
         self._dimension = 1536
+        self._client = client
+        self._async_client = async_client
+
+    def _get_client(self):
+        with self._client_lock:
+            if self._client is None:
+                self._client = openai.OpenAI(
+                    timeout=self.timeout,
+                    max_retries=self.max_retries,
+                    http_client=self._build_http_client(),
+                )
+            return self._client
+
+    def _get_async_client(self):
+        with self._client_lock:
+            if self._async_client is None:
+                self._async_client = openai.AsyncOpenAI(
+                    timeout=self.timeout,
+                    max_retries=self.max_retries,
+                    http_client=self._build_async_http_client(),
+                )
+            return self._async_client
+
+    def _to_vector(self, response) -> np.ndarray:
+        vector = np.array(response.data[0].embedding, dtype=float)
+        self._dimension = int(vector.shape[0])
+        return vector
 
     def embed(self, text: str) -> np.ndarray:
-        if hasattr(openai, "embeddings") and hasattr(openai.embeddings, "create"):
-            response = openai.embeddings.create(input=text, model=self.model)
-        else:
-            client = openai.OpenAI()
-            response = client.embeddings.create(input=text, model=self.model)
-        return np.array(response.data[0].embedding, dtype=float)
+        response = self._get_client().embeddings.create(input=text, model=self.model)
+        return self._to_vector(response)
+
+    async def aembed(self, text: str) -> np.ndarray:
+        response = await self._get_async_client().embeddings.create(input=text, model=self.model)
+        return self._to_vector(response)
 
     def dimension(self) -> int:
         return self._dimension
 
+    def close(self) -> None:
+        if self._client is not None and hasattr(self._client, "close"):
+            self._client.close()
+        self._client = None
+
+    async def aclose(self) -> None:
+        if self._async_client is not None and hasattr(self._async_client, "close"):
+            await self._async_client.close()
+        self._async_client = None
+        self.close()
+
 
 class SentenceTransformerBackend(BaseEmbeddingBackend):
     def __init__(self, model: str = "all-MiniLM-L6-v2"):
@@ -57,37 +232,216 @@ class SentenceTransformerBackend(BaseEmbeddingBackend):
         return self._dimension
 
 
-class ChutesBackend(BaseEmbeddingBackend):
+def _parse_ngram_range(value: Union[str, Sequence[int], None]) -> Optional[Tuple[int, int]]:
+    if value is None or value == "" or str(value).lower() in ("none", "off", "0"):
+        return None
+    if isinstance(value, str):
+        parts = [part for part in re.split(r"[-,:]", value) if part.strip()]
+    else:
+        parts = list(value)
+    low, high = int(parts[0]), int(parts[-1])
+    if low < 1 or high < low:
+        raise ValueError(f"Invalid n-gram range: {value}")
+    return low, high
+
+
+def _mix64(hashes: np.ndarray) -> np.ndarray:
+    """Finalize uint64 hashes (murmur3 fmix64) so low bits are well distributed."""
+    hashes = hashes ^ (hashes >> np.uint64(33))
+    hashes = hashes * np.uint64(0xFF51AFD7ED558CCD)
+    hashes = hashes ^ (hashes >> np.uint64(33))
+    hashes = hashes * np.uint64(0xC4CEB9FE1A85EC53)
+    return hashes ^ (hashes >> np.uint64(33))
+
+
+def _ngram_hashes(codes: np.ndarray, n: int, salt: int) -> np.ndarray:
+    if codes.shape[0] < n:
+        return np.empty(0, dtype=np.uint64)
+    windows = np.lib.stride_tricks.sliding_window_view(codes, n)
+    powers = np.uint64(1000003) ** np.arange(n - 1, -1, -1, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        hashes = (windows * powers).sum(axis=1, dtype=np.uint64) + np.uint64(salt)
+        return _mix64(hashes)
+
+
+class HashingBackend(BaseEmbeddingBackend):
+    """Offline embeddings from signed feature hashing of character and word n-grams.
+
+    Needs no model download or network access. Signed hashed counts are
+    dampened to ``sign(c) * log(1 + |c|)``. With ``use_idf`` they are also
+    weighted by a smoothed inverse document frequency computed over the batch
+    being embedded, so boilerplate shared by all responses counts for less;
+    those vectors are only comparable within their batch, so leave it off when
+    vectors are cached or compared across calls. ``projection_dim`` applies a
+    seeded Gaussian random projection to the hashed features. Output vectors
+    are L2-normalised.
+    """
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        n_features: int = 2048,
+        char_ngrams: Union[str, Sequence[int], None] = (3, 5),
+        word_ngrams: Union[str, Sequence[int], None] = (1, 2),
+        use_idf: Union[bool, str] = False,
+        projection_dim: Optional[int] = None,
+        seed: int = 0,
+    ):
+        self.model = model or "hashing"
+        self.n_features = int(n_features)
+        self.char_ngrams = _parse_ngram_range(char_ngrams)
+        self.word_ngrams = _parse_ngram_range(word_ngrams)
+        self.use_idf = str(use_idf).lower() == "true" if isinstance(use_idf, str) else bool(use_idf)
+        self.projection_dim = int(projection_dim) if projection_dim not in (None, "", "none") else None
+        self.seed = int(seed)
+
+        if self.n_features < 2:
+            raise ValueError("n_features must be at least 2")
+        if self.char_ngrams is None and self.word_ngrams is None:
+            raise ValueError("At least one of char_ngrams or word_ngrams must be enabled")
+        if self.projection_dim is not None and self.projection_dim < 1:
+            raise ValueError("projection_dim must be positive")
+
+        self._lock = threading.Lock()
+        self._projection: Optional[np.ndarray] = None
+
+    def _features(self, text: str) -> np.ndarray:
+        normalized = " " + " ".join(text.lower().split()) + " "
+        hashes = []
+        if self.char_ngrams:
+            codes = np.frombuffer(normalized.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+            for n in range(self.char_ngrams[0], self.char_ngrams[1] + 1):
+                hashes.append(_ngram_hashes(codes, n, salt=n))
+        if self.word_ngrams:
+            tokens = re.findall(r"\w+", normalized)
+            codes = np.fromiter((zlib.crc32(token.encode("utf-8")) for token in tokens), dtype=np.uint64, count=len(tokens))
+            for n in range(self.word_ngrams[0], self.word_ngrams[1] + 1):
+                hashes.append(_ngram_hashes(codes, n, salt=0x9E3779B97F4A7C15 + n))
+        return np.concatenate(hashes) if hashes else np.empty(0, dtype=np.uint64)
+
+    def _term_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """Signed, sublinear term-frequency matrix of shape (len(texts), n_features)."""
+        features = [self._features(text) for text in texts]
+        lengths = np.array([f.shape[0] for f in features], dtype=np.int64)
+        all_hashes = np.concatenate(features) if features else np.empty(0, dtype=np.uint64)
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        columns = (all_hashes % np.uint64(self.n_features)).astype(np.int64)
+        signs = np.where((all_hashes >> np.uint64(63)) == 0, 1.0, -1.0)
+        flat = np.bincount(rows * self.n_features + columns, weights=signs, minlength=len(texts) * self.n_features)
+        counts = flat.reshape(len(texts), self.n_features)
+        return np.sign(counts) * np.log1p(np.abs(counts))
+
+    def _get_projection(self) -> np.ndarray:
+        if self._projection is None:
+            rng = np.random.default_rng(self.seed)
+            self._projection = rng.standard_normal((self.n_features, self.projection_dim)) / np.sqrt(self.projection_dim)
+        return self._projection
+
+    def embed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        if not texts:
+            return []
+        matrix = self._term_matrix(texts)
+        if self.use_idf:
+            document_frequency = (matrix != 0).sum(axis=0)
+            matrix = matrix * (np.log((1.0 + len(texts)) / (1.0 + document_frequency)) + 1.0)
+        if self.projection_dim is not None:
+            with self._lock:
+                projection = self._get_projection()
+            matrix = matrix @ projection
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+        return list(matrix)
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_batch([text])[0]
+
+    def dimension(self) -> int:
+        return self.projection_dim or self.n_features
+
+
+class ChutesBackend(PooledHTTPBackend):
     def __init__(
         self,
         client: Optional[httpx.Client] = None,
         endpoint: str = "https://chutes-qwen-qwen3-embedding-8b.chutes.ai/v1/embeddings",
         model: Optional[str] = None,
         default_dimension: int = 1024,
+        api_token: Optional[str] = None,
+        async_client: Optional[httpx.AsyncClient] = None,
+        **pool_options: Any,
     ):
-        self.client = client or httpx.Client()
+        super().__init__(**pool_options)
+        self.client = client
+        self.async_client = async_client
         self.endpoint = endpoint
         self.model = model
-        self._dimension = default_dimension
+        self.api_token = api_token or os.environ.get("CHUTES_API_TOKEN")
+        self._dimension = int(default_dimension)
 
-    def embed(self, text: str) -> np.ndarray:
-        token = os.environ.get("CHUTES_API_TOKEN")
-        if not token:
+    def _get_client(self) -> httpx.Client:
+        with self._client_lock:
+            if self.client is None:
+                self.client = self._build_http_client()
+            return self.client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        with self._client_lock:
+            if self.async_client is None:
+                self.async_client = self._build_async_http_client()
+            return self.async_client
+
+    def _headers(self) -> dict:
+        if not self.api_token:
             raise RuntimeError("CHUTES_API_TOKEN is required for the chutes embedding backend")
+        return {
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json",
+        }
 
-        response = self.client.post(
-            self.endpoint,
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            },
-            json={"input": text, "model": self.model},
-            timeout=30,
-        )
+    def _to_vector(self, response) -> np.ndarray:
         response.raise_for_status()
         vector = np.array(response.json()["data"][0]["embedding"], dtype=float)
         self._dimension = int(vector.shape[0])
         return vector
 
+    def embed(self, text: str) -> np.ndarray:
+        headers = self._headers()
+        client = self._get_client()
+
+        def post():
+            return self._to_vector(client.post(
+                self.endpoint,
+                headers=headers,
+                json={"input": text, "model": self.model},
+                timeout=self.timeout,
+            ))
+
+        return _with_retries(post, self.max_retries, self.backoff)
+
+    async def aembed(self, text: str) -> np.ndarray:
+        headers = self._headers()
+        client = self._get_async_client()
+
+        async def post():
+            return self._to_vector(await client.post(
+                self.endpoint,
+                headers=headers,
+                json={"input": text, "model": self.model},
+                timeout=self.timeout,
+            ))
+
+        return await _awith_retries(post, self.max_retries, self.backoff)
+
     def dimension(self) -> int:
-        return self._dimension
\ No newline at end of file
+        return self._dimension
+
+    def close(self) -> None:
+        if self.client is not None and hasattr(self.client, "close"):
+            self.client.close()
+        self.client = None
+
+    async def aclose(self) -> None:
+        if self.async_client is not None:
+            await self.async_client.aclose()
+        self.async_client = None
+        self.close()
@@ -0,0 +1,69 @@
+"""Storage precision policy for embedding vectors.
+
+Vectors are kept in a compact storage form (float64, float32, float16 or int8
+codes with a per-vector scale) and optionally truncated to their first N
+dimensions, which is how Matryoshka-trained models expect to be shortened.
+Decoded vectors are read-only so cached arrays can be handed out without
+defensive copies.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+PRECISIONS = ("float64", "float32", "float16", "int8")
+
+StoredVector = Tuple[np.ndarray, Optional[float]]
+
+
+def _read_only(vector: np.ndarray) -> np.ndarray:
+    vector.flags.writeable = False
+    return vector
+
+
+class PrecisionPolicy:
+    def __init__(self, precision: str = "float32", dimensions: Optional[int] = None):
+        precision = (precision or "float32").strip().lower()
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unsupported embedding precision '{precision}'. Choose from: {', '.join(PRECISIONS)}")
+        if dimensions is not None and int(dimensions) < 1:
+            raise ValueError("embedding dimensions must be positive")
+        self.precision = precision
+        self.dimensions = int(dimensions) if dimensions is not None else None
+
+    @property
+    def compute_dtype(self) -> np.dtype:
+        """dtype of decoded vectors handed to geometry and clustering code."""
+        return np.dtype(np.float64 if self.precision == "float64" else np.float32)
+
+    def truncate(self, vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector).reshape(-1)
+        if self.dimensions is not None and vector.shape[0] > self.dimensions:
+            vector = vector[:self.dimensions]
+        return vector
+
+    def encode(self, vector: np.ndarray) -> StoredVector:
+        """Convert a backend vector to its compact, read-only storage form."""
+        vector = self.truncate(vector)
+        if self.precision != "int8":
+            return _read_only(np.array(vector, dtype=self.precision)), None
+
+        vector = np.asarray(vector, dtype=np.float32)
+        peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+        scale = peak / 127.0 if peak > 0 else 1.0
+        codes = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+        return _read_only(codes), scale
+
+    def decode(self, stored: StoredVector) -> np.ndarray:
+        """Return a read-only vector in ``compute_dtype``; no copy for float32/float64 storage."""
+        payload, scale = stored
+        if payload.dtype == self.compute_dtype:
+            return payload
+        vector = payload.astype(self.compute_dtype)
+        if scale is not None:
+            vector *= scale
+        return _read_only(vector)
+
+    @staticmethod
+    def nbytes(stored: StoredVector) -> int:
+        payload, scale = stored
+        return int(payload.nbytes) + (4 if scale is not None else 0)
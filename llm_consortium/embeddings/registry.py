@@ -0,0 +1,188 @@
+"""Process-wide registry of loaded embedding backends.
+
+Backends are keyed by ``(backend, model, options)`` and shared by every
+orchestrator that asks for the same key, so a sentence-transformers model is
+loaded from disk once per process instead of once per orchestrator. Callers
+hold a :class:`BackendLease`; the backend is built lazily on first use and
+closed and dropped when the last lease for its key is released.
+"""
+import json
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .backends import (
+    BaseEmbeddingBackend,
+    ChutesBackend,
+    HashingBackend,
+    OpenAIBackend,
+    SentenceTransformerBackend,
+)
+
+logger = logging.getLogger(__name__)
+
+BackendKey = Tuple[str, Optional[str], str]
+
+SUPPORTED_BACKENDS = ("openai", "sentence-transformers", "chutes", "hashing")
+
+
+def build_backend(backend_name: Optional[str], model_name: Optional[str] = None,
+                  options: Optional[Dict[str, Any]] = None) -> BaseEmbeddingBackend:
+    options = dict(options or {})
+    if backend_name == "openai":
+        return OpenAIBackend(model=model_name or "text-embedding-3-small", **options)
+    if backend_name == "sentence-transformers":
+        return SentenceTransformerBackend(model=model_name or "all-MiniLM-L6-v2")
+    if backend_name == "chutes":
+        return ChutesBackend(model=model_name, **options)
+    if backend_name == "hashing":
+        return HashingBackend(model=model_name, **options)
+    raise ValueError(f"No valid embedding_backend configured. Found: {backend_name}")
+
+
+def backend_key(backend_name: str, model_name: Optional[str] = None,
+                options: Optional[Dict[str, Any]] = None) -> BackendKey:
+    return backend_name, model_name, json.dumps(options or {}, sort_keys=True, default=str)
+
+
+class _Entry:
+    def __init__(self, options: Dict[str, Any]):
+        self.options = options
+        self.refcount = 0
+        self.backend: Optional[BaseEmbeddingBackend] = None
+        self.load_lock = threading.Lock()
+
+
+class BackendLease:
+    """A counted reference to a shared backend. Release it exactly once."""
+
+    def __init__(self, registry: "EmbeddingBackendRegistry", key: BackendKey):
+        self._registry = registry
+        self.key = key
+        self._released = False
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> BaseEmbeddingBackend:
+        if self._released:
+            raise RuntimeError(f"Embedding backend lease {self.key[:2]} was already released")
+        return self._registry._load(self.key)
+
+    def preload(self, background: bool = False) -> None:
+        """Load the backend now, optionally on a daemon thread."""
+        if not background:
+            self.backend
+            return
+
+        def load():
+            try:
+                self.backend
+            except Exception as e:
+                logger.error(f"Failed to preload embedding backend {self.key[:2]}: {e}")
+
+        threading.Thread(target=load, name=f"embedding-preload-{self.key[0]}", daemon=True).start()
+
+    def release(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._registry._release(self.key)
+
+
+class EmbeddingBackendRegistry:
+    def __init__(self):
+        self._entries: Dict[BackendKey, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, backend_name: Optional[str], model_name: Optional[str] = None,
+                options: Optional[Dict[str, Any]] = None) -> BackendLease:
+        if backend_name not in SUPPORTED_BACKENDS:
+            raise ValueError(f"No valid embedding_backend configured. Found: {backend_name}")
+        key = backend_key(backend_name, model_name, options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(dict(options or {}))
+            entry.refcount += 1
+        return BackendLease(self, key)
+
+    def _load(self, key: BackendKey) -> BaseEmbeddingBackend:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            raise RuntimeError(f"Embedding backend {key[:2]} is not registered")
+        with entry.load_lock:
+            if entry.backend is None:
+                logger.info(f"Loading shared embedding backend {key[0]} ({key[1] or 'default'})")
+                entry.backend = build_backend(key[0], key[1], entry.options)
+            return entry.backend
+
+    def _release(self, key: BackendKey) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return
+            del self._entries[key]
+        if entry.backend is not None:
+            logger.info(f"Releasing shared embedding backend {key[0]} ({key[1] or 'default'})")
+            try:
+                entry.backend.close()
+            except Exception as e:
+                logger.warning(f"Error closing embedding backend {key[:2]}: {e}")
+            entry.backend = None
+
+    def refcount(self, key: BackendKey) -> int:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.refcount if entry else 0
+
+    def is_loaded(self, key: BackendKey) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.backend is not None
+
+    def keys(self) -> List[BackendKey]:
+        with self._lock:
+            return list(self._entries)
+
+
+default_registry = EmbeddingBackendRegistry()
+
+
+def acquire_backend(config, registry: Optional[EmbeddingBackendRegistry] = None) -> BackendLease:
+    """Acquire a lease for the backend described by a ConsortiumConfig-like object."""
+    registry = registry or default_registry
+    return registry.acquire(
+        getattr(config, "embedding_backend", None),
+        getattr(config, "embedding_model", None),
+        getattr(config, "embedding_options", None),
+    )
+
+
+def lease_for(owner: Any, config, registry: Optional[EmbeddingBackendRegistry] = None) -> BackendLease:
+    """Acquire a lease that is released automatically when ``owner`` is garbage collected."""
+    lease = acquire_backend(config, registry)
+    weakref.finalize(owner, lease.release)
+    return lease
+
+
+def preload_backends(configs: Iterable[Any], background: bool = True,
+                     registry: Optional[EmbeddingBackendRegistry] = None) -> List[BackendLease]:
+    """Warm up the backends used by ``configs``; the returned leases pin them until released."""
+    leases = []
+    for config in configs:
+        if not getattr(config, "embedding_backend", None):
+            continue
+        try:
+            lease = acquire_backend(config, registry)
+        except ValueError as e:
+            logger.error(f"Skipping embedding preload: {e}")
+            continue
+        lease.preload(background=background)
+        leases.append(lease)
+    return leases
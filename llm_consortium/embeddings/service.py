@@ -1,66 +1,147 @@
 import hashlib
 import logging
 import threading
+import weakref
 from collections import OrderedDict
-from typing import Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 
-from .backends import BaseEmbeddingBackend, ChutesBackend, OpenAIBackend, SentenceTransformerBackend
+from .backends import BaseEmbeddingBackend
+from .precision import PrecisionPolicy, StoredVector
+from .registry import BackendLease, EmbeddingBackendRegistry, acquire_backend
 
 logger = logging.getLogger(__name__)
 
 
 class EmbeddingService:
-    def __init__(self, backend: BaseEmbeddingBackend, cache_enabled: bool = True, cache_size: int = 256):
+    def __init__(self, backend: BaseEmbeddingBackend, cache_enabled: bool = True, cache_size: int = 256,
+                 lease: Optional[BackendLease] = None, precision: str = "float32",
+                 dimensions: Optional[int] = None):
         self.backend = backend
         self.cache_enabled = cache_enabled
         self.cache_size = cache_size
-        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self.policy = PrecisionPolicy(precision, dimensions)
+        self._cache: OrderedDict[str, StoredVector] = OrderedDict()
         self._lock = threading.Lock()
+        self._lease = lease
+        if lease is not None:
+            # Shared backends are released when the last service using them goes away
+            weakref.finalize(self, lease.release)
+
+    def close(self) -> None:
+        """Release this service's reference to a shared backend."""
+        if self._lease is not None:
+            self._lease.release()
+            self._lease = None
 
     def _cache_key(self, text: str) -> str:
         return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
-    def embed(self, text: str) -> np.ndarray:
-        cache_key = self._cache_key(text)
-        if self.cache_enabled:
-            with self._lock:
-                cached = self._cache.get(cache_key)
-                if cached is not None:
-                    self._cache.move_to_end(cache_key)
-                    return cached.copy()
+    def cache_nbytes(self) -> int:
+        with self._lock:
+            return sum(PrecisionPolicy.nbytes(stored) for stored in self._cache.values())
 
-        try:
-            vector = self.backend.embed(text)
-        except Exception as exc:
-            logger.error("Embedding backend failed for text hash %s: %s", cache_key, exc)
-            raise RuntimeError(f"Embedding backend {self.backend.__class__.__name__} failed") from exc
+    def _cache_get(self, cache_key: str) -> Optional[np.ndarray]:
+        if not self.cache_enabled:
+            return None
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+        # Stored arrays are read-only, so hits need no defensive copy
+        return self.policy.decode(cached) if cached is not None else None
 
+    def _store(self, cache_key: str, vector: np.ndarray) -> np.ndarray:
+        stored = self.policy.encode(vector)
         if self.cache_enabled:
             with self._lock:
-                self._cache[cache_key] = vector.copy()
+                self._cache[cache_key] = stored
                 self._cache.move_to_end(cache_key)
                 while len(self._cache) > self.cache_size:
                     self._cache.popitem(last=False)
-        return vector
+        return self.policy.decode(stored)
+
+    def _backend_error(self, cache_keys: Sequence[str], exc: Exception) -> RuntimeError:
+        logger.error("Embedding backend failed for text hash %s: %s", ", ".join(cache_keys), exc)
+        return RuntimeError(f"Embedding backend {self.backend.__class__.__name__} failed")
+
+    def _pending(self, texts: Sequence[str]):
+        """Split texts into cached results and unique cache misses."""
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = OrderedDict()
+        missing_texts: Dict[str, str] = {}
+        for index, text in enumerate(texts):
+            cache_key = self._cache_key(text)
+            if cache_key in missing:
+                missing[cache_key].append(index)
+                continue
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                missing[cache_key] = [index]
+                missing_texts[cache_key] = text
+        return results, missing, missing_texts
+
+    def _fill(self, results, missing, vectors) -> List[np.ndarray]:
+        for (cache_key, indices), vector in zip(missing.items(), vectors):
+            vector = self._store(cache_key, vector)
+            for index in indices:
+                results[index] = vector
+        return results
+
+    def embed(self, text: str) -> np.ndarray:
+        cache_key = self._cache_key(text)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            vector = self.backend.embed(text)
+        except Exception as exc:
+            raise self._backend_error([cache_key], exc) from exc
+
+        return self._store(cache_key, vector)
 
     def embed_batch(self, texts: Sequence[str]) -> list[np.ndarray]:
-        return [self.embed(text) for text in texts]
+        results, missing, missing_texts = self._pending(texts)
+        if not missing:
+            return results
+        try:
+            vectors = self.backend.embed_batch([missing_texts[key] for key in missing])
+        except Exception as exc:
+            raise self._backend_error(list(missing), exc) from exc
+        return self._fill(results, missing, vectors)
 
+    async def aembed(self, text: str) -> np.ndarray:
+        return (await self.aembed_batch([text]))[0]
 
-def create_embedding_service(config) -> EmbeddingService:
-    backend_name = getattr(config, "embedding_backend", None)
-    model_name = getattr(config, "embedding_model", None)
-    cache_enabled = getattr(config, "embedding_cache_enabled", True)
+    async def aembed_batch(self, texts: Sequence[str]) -> list[np.ndarray]:
+        results, missing, missing_texts = self._pending(texts)
+        if not missing:
+            return results
+        try:
+            vectors = await self.backend.aembed_batch([missing_texts[key] for key in missing])
+        except Exception as exc:
+            raise self._backend_error(list(missing), exc) from exc
+        return self._fill(results, missing, vectors)
 
-    if backend_name == "openai":
-        backend = OpenAIBackend(model=model_name or "text-embedding-3-small")
-    elif backend_name == "sentence-transformers":
-        backend = SentenceTransformerBackend(model=model_name or "all-MiniLM-L6-v2")
-    elif backend_name == "chutes":
-        backend = ChutesBackend(model=model_name)
-    else:
-        raise ValueError(f"No valid embedding_backend configured. Found: {backend_name}")
 
-    return EmbeddingService(backend=backend, cache_enabled=cache_enabled)
\ No newline at end of file
+def create_embedding_service(config, registry: Optional[EmbeddingBackendRegistry] = None) -> EmbeddingService:
+    cache_enabled = getattr(config, "embedding_cache_enabled", True)
+    precision = getattr(config, "embedding_precision", None) or "float32"
+    dimensions = getattr(config, "embedding_dimensions", None)
+    lease = acquire_backend(config, registry)
+    try:
+        backend = lease.backend
+        return EmbeddingService(
+            backend=backend,
+            cache_enabled=cache_enabled,
+            lease=lease,
+            precision=precision,
+            dimensions=dimensions,
+        )
+    except Exception:
+        lease.release()
+        raise
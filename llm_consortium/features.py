@@ -0,0 +1,75 @@
+"""Per-iteration feature cache shared by strategies.
+
+Normalized text, embeddings and pairwise geometry are derived from response
+text and are needed by several strategies. The orchestrator keeps one
+:class:`IterationFeatures` per iteration so that, for example, a pipeline of
+``semantic`` then ``voting`` embeds each response once and slices the second
+stage's similarities out of the first stage's Gram matrix.
+
+Text-keyed features are cached by the exact response text, so a later stage
+that sees a subset of the responses (or the same text from two members) reuses
+the earlier result.
+"""
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .geometry import ResponseGeometry
+from .similarity import normalize_answer
+
+
+class IterationFeatures:
+    """Lazily computed, memoized features for one iteration's responses."""
+
+    def __init__(self, embedding_service: Optional[Callable[[], Any]] = None,
+                 geometry: Optional[Callable[[List[Any]], ResponseGeometry]] = None):
+        """
+        Args:
+            embedding_service: Returns the embedding service; called only when a
+                               text without a cached embedding is requested.
+            geometry: Optional provider of shared pairwise geometry (the
+                      orchestrator's ``get_response_geometry``). Without one,
+                      geometry is cached here.
+        """
+        self._embedding_service = embedding_service
+        self._geometry_provider = geometry
+        self._geometry: Optional[ResponseGeometry] = None
+        self._normalized: Dict[str, str] = {}
+        self._embeddings: Dict[str, np.ndarray] = {}
+        # Number of times each feature was actually computed (not served from cache)
+        self.computed: Counter = Counter()
+
+    def normalized(self, texts: Sequence[str]) -> List[str]:
+        """``normalize_answer`` of each text."""
+        for text in texts:
+            if text not in self._normalized:
+                self._normalized[text] = normalize_answer(text)
+                self.computed["normalized"] += 1
+        return [self._normalized[text] for text in texts]
+
+    def embeddings(self, texts: Sequence[str]) -> List[np.ndarray]:
+        """Embedding of each text; only texts not seen this iteration are sent to the service."""
+        missing = list(dict.fromkeys(text for text in texts if text not in self._embeddings))
+        if missing:
+            if self._embedding_service is None:
+                raise RuntimeError("No embedding service is configured")
+            vectors = self._embedding_service().embed_batch(missing)
+            if len(vectors) != len(missing):
+                raise RuntimeError(f"Embedding service returned {len(vectors)} vectors for {len(missing)} texts")
+            self._embeddings.update(zip(missing, vectors))
+            self.computed["embeddings"] += len(missing)
+        # The same vector objects are returned every time, so geometry subsets can be matched by identity
+        return [self._embeddings[text] for text in texts]
+
+    def geometry(self, embeddings: List[Any]) -> ResponseGeometry:
+        """Pairwise geometry, sliced from the iteration's Gram matrix when ``embeddings`` is a subset."""
+        if self._geometry_provider is not None:
+            return self._geometry_provider(embeddings)
+        if self._geometry is not None:
+            subset = self._geometry.subset_for(embeddings)
+            if subset is not None:
+                return subset
+        self._geometry = ResponseGeometry(embeddings)
+        self.computed["geometry"] += 1
+        return self._geometry
@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -22,32 +22,155 @@ class TropicalConsensus:
         return np.max(matrix, axis=0)
 
 
+class ResponseGeometry:
+    """Pairwise geometry of a set of response embeddings, computed with one matmul.
+
+    The (N, N) Gram matrix ``G = M @ M.T`` is computed once; cosine similarities,
+    distances to the mean centroid, confidence, outliers, medoids and per-cluster
+    statistics are all derived from it, and :meth:`subset` reuses it for any
+    subset of the responses without touching the (N, D) vectors again.
+
+    Distances to a centroid use the same halved convention as
+    :func:`_cosine_distance` (``(1 - cos) / 2`` in ``[0, 1]``), while
+    :meth:`cosine_distance_matrix` returns the ``1 - cos`` form that DBSCAN's
+    ``eps`` is expressed in.
+    """
+
+    def __init__(self, vectors, _gram: Optional[np.ndarray] = None):
+        self.vectors: List[np.ndarray] = list(vectors)
+        self.matrix = np.vstack(self.vectors).astype(np.float64) if self.vectors else np.zeros((0, 0))
+        self.gram = _gram if _gram is not None else self.matrix @ self.matrix.T
+        self.norms = np.sqrt(np.clip(np.diag(self.gram), 0.0, None))
+        self._similarity: Optional[np.ndarray] = None
+        self._positions: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    @property
+    def similarity(self) -> np.ndarray:
+        """Cosine similarity matrix; rows for zero vectors are 0."""
+        if self._similarity is None:
+            denominator = np.outer(self.norms, self.norms)
+            similarity = np.divide(self.gram, denominator, out=np.zeros_like(self.gram), where=denominator > 0)
+            self._similarity = np.clip(similarity, -1.0, 1.0)
+        return self._similarity
+
+    def cosine_distance_matrix(self) -> np.ndarray:
+        distances = 1.0 - self.similarity
+        zero = self.norms == 0
+        distances[zero, :] = 1.0
+        distances[:, zero] = 1.0
+        np.fill_diagonal(distances, 0.0)
+        return np.clip(distances, 0.0, 2.0)
+
+    def subset(self, indices: Sequence[int]) -> "ResponseGeometry":
+        indices = np.asarray(indices, dtype=np.int64)
+        sub = ResponseGeometry([self.vectors[i] for i in indices], _gram=self.gram[np.ix_(indices, indices)])
+        if self._similarity is not None:
+            sub._similarity = self._similarity[np.ix_(indices, indices)]
+        return sub
+
+    def subset_for(self, vectors: Sequence[np.ndarray]) -> Optional["ResponseGeometry"]:
+        """Return the subset matching ``vectors`` by identity, or None if any is unknown."""
+        if self._positions is None:
+            self._positions = {id(vector): index for index, vector in enumerate(self.vectors)}
+        indices = [self._positions.get(id(vector)) for vector in vectors]
+        if any(index is None for index in indices):
+            return None
+        return self.subset(indices)
+
+    def _indices(self, indices: Optional[Sequence[int]]) -> np.ndarray:
+        if indices is None:
+            return np.arange(len(self.vectors))
+        return np.asarray(indices, dtype=np.int64)
+
+    def centroid(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        indices = self._indices(indices)
+        if indices.size == 0:
+            return np.array([], dtype=float)
+        return self.matrix[indices].mean(axis=0)
+
+    def distances_to_centroid(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Halved cosine distance of each member to the mean of the members."""
+        indices = self._indices(indices)
+        if indices.size == 0:
+            return np.array([], dtype=float)
+        block = self.gram[np.ix_(indices, indices)]
+        centroid_norm = np.sqrt(max(float(block.mean()), 0.0))
+        norms = self.norms[indices]
+        denominator = norms * centroid_norm
+        similarity = np.divide(block.mean(axis=1), denominator, out=np.zeros_like(norms), where=denominator > 0)
+        distances = (1.0 - np.clip(similarity, -1.0, 1.0)) / 2.0
+        distances[denominator == 0] = 1.0
+        return distances
+
+    def confidence(self, indices: Optional[Sequence[int]] = None) -> float:
+        distances = self.distances_to_centroid(indices)
+        if distances.size == 0:
+            return 0.0
+        return max(0.0, min(1.0, 1.0 - float(np.mean(distances))))
+
+    def outliers(self, threshold_std: float = 2.0) -> List[int]:
+        if len(self.vectors) < 3:
+            return []
+        distances = self.distances_to_centroid()
+        std_distance = float(np.std(distances))
+        if std_distance == 0.0:
+            return []
+        cutoff = float(np.mean(distances)) + threshold_std * std_distance
+        return np.flatnonzero(distances > cutoff).tolist()
+
+    def medoid(self, indices: Optional[Sequence[int]] = None) -> Optional[int]:
+        """Index of the member with the highest total similarity to the others."""
+        indices = self._indices(indices)
+        if indices.size == 0:
+            return None
+        totals = self.similarity[np.ix_(indices, indices)].sum(axis=1)
+        return int(indices[int(np.argmax(totals))])
+
+    def cluster_stats(self, labels: Sequence[int]) -> List[Dict[str, object]]:
+        """Centroid, density and radius for every non-noise cluster label."""
+        labels = np.asarray(labels)
+        stats = []
+        for cluster_id in sorted(set(labels.tolist()) - {-1}):
+            members = np.flatnonzero(labels == cluster_id)
+            distances = self.distances_to_centroid(members)
+            stats.append({
+                "cluster_id": int(cluster_id),
+                "members": members.tolist(),
+                "centroid": self.centroid(members),
+                "distances": distances,
+                "density": 1.0 - float(np.mean(distances)),
+                "radius": float(np.max(distances)) if distances.size else 0.0,
+                "medoid": self.medoid(members),
+            })
+        return stats
+
+
 class GeometricConfidenceCalculator:
     @staticmethod
     def compute_confidence(response_vectors: List[np.ndarray], centroid: np.ndarray) -> float:
         if not response_vectors or centroid.size == 0:
             return 0.0
-        distances = [_cosine_distance(vector, centroid) for vector in response_vectors]
-        mean_distance = float(np.mean(distances)) if distances else 1.0
-        return max(0.0, min(1.0, 1.0 - mean_distance))
+        matrix = np.vstack(response_vectors).astype(np.float64)
+        denominator = np.linalg.norm(matrix, axis=1) * np.linalg.norm(centroid)
+        similarity = np.divide(matrix @ centroid, denominator, out=np.zeros(matrix.shape[0]), where=denominator > 0)
+        distances = (1.0 - np.clip(similarity, -1.0, 1.0)) / 2.0
+        distances[denominator == 0] = 1.0
+        return max(0.0, min(1.0, 1.0 - float(np.mean(distances))))
 
     @staticmethod
-    def detect_outliers(vectors: List[np.ndarray], threshold_std: float = 2.0) -> List[int]:
+    def detect_outliers(vectors: List[np.ndarray], threshold_std: float = 2.0,
+                        geometry: Optional[ResponseGeometry] = None) -> List[int]:
         if len(vectors) < 3:
             return []
-        centroid = np.mean(np.vstack(vectors), axis=0)
-        distances = np.array([_cosine_distance(vector, centroid) for vector in vectors], dtype=float)
-        mean_distance = float(np.mean(distances))
-        std_distance = float(np.std(distances))
-        if std_distance == 0.0:
-            return []
-        cutoff = mean_distance + (threshold_std * std_distance)
-        return [index for index, distance in enumerate(distances.tolist()) if distance > cutoff]
+        return (geometry or ResponseGeometry(vectors)).outliers(threshold_std)
 
     @staticmethod
-    def compute(response_embeddings: List[np.ndarray]) -> Tuple[float, np.ndarray]:
+    def compute(response_embeddings: List[np.ndarray],
+                geometry: Optional[ResponseGeometry] = None) -> Tuple[float, np.ndarray]:
         if not response_embeddings:
             return 0.0, np.array([], dtype=float)
-        centroid = np.mean(np.vstack(response_embeddings), axis=0)
-        confidence = GeometricConfidenceCalculator.compute_confidence(response_embeddings, centroid)
-        return confidence, centroid
\ No newline at end of file
+        geometry = geometry or ResponseGeometry(response_embeddings)
+        return geometry.confidence(), geometry.centroid()
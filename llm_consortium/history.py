@@ -0,0 +1,141 @@
+"""Incremental, token-bounded conversation history for multi-turn consortium chats.
+
+Each member's first-iteration prompt carries the conversation so far. Rather
+than re-reading every earlier response on each turn, :class:`ConversationHistory`
+keeps the formatted exchanges of one conversation and formats only the turns
+added since the previous call.
+
+With a token budget, older exchanges are folded into a running summary once
+the history outgrows it, keeping the most recent exchanges verbatim. The
+summary is written by a cheap model (or, without one, cut down by
+structure-aware truncation), stored per conversation id, and reused on later
+turns and in later processes instead of being regenerated.
+"""
+import logging
+import pathlib
+from typing import Any, List, Optional, Sequence
+
+import llm
+
+from .compaction import estimate_tokens, truncate_to_tokens
+from .db import get_conversation_summary, log_response, save_conversation_summary
+
+logger = logging.getLogger(__name__)
+
+
+def _read_history_summary_prompt() -> str:
+    try:
+        return (pathlib.Path(__file__).parent / "history_summary_prompt.xml").read_text().strip()
+    except Exception as e:
+        logger.error(f"Error reading history_summary_prompt.xml file: {e}")
+        return ""
+
+
+def format_exchange(response: Any) -> str:
+    """One ``Human:``/``Assistant:`` exchange from an ``llm`` response."""
+    human_prompt = "[prompt unavailable]"
+    if getattr(response, 'prompt', None):
+        human_prompt = getattr(response.prompt, 'prompt', None) or str(response.prompt)
+
+    assistant_response = "[response unavailable]"
+    if callable(getattr(response, 'text', None)):
+        assistant_response = response.text()
+    elif getattr(response, 'response', None):
+        assistant_response = response.response
+    return f"Human: {human_prompt}\n\nAssistant: {assistant_response}"
+
+
+class ConversationHistory:
+    """The formatted history of one conversation, extended incrementally."""
+
+    def __init__(self, conversation_id: Optional[str] = None, token_budget: Optional[int] = None,
+                 summary_model: Optional[str] = None):
+        """
+        Args:
+            conversation_id: Key under which the summary is stored; without one
+                             nothing is persisted. A stored summary is only
+                             loaded when there is a token budget.
+            token_budget: Approximate size above which older exchanges are
+                          summarized. None keeps the full history.
+            summary_model: Model that writes the summary; None truncates instead.
+        """
+        self.conversation_id = conversation_id
+        self.token_budget = token_budget
+        self.summary_model = summary_model
+        self.exchanges: List[str] = []
+        self.summary = ""
+        # Number of leading exchanges the summary stands for
+        self.summarized = 0
+        stored = get_conversation_summary(conversation_id) if conversation_id and token_budget else None
+        if stored:
+            self.summary = stored["summary"]
+            self.summarized = int(stored["summarized_turns"])
+
+    def update(self, responses: Sequence[Any]) -> str:
+        """Add the exchanges not seen before and return the history text."""
+        if len(responses) < len(self.exchanges):
+            # A different or rewound conversation; start over
+            logger.info("Conversation history shrank; rebuilding it")
+            self.exchanges = []
+            self.summary, self.summarized = "", 0
+        new = responses[len(self.exchanges):]
+        self.exchanges.extend(format_exchange(response) for response in new)
+        if new:
+            logger.info(f"Added {len(new)} exchanges to the conversation history ({len(self.exchanges)} in total)")
+        if self.summarized > len(self.exchanges):
+            self.summary, self.summarized = "", 0
+        self._compact()
+        return self.text()
+
+    def text(self) -> str:
+        recent = "\n\n".join(self.exchanges[self.summarized:])
+        if not self.summary:
+            return recent
+        return f"Summary of the earlier conversation:\n{self.summary}\n\n{recent}".strip()
+
+    def _compact(self) -> None:
+        """Fold older exchanges into the summary when the history is over budget."""
+        budget = self.token_budget
+        if not budget or estimate_tokens(self.text()) <= budget:
+            return
+
+        # Keep the newest exchanges that fit in half the budget (always at least the last one)
+        keep, used = 0, 0
+        for exchange in reversed(self.exchanges[self.summarized:]):
+            cost = estimate_tokens(exchange)
+            if keep and used + cost > budget // 2:
+                break
+            keep, used = keep + 1, used + cost
+        fold = self.exchanges[self.summarized:len(self.exchanges) - keep]
+        if not fold:
+            return
+
+        summary_budget = max(budget - used, budget // 4)
+        summary = self._summarize(fold, summary_budget) if self.summary_model else None
+        before = estimate_tokens(self.summary) + sum(estimate_tokens(exchange) for exchange in fold)
+        if summary is None:
+            summary = truncate_to_tokens("\n\n".join(filter(None, [self.summary] + fold)), summary_budget)
+        self.summary = summary
+        self.summarized += len(fold)
+        logger.info(f"Summarized {self.summarized} earlier exchanges: {before} -> {estimate_tokens(summary)} tokens")
+        if self.conversation_id:
+            save_conversation_summary(self.conversation_id, self.summary, self.summarized)
+
+    def _summarize(self, exchanges: List[str], token_budget: int) -> Optional[str]:
+        """A ``summary_model`` summary of the current summary plus ``exchanges``; None on failure."""
+        template = _read_history_summary_prompt() or (
+            "Earlier summary:\n{previous_summary}\nNew exchanges:\n{exchanges}\n"
+            "Summarize the conversation so far in at most {token_budget} tokens."
+        )
+        try:
+            response = llm.get_model(self.summary_model).prompt(
+                template.format(previous_summary=self.summary or "(none)",
+                                exchanges="\n\n".join(exchanges), token_budget=token_budget),
+                stream=False,
+            )
+            text = response.text().strip()
+            log_response(response, self.summary_model)
+        except Exception as e:
+            logger.warning(f"History summary failed; truncating older exchanges instead: {e}")
+            return None
+        return truncate_to_tokens(text, token_budget) if text else None
@@ -0,0 +1,249 @@
+"""Field-level consensus for consortiums whose members answer in JSON.
+
+Each member response is parsed into a document and the documents are merged
+field by field:
+
+- objects are merged key by key; a key is kept when most documents have it
+  (or the schema marks it ``required``),
+- numbers take the median, rounded for ``integer`` fields,
+- strings, booleans and nulls take the strict-majority value,
+- arrays are treated as sets of items matched by their non-numeric content, so
+  ``{"text": "Apple", "type": "ORG", "confidence": 0.9}`` and the same entity
+  with ``0.8`` merge into one item with the median confidence; an item is kept
+  when most documents contain it.
+
+Fields without a majority are reported as unresolved with their candidate
+values so that only those need an arbiter decision. Fields are located by
+tuples of keys and array positions; the dotted strings shown to the arbiter
+(with literal dots in keys escaped) are only labels for those tuples.
+"""
+import json
+import logging
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import jsonschema
+except ImportError:  # Optional: schemas still guide merging without it
+    jsonschema = None
+
+logger = logging.getLogger(__name__)
+
+# Location of a field: object keys and array positions from the document root
+FieldPath = Tuple[Union[str, int], ...]
+
+_FENCE = re.compile(r"```(?:json)?\s*([\s\S]*?)```", re.IGNORECASE)
+
+
+def parse_json_response(text: str) -> Optional[Any]:
+    """Parse a member response as JSON, tolerating code fences and surrounding prose."""
+    text = (text or "").strip()
+    candidates = [match.group(1).strip() for match in _FENCE.finditer(text)] + [text]
+    decoder = json.JSONDecoder()
+    for candidate in candidates:
+        try:
+            return json.loads(candidate)
+        except ValueError:
+            pass
+        for start, char in enumerate(candidate):
+            if char in "{[":
+                try:
+                    return decoder.raw_decode(candidate[start:])[0]
+                except ValueError:
+                    continue
+    return None
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _identity(value: Any) -> str:
+    """Key used to match array items across documents: the item without its numeric leaves."""
+    def strip(item):
+        if isinstance(item, dict):
+            return {key: strip(val) for key, val in item.items() if not _is_number(val)}
+        if isinstance(item, list):
+            return [strip(val) for val in item]
+        return item
+    return _canonical(strip(value))
+
+
+class JsonConsensus:
+    """Result of merging member documents."""
+
+    def __init__(self, document: Any, agreement: Dict[str, float], unresolved: Dict[str, List[Any]],
+                 documents: int, locations: Optional[Dict[str, FieldPath]] = None):
+        self.document = document
+        self.agreement = agreement
+        self.unresolved = unresolved
+        self.documents = documents
+        # Rendered path -> location in the document
+        self.locations = locations or {}
+
+    @property
+    def confidence(self) -> float:
+        if not self.agreement:
+            return 0.0
+        return float(np.mean(list(self.agreement.values())))
+
+    def resolve(self, values: Dict[str, Any]) -> None:
+        """Write arbiter decisions for unresolved paths into the merged document."""
+        for path, value in values.items():
+            if path not in self.unresolved or path not in self.locations:
+                continue
+            self.document = _set_path(self.document, self.locations[path], value)
+            del self.unresolved[path]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "documents": self.documents,
+            "fields": len(self.agreement),
+            "consensus_fields": len(self.agreement) - len(self.unresolved),
+            "unresolved_fields": sorted(self.unresolved),
+            "field_agreement": self.agreement,
+        }
+
+
+def render_path(path: FieldPath) -> str:
+    """Dotted label for a location, escaping backslashes and dots inside keys."""
+    return ".".join(
+        str(part) if isinstance(part, int) else part.replace("\\", "\\\\").replace(".", "\\.")
+        for part in path
+    )
+
+
+def _set_path(document: Any, path: FieldPath, value: Any) -> Any:
+    if not path:
+        return value
+    target = document
+    for part in path[:-1]:
+        target = target[part]
+    target[path[-1]] = value
+    return document
+
+
+class _Merger:
+    def __init__(self, quorum: float):
+        self.quorum = quorum
+        self.agreement: Dict[str, float] = OrderedDict()
+        self.unresolved: Dict[str, List[Any]] = OrderedDict()
+        self.locations: Dict[str, FieldPath] = {}
+
+    def _label(self, path: FieldPath) -> str:
+        label = render_path(path)
+        self.locations[label] = path
+        return label
+
+    def _has_majority(self, count: int, total: int) -> bool:
+        return count > self.quorum * total
+
+    def merge(self, values: List[Any], schema: Optional[Dict[str, Any]], path: FieldPath, total: int) -> Any:
+        schema = schema or {}
+        kind = schema.get("type")
+        if kind == "object" or (kind is None and all(isinstance(v, dict) for v in values)):
+            return self._merge_object(values, schema, path)
+        if kind == "array" or (kind is None and all(isinstance(v, list) for v in values)):
+            return self._merge_array(values, schema, path)
+        if kind in ("number", "integer") or (kind is None and all(_is_number(v) for v in values)):
+            return self._merge_number(values, kind, path)
+        return self._merge_scalar(values, path)
+
+    def _merge_object(self, values: List[Any], schema: Dict[str, Any], path: FieldPath) -> Dict[str, Any]:
+        values = [value for value in values if isinstance(value, dict)]
+        properties = schema.get("properties", {})
+        required = set(schema.get("required", []))
+        keys: List[str] = list(OrderedDict.fromkeys(key for value in values for key in value))
+        merged = OrderedDict()
+        for key in keys:
+            present = [value[key] for value in values if key in value]
+            if key not in required and not self._has_majority(len(present), len(values)):
+                continue
+            merged[key] = self.merge(present, properties.get(key), path + (key,), len(values))
+        return merged
+
+    def _merge_array(self, values: List[Any], schema: Dict[str, Any], path: FieldPath) -> List[Any]:
+        values = [value for value in values if isinstance(value, list)]
+        items: Dict[str, List[Any]] = OrderedDict()
+        for value in values:
+            seen = set()
+            for item in value:
+                key = _identity(item)
+                if key in seen:
+                    continue
+                seen.add(key)
+                items.setdefault(key, []).append(item)
+        merged = []
+        for position, group in enumerate(group for group in items.values() if self._has_majority(len(group), len(values))):
+            merged.append(self.merge(group, schema.get("items"), path + (position,), len(values)))
+        kept = sum(len(group) for group in items.values() if self._has_majority(len(group), len(values)))
+        offered = sum(len(group) for group in items.values())
+        self.agreement[self._label(path)] = kept / offered if offered else 1.0
+        return merged
+
+    def _merge_number(self, values: List[Any], kind: Optional[str], path: FieldPath) -> Any:
+        numbers = [float(value) for value in values if _is_number(value)]
+        if not numbers:
+            return self._merge_scalar(values, path)
+        median = float(np.median(numbers))
+        spread = float(np.median(np.abs(np.array(numbers) - median)))
+        tolerance = max(abs(median) * 0.05, spread, 1e-9)
+        self.agreement[self._label(path)] = sum(abs(number - median) <= tolerance for number in numbers) / len(values)
+        if kind == "integer" or (kind is None and all(isinstance(value, int) for value in values)):
+            return int(round(median))
+        return median
+
+    def _merge_scalar(self, values: List[Any], path: FieldPath) -> Any:
+        counts: Dict[str, List[Any]] = OrderedDict()
+        for value in values:
+            counts.setdefault(_canonical(value), []).append(value)
+        winner = max(counts.values(), key=len)
+        label = self._label(path)
+        self.agreement[label] = len(winner) / len(values)
+        if not self._has_majority(len(winner), len(values)):
+            self.unresolved[label] = [group[0] for group in counts.values()]
+        return winner[0]
+
+
+def validate_documents(documents: List[Any], schema: Optional[Dict[str, Any]]) -> List[Any]:
+    """Drop documents that do not match ``schema`` (requires the optional jsonschema package)."""
+    if not schema:
+        return documents
+    if jsonschema is None:
+        logger.debug("jsonschema is not installed; member documents are not validated against the schema")
+        return documents
+    valid = []
+    for document in documents:
+        try:
+            jsonschema.validate(document, schema)
+            valid.append(document)
+        except jsonschema.ValidationError as e:
+            logger.info(f"Discarding member JSON that fails the schema: {e.message}")
+    return valid
+
+
+def merge_documents(documents: List[Any], schema: Optional[Dict[str, Any]] = None,
+                    quorum: float = 0.5) -> JsonConsensus:
+    """Merge parsed member documents field by field."""
+    merger = _Merger(quorum)
+    document = merger.merge(documents, schema, (), len(documents)) if documents else None
+    return JsonConsensus(document, dict(merger.agreement), dict(merger.unresolved), len(documents),
+                         dict(merger.locations))
+
+
+def build_consensus(texts: List[str], schema: Optional[Dict[str, Any]] = None,
+                    quorum: float = 0.5) -> Tuple[JsonConsensus, List[int]]:
+    """Parse, validate and merge member responses; also returns the indices of usable responses."""
+    parsed = [(index, parse_json_response(text)) for index, text in enumerate(texts)]
+    parsed = [(index, document) for index, document in parsed if document is not None]
+    valid = validate_documents([document for _, document in parsed], schema)
+    valid_ids = {id(document) for document in valid}
+    indices = [index for index, document in parsed if id(document) in valid_ids]
+    return merge_documents(valid, schema, quorum), indices
@@ -2,10 +2,12 @@ import llm
 import json
 import logging
 import uuid
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 from datetime import datetime
 from .db import DatabaseConnection
+from .history import ConversationHistory
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +34,30 @@ class ConsortiumConfig(BaseModel):
     strategy_params: Optional[Dict[str, Any]] = None
     embedding_backend: Optional[str] = None
     embedding_model: Optional[str] = None
+    embedding_options: Optional[Dict[str, Any]] = None
+    embedding_precision: str = "float32"
+    embedding_dimensions: Optional[int] = None
     embedding_cache_enabled: bool = True
+    json_schema: Optional[Dict[str, Any]] = None
+    arbiter_group_size: int = 5
+    arbiter_ensemble: List[str] = Field(default_factory=list)
+    arbiter_quorum: Optional[int] = None
+    pre_arbiter: Optional[str] = None
+    pre_arbiter_top_k: Optional[int] = None
+    pre_arbiter_min_score: Optional[float] = None
+    pre_arbiter_batch_size: int = 1
+    arbiter_top_k: Optional[int] = None
+    mmr_lambda: float = 0.5
+    drop_outliers: bool = False
+    dedupe_responses: bool = True
+    arbiter_response_tokens: Optional[int] = None
+    compaction_model: Optional[str] = None
+    refinement: str = "all"
+    refinement_threshold: float = 0.8
+    iteration_prompt: str = "full"
+    revision_max_tokens: Optional[int] = None
+    history_token_budget: Optional[int] = None
+    history_summary_model: Optional[str] = None
     manual_context: bool = Field(default=False, description="Use manual context management instead of automatic conversation objects")
     category: Optional[str] = None
     expected_agreement: Optional[float] = None
@@ -46,11 +71,48 @@ class ConsortiumConfig(BaseModel):
             self.embedding_backend = self.embedding_backend.strip().lower() or None
         if self.embedding_model is not None:
             self.embedding_model = self.embedding_model.strip() or None
+        self.embedding_precision = _normalize_mode_name(self.embedding_precision, "float32")
+        self.refinement = _normalize_mode_name(self.refinement, "all")
+        if self.refinement not in ("all", "targeted"):
+            raise ValueError("refinement must be 'all' or 'targeted'")
+        if not 0 <= self.refinement_threshold <= 1:
+            raise ValueError("refinement_threshold must be between 0 and 1")
+        self.iteration_prompt = _normalize_mode_name(self.iteration_prompt, "full")
+        if self.iteration_prompt not in ("full", "delta"):
+            raise ValueError("iteration_prompt must be 'full' or 'delta'")
+        if self.revision_max_tokens is not None and self.revision_max_tokens < 1:
+            raise ValueError("revision_max_tokens must be at least 1")
+        if self.history_token_budget is not None and self.history_token_budget < 1:
+            raise ValueError("history_token_budget must be at least 1")
+        if self.arbiter_group_size < 2:
+            raise ValueError("arbiter_group_size must be at least 2")
+        if not self.arbiter and self.arbiter_ensemble:
+            self.arbiter = self.arbiter_ensemble[0]
+        if self.arbiter_quorum is not None and self.arbiter_quorum < 1:
+            raise ValueError("arbiter_quorum must be at least 1")
+        if self.pre_arbiter_top_k is not None and self.pre_arbiter_top_k < 1:
+            raise ValueError("pre_arbiter_top_k must be at least 1")
+        if self.pre_arbiter_batch_size < 1:
+            raise ValueError("pre_arbiter_batch_size must be at least 1")
+        if self.arbiter_top_k is not None and self.arbiter_top_k < 1:
+            raise ValueError("arbiter_top_k must be at least 1")
+        if not 0 <= self.mmr_lambda <= 1:
+            raise ValueError("mmr_lambda must be between 0 and 1")
+        if self.arbiter_response_tokens is not None and self.arbiter_response_tokens < 1:
+            raise ValueError("arbiter_response_tokens must be at least 1")
 
         # Elimination strategy requires ranking output, so force rank judging
-        if self.strategy == "elimination" and self.judging_method != "rank":
+        if self._uses_elimination() and self.judging_method != "rank":
             self.judging_method = "rank"
 
+    def _uses_elimination(self) -> bool:
+        if self.strategy == "elimination":
+            return True
+        if self.strategy == "pipeline":
+            from .strategies.pipeline import parse_stage_names
+            return "elimination" in parse_stage_names((self.strategy_params or {}).get("stages"))
+        return False
+
     def to_dict(self):
         return self.model_dump()
 
@@ -116,6 +178,9 @@ class DummyModel(llm.Model):
 
 class ConsortiumModel(llm.Model):
 
+    # Conversation histories kept in memory; the least recently used is dropped first
+    MAX_CACHED_HISTORIES = 32
+
     class Options(llm.Options):
         max_iterations: Optional[int] = None
         system_prompt: Optional[str] = None
@@ -125,6 +190,17 @@ class ConsortiumModel(llm.Model):
         self.model_id = str(model_id)
         self.config = config
         self._orchestrator = None
+        # Conversation id -> incrementally built history, so each turn formats only new exchanges
+        self._histories: "OrderedDict[str, ConversationHistory]" = OrderedDict()
+        # Keeps a shared embedding backend alive across the per-call orchestrators
+        # created for --system prompts; the backend itself still loads lazily.
+        self._embedding_lease = None
+        if config.embedding_backend:
+            from .embeddings.registry import lease_for
+            try:
+                self._embedding_lease = lease_for(self, config)
+            except ValueError as e:
+                logger.error(f"Invalid embedding configuration for consortium '{model_id}': {e}")
 
     def __str__(self):
         return f"Consortium: {self.model_id}"
@@ -134,6 +210,11 @@ class ConsortiumModel(llm.Model):
         models_summary = ", ".join(f"{v}x {k}" for k, v in self.config.models.items())
         return f"Consortium strategy '{self.config.strategy or 'default'}' using models: {models_summary}"
 
+    def preload_embeddings(self, background: bool = True) -> None:
+        """Load this consortium's embedding backend ahead of the first prompt."""
+        if self._embedding_lease is not None:
+            self._embedding_lease.preload(background=background)
+
     def get_orchestrator(self):
         if self._orchestrator is None:
             # Lazy import to avoid circular dependency
@@ -144,38 +225,36 @@ class ConsortiumModel(llm.Model):
                 raise llm.ModelError(f"Failed to initialize consortium: {e}")
         return self._orchestrator
 
+    def conversation_history(self, conversation) -> str:
+        """History text for ``conversation``, extended with only its new exchanges.
+
+        Histories of the ``MAX_CACHED_HISTORIES`` most recent conversations are
+        cached per conversation id. Past ``history_token_budget``, older
+        exchanges are summarized once and the summary is reused.
+        """
+        conversation_id = getattr(conversation, 'id', None)
+        conversation_id = conversation_id if isinstance(conversation_id, str) else None
+        key = conversation_id or str(id(conversation))
+        history = self._histories.get(key)
+        if history is None:
+            history = self._histories[key] = ConversationHistory(
+                conversation_id,
+                token_budget=self.config.history_token_budget,
+                summary_model=self.config.history_summary_model,
+            )
+            while len(self._histories) > self.MAX_CACHED_HISTORIES:
+                self._histories.popitem(last=False)
+        else:
+            self._histories.move_to_end(key)
+        return history.update(conversation.responses)
+
     def execute(self, prompt, stream, response, conversation):
         consortium_id = str(uuid.uuid4())
         """Execute the consortium synchronously"""
         try:
-            # Extract conversation history from the conversation object directly
             conversation_history = ""
-            if conversation and hasattr(conversation, 'responses') and conversation.responses:
-                logger.info(f"Processing conversation with {len(conversation.responses)} previous exchanges")
-                history_parts = []
-                for resp in conversation.responses:
-                    # Handle prompt format
-                    human_prompt = "[prompt unavailable]"
-                    if hasattr(resp, 'prompt') and resp.prompt:
-                        if hasattr(resp.prompt, 'prompt'):
-                            human_prompt = resp.prompt.prompt
-                        else:
-                            human_prompt = str(resp.prompt)
-
-                    # Handle response text format
-                    assistant_response = "[response unavailable]"
-                    if hasattr(resp, 'text') and callable(resp.text):
-                        assistant_response = resp.text()
-                    elif hasattr(resp, 'response') and resp.response:
-                        assistant_response = resp.response
-
-                    # Format the history exchange
-                    history_parts.append(f"Human: {human_prompt}")
-                    history_parts.append(f"Assistant: {assistant_response}")
-
-                if history_parts:
-                    conversation_history = "\n\n".join(history_parts)
-                    logger.info(f"Successfully formatted {len(history_parts)//2} exchanges from conversation history")
+            if conversation and getattr(conversation, 'responses', None):
+                conversation_history = self.conversation_history(conversation)
 
             # Check if a system prompt was provided via --system option
             if hasattr(prompt, 'system') and prompt.system:
@@ -184,8 +263,11 @@ class ConsortiumModel(llm.Model):
                 updated_config.system_prompt = prompt.system
                 # Create a new orchestrator with the updated config
                 from .orchestrator import ConsortiumOrchestrator
-                orchestrator = ConsortiumOrchestrator(updated_config)
-                result = orchestrator.orchestrate(prompt.prompt, conversation_history=conversation_history, consortium_id=consortium_id)
+                orchestrator = ConsortiumOrchestrator(updated_config, config_name=self.model_id)
+                try:
+                    result = orchestrator.orchestrate(prompt.prompt, conversation_history=conversation_history, consortium_id=consortium_id)
+                finally:
+                    orchestrator.close()
             else:
                 # Use the default orchestrator with the original config
                 orchestrator = self.get_orchestrator()
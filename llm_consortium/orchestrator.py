@@ -1,13 +1,15 @@
 import concurrent.futures
+import hashlib
 import logging
 import re
 import uuid
 import json
 import time
 import pathlib
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 import llm
+import numpy as np
 
 from .strategies.factory import create_strategy
 from .db import (
@@ -15,11 +17,18 @@ from .db import (
     save_consortium_run,
     save_consortium_member,
     save_arbiter_decision,
+    save_compaction_ratios,
+    save_screening_scores,
     update_consortium_run,
 )
+from .compaction import estimate_tokens, truncate_to_tokens
 from .embeddings.service import EmbeddingService, create_embedding_service
-from .geometry import GeometricConfidenceCalculator
+from .features import IterationFeatures
+from .geometry import GeometricConfidenceCalculator, ResponseGeometry
+from .json_consensus import JsonConsensus, build_consensus, parse_json_response
 from .models import ConsortiumConfig
+from .selection import mmr_select
+from .similarity import auto_shingle_size, dice, normalize_answer, shingle_hashes, similarity_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +50,31 @@ def _read_arbiter_prompt() -> str:
 def _read_iteration_prompt() -> str:
     return _read_prompt_file("iteration_prompt.xml")
 
+def _read_lean_arbiter_prompt() -> str:
+    return _read_prompt_file("auto_arbiter_lean.xml")
+
+def _read_lean_rank_prompt() -> str:
+    return _read_prompt_file("auto_arbiter_rank_lean.xml")
+
+def _read_json_field_prompt() -> str:
+    return _read_prompt_file("json_field_prompt.xml")
+
+def _read_pre_arbiter_prompt() -> str:
+    return _read_prompt_file("pre_arbiter_prompt.xml")
+
+def _read_compaction_prompt() -> str:
+    return _read_prompt_file("compaction_prompt.xml")
+
+def _token_usage(response) -> Dict[str, Optional[int]]:
+    """Input/output token counts reported by the model plugin, when available."""
+    try:
+        usage = response.usage()
+        counts = {"input_tokens": usage.input, "output_tokens": usage.output}
+    except Exception:
+        counts = {}
+    return {key: counts.get(key) if isinstance(counts.get(key), int) else None
+            for key in ("input_tokens", "output_tokens")}
+
 class IterationContext:
     def __init__(self, synthesis: Dict[str, Any], model_responses: List[Dict[str, Any]]):
         self.synthesis = synthesis
@@ -63,16 +97,45 @@ class ConsortiumOrchestrator:
         self._conversation_history = ""
         self.consortium_id = None
         self._embedding_service: Optional[EmbeddingService] = None
+        self._iteration_geometry: Optional[ResponseGeometry] = None
+        self._iteration_features: Optional[IterationFeatures] = None
 
         # Conversation management - persist across turns
         self.model_conversations: dict = {}  # Key: f"{model_name}_{instance_id}"
         self.arbiter_conversation = None
+        # The arbiter conversation that has already seen this run's full arbiter prompt
+        self._primed_arbiter_conversation = None
 
     def get_embedding_service(self) -> EmbeddingService:
         if self._embedding_service is None:
             self._embedding_service = create_embedding_service(self.config)
         return self._embedding_service
 
+    def get_response_geometry(self, embeddings: List[Any]) -> ResponseGeometry:
+        """Pairwise geometry for this iteration's embeddings, computed once and shared.
+
+        Strategies and the geometric confidence pass ask for the same vectors (or a
+        subset of them); subsets are sliced from the cached Gram matrix.
+        """
+        if self._iteration_geometry is not None:
+            subset = self._iteration_geometry.subset_for(embeddings)
+            if subset is not None:
+                return subset
+        self._iteration_geometry = ResponseGeometry(embeddings)
+        return self._iteration_geometry
+
+    def get_iteration_features(self) -> IterationFeatures:
+        """Feature cache (normalized text, embeddings, geometry) for the current iteration."""
+        if self._iteration_features is None:
+            self._iteration_features = IterationFeatures(self.get_embedding_service, self.get_response_geometry)
+        return self._iteration_features
+
+    def close(self) -> None:
+        """Release shared resources such as the embedding backend lease."""
+        if self._embedding_service is not None:
+            self._embedding_service.close()
+            self._embedding_service = None
+
     def _get_model_conversation(self, model_name: str, instance_id: int):
         """Get or create a conversation for a specific model instance."""
         if self.manual_context:
@@ -110,6 +173,7 @@ class ConsortiumOrchestrator:
     def reset_arbiter_conversation(self) -> None:
         """Reset the stored arbiter conversation."""
         self.arbiter_conversation = None
+        self._primed_arbiter_conversation = None
         logger.info("Arbiter conversation reset.")
 
     def orchestrate(self, prompt: str, conversation_history: Optional[str] = None, consortium_id: Optional[str] = None) -> Dict[str, Any]:
@@ -144,12 +208,16 @@ class ConsortiumOrchestrator:
         
         for iteration in range(1, self.max_iterations + 1):
             logger.info(f"Starting iteration {iteration}")
+            self._iteration_geometry = None
+            self._iteration_features = None
             
             available_models = self.models
             selected_models = self.strategy.select_models(available_models, prompt, iteration)
             
-            model_responses = self._get_model_responses_manual(prompt, selected_models, iteration)
-            model_responses = self.strategy.process_responses(model_responses, iteration)
+            carried = self._carry_forward(selected_models, iteration)
+            skip = self.strategy.excluded_instances() | {(r["model"], r["instance"]) for r in carried}
+            model_responses = self._get_model_responses_manual(prompt, selected_models, iteration, skip=skip)
+            model_responses = self.strategy.process_responses(carried + model_responses, iteration)
             
             valid_responses = [r for r in model_responses if r.get('error') is None]
             if not valid_responses:
@@ -162,15 +230,18 @@ class ConsortiumOrchestrator:
             iteration_data = {
                 "iteration": iteration,
                 "selected_models": selected_models,
+                "carried_forward": len(carried),
                 "model_responses": model_responses,
                 "synthesis": synthesis_result
             }
+            self._record_token_usage(iteration_data)
             self.iteration_history.append(iteration_data)
             
             context = IterationContext(synthesis=synthesis_result, model_responses=model_responses)
             self.strategy.update_state(context)
+            needs_iteration = synthesis_result.get('needs_iteration', False) or self.strategy.needs_iteration(context)
             
-            if not synthesis_result.get('needs_iteration', False) and iteration >= self.minimum_iterations:
+            if not needs_iteration and iteration >= self.minimum_iterations:
                 if synthesis_result.get('confidence', 0) >= self.confidence_threshold:
                     logger.info(f"Conversation converged at iteration {iteration} with confidence {synthesis_result.get('confidence')}")
                     break
@@ -196,27 +267,126 @@ class ConsortiumOrchestrator:
         
         return final_result
 
-    def _get_model_responses_manual(self, prompt: str, models: Dict[str, int], iteration: int) -> List[Dict[str, Any]]:
+    def _get_model_responses_manual(self, prompt: str, models: Dict[str, int], iteration: int,
+                                    skip: Optional[Set[Tuple[str, int]]] = None) -> List[Dict[str, Any]]:
+        skip = skip or set()
         tasks = []
         for model_id, count in models.items():
             for i in range(count):
-                tasks.append((model_id, prompt, i, iteration))
+                if (model_id, i) not in skip:
+                    tasks.append((model_id, prompt, i, iteration))
         
         responses = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(tasks) or 1, 10)) as executor:
-            future_to_task = {executor.submit(self._get_single_model_response_manual, *task): task for task in tasks}
-            for future in concurrent.futures.as_completed(future_to_task):
-                try:
-                    responses.append(future.result())
-                except Exception as e:
-                    task = future_to_task[future]
-                    responses.append({
-                        "model": task[0],
-                        "instance": task[2],
-                        "error": str(e)
-                    })
+        for wave_index, wave in enumerate(self._sampling_waves(tasks, lambda task: task[2])):
+            if wave_index and self._sampling_settled(responses, iteration, len(tasks)):
+                break
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(wave) or 1, 10)) as executor:
+                future_to_task = {executor.submit(self._get_single_model_response_manual, *task): task for task in wave}
+                for future in concurrent.futures.as_completed(future_to_task):
+                    try:
+                        responses.append(future.result())
+                    except Exception as e:
+                        task = future_to_task[future]
+                        responses.append({
+                            "model": task[0],
+                            "instance": task[2],
+                            "error": str(e)
+                        })
         return responses
 
+    def _carry_forward(self, selected_models: Dict[str, int], iteration: int) -> List[Dict[str, Any]]:
+        """Previous responses of members close to the last synthesis (``refinement=targeted``).
+
+        These members are not re-prompted; their responses are reused unchanged so
+        only dissenters and outliers are asked to address the refinement areas.
+        """
+        if self.config.refinement != "targeted" or iteration == 1 or not self.iteration_history:
+            return []
+        previous = self.iteration_history[-1]
+        excluded = self.strategy.excluded_instances()
+        responses = [
+            r for r in previous.get("model_responses", [])
+            if r.get("error") is None and r.get("model") in selected_models and "instance" in r
+            and (r["model"], r["instance"]) not in excluded
+        ]
+        close = self._close_to_synthesis(responses, previous.get("synthesis", {}))
+        if len(close) == len(responses):
+            # Nothing would be re-prompted; refine everyone instead of repeating the same vote
+            logger.info("Targeted refinement: every member agrees with the synthesis; re-prompting all")
+            return []
+
+        carried = []
+        for index in close:
+            response = dict(responses[index])
+            response["carried_forward"] = True
+            response.setdefault("carried_from", previous.get("iteration"))
+            carried.append(response)
+        logger.info(f"Targeted refinement: carrying forward {len(carried)} response(s), "
+                    f"re-prompting the rest")
+        return carried
+
+    def _close_to_synthesis(self, responses: List[Dict[str, Any]], synthesis: Dict[str, Any]) -> List[int]:
+        """Indices of responses the arbiter adopted, by ranking or by similarity to the synthesis."""
+        if not responses:
+            return []
+        ranking = synthesis.get("ranking") or []
+        ranked = [rid for rid in ranking if any(r.get("id") == rid for r in responses)]
+        if ranked:
+            top = set(ranked[:(len(ranked) + 1) // 2])
+            return [i for i, r in enumerate(responses) if r.get("id") in top]
+
+        text = synthesis.get("synthesis", "") or ""
+        chosen = synthesis.get("chosen_response_id")
+        with_embeddings = [i for i, r in enumerate(responses) if r.get("embedding") is not None]
+        # Outliers were detected over the previous iteration's embedded responses; match them by id
+        outlier_ids = {str(rid) for rid in synthesis.get("outlier_response_ids", []) or []}
+        outliers = {i for i, r in enumerate(responses) if str(r.get("response_id")) in outlier_ids}
+
+        if with_embeddings and len(with_embeddings) == len(responses):
+            try:
+                target = self.get_embedding_service().embed(text)
+                vectors = ResponseGeometry([r["embedding"] for r in responses] + [target])
+                scores = vectors.similarity[-1, :-1]
+            except Exception as e:
+                logger.warning(f"Could not embed the synthesis for targeted refinement: {e}")
+                scores = None
+        else:
+            scores = None
+        if scores is None:
+            normalized = [normalize_answer(r.get("response", "")) for r in responses]
+            target = normalize_answer(text)
+            size = auto_shingle_size([len(target)] + [len(norm) for norm in normalized])
+            target_shingles = frozenset(shingle_hashes(target, size).tolist())
+            scores = [dice(frozenset(shingle_hashes(norm, size).tolist()), target_shingles) for norm in normalized]
+
+        return [
+            i for i, r in enumerate(responses)
+            if i not in outliers and (
+                (chosen is not None and str(r.get("response_id")) == str(chosen))
+                or scores[i] >= self.config.refinement_threshold
+            )
+        ]
+
+    def _sampling_waves(self, tasks: List[Any], instance_of) -> List[List[Any]]:
+        """Split tasks into waves when the strategy samples sequentially.
+
+        Tasks are ordered by instance number first, so every wave draws from
+        each model in turn rather than exhausting one model's instances.
+        """
+        wave_size = self.strategy.sampling_wave_size()
+        if not wave_size or wave_size >= len(tasks):
+            return [tasks]
+        ordered = sorted(tasks, key=instance_of)
+        return [ordered[start:start + wave_size] for start in range(0, len(ordered), wave_size)]
+
+    def _sampling_settled(self, responses: List[Dict[str, Any]], iteration: int, total: int) -> bool:
+        valid = [r for r in responses if r.get('error') is None]
+        if not self.strategy.sampling_settled(valid, iteration):
+            return False
+        logger.info(f"Sampling settled after {len(responses)}/{total} instances; "
+                    f"skipping the remaining {total - len(responses)}")
+        return True
+
     def _get_single_model_response_manual(self, model_id: str, prompt: str, instance: int, iteration: int) -> Dict[str, Any]:
         try:
             model = llm.get_model(model_id)
@@ -235,8 +405,11 @@ class ConsortiumOrchestrator:
             # Delegate prompt formulation entirely to strategy to maximize cache hits
             strategy_prompt = self.strategy.prepare_iteration_prompt(model_id, instance, prompt, iteration)
             full_prompt += strategy_prompt
-            response = model.prompt(full_prompt, system=instance_system_prompt)
+            started = time.monotonic()
+            response = model.prompt(full_prompt, system=instance_system_prompt,
+                                    **self._revision_options(model, iteration))
             text = response.text()
+            latency = time.monotonic() - started
             
             confidence = 0.5
             conf_match = re.search(r"<confidence>([\d.]+)</confidence>", text)
@@ -254,6 +427,8 @@ class ConsortiumOrchestrator:
                 "confidence": confidence,
                 "id": uuid.uuid4().int % 1000000,
                 "response_id": str(getattr(response, 'id', uuid.uuid4())),
+                "latency": latency,
+                **_token_usage(response),
             }
             
             if hasattr(response, 'id') and self.consortium_id:
@@ -267,6 +442,7 @@ class ConsortiumOrchestrator:
 
     def _orchestrate_automatic(self, prompt: str, conversation_history: Optional[str] = None, consortium_id: Optional[str] = None) -> Dict[str, Any]:
         self.iteration_history = []
+        self._primed_arbiter_conversation = None
         
         self.strategy.initialize_state()
         
@@ -310,12 +486,16 @@ class ConsortiumOrchestrator:
 
         for iteration in range(1, self.max_iterations + 1):
             logger.info(f"Starting iteration {iteration}")
+            self._iteration_geometry = None
+            self._iteration_features = None
             
             available_models = {task["model_id"]: 1 for task in model_tasks}
             selected_models = self.strategy.select_models(available_models, prompt, iteration)
             
-            responses = self._get_model_responses_automatic(prompt, model_tasks, selected_models, iteration)
-            responses = self.strategy.process_responses(responses, iteration)
+            carried = self._carry_forward(selected_models, iteration)
+            skip = self.strategy.excluded_instances() | {(r["model"], r["instance"]) for r in carried}
+            responses = self._get_model_responses_automatic(prompt, model_tasks, selected_models, iteration, skip=skip)
+            responses = self.strategy.process_responses(carried + responses, iteration)
             
             valid_responses = [r for r in responses if r.get('error') is None]
             if not valid_responses:
@@ -328,15 +508,18 @@ class ConsortiumOrchestrator:
             iteration_data = {
                 "iteration": iteration,
                 "selected_models": selected_models,
+                "carried_forward": len(carried),
                 "model_responses": responses,
                 "synthesis": synthesis_result
             }
+            self._record_token_usage(iteration_data)
             self.iteration_history.append(iteration_data)
             
             context = IterationContext(synthesis=synthesis_result, model_responses=responses)
             self.strategy.update_state(context)
+            needs_iteration = synthesis_result.get('needs_iteration', False) or self.strategy.needs_iteration(context)
             
-            if not synthesis_result.get('needs_iteration', False) and iteration >= self.minimum_iterations:
+            if not needs_iteration and iteration >= self.minimum_iterations:
                 if synthesis_result.get('confidence', 0) >= self.confidence_threshold:
                     logger.info(f"Conversation converged at iteration {iteration} with confidence {synthesis_result.get('confidence')}")
                     break
@@ -363,33 +546,72 @@ class ConsortiumOrchestrator:
         return final_result
 
     def _get_model_responses_automatic(self, prompt: str, tasks: List[Dict[str, Any]], 
-                                     selected_models: Dict[str, int], iteration_idx: int) -> List[Dict[str, Any]]:
+                                     selected_models: Dict[str, int], iteration_idx: int,
+                                     skip: Optional[Set[Tuple[str, int]]] = None) -> List[Dict[str, Any]]:
+        skip = skip or set()
         responses = []
-        active_tasks = [t for t in tasks if t["model_id"] in selected_models]
+        active_tasks = [
+            t for t in tasks
+            if t["model_id"] in selected_models and (t["model_id"], t["instance"]) not in skip
+        ]
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(active_tasks) or 1, 10)) as executor:
-            future_to_task = {}
-            for task in active_tasks:
-                 # Always delegate so iteration 1 and >1 share the same cached prefix
-                 iter_prompt = self.strategy.prepare_iteration_prompt(
-                     task["model_id"], task["instance"], prompt, iteration_idx
-                 )
-
-                 future = executor.submit(self._get_single_response_automatic, task, iter_prompt, iteration_idx)
-                 future_to_task[future] = task
-
-            for future in concurrent.futures.as_completed(future_to_task):
-                try:
-                    responses.append(future.result())
-                except Exception as e:
-                    task = future_to_task[future]
-                    responses.append({
-                        "model": task["model_id"],
-                        "instance": task["instance"],
-                        "error": str(e)
-                    })
+        for wave_index, wave in enumerate(self._sampling_waves(active_tasks, lambda task: task["instance"])):
+            if wave_index and self._sampling_settled(responses, iteration_idx, len(active_tasks)):
+                break
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(wave) or 1, 10)) as executor:
+                future_to_task = {}
+                for task in wave:
+                     # Always delegate so iteration 1 and >1 share the same cached prefix
+                     iter_prompt = self.strategy.prepare_iteration_prompt(
+                         task["model_id"], task["instance"], prompt, iteration_idx
+                     )
+
+                     future = executor.submit(self._get_single_response_automatic, task, iter_prompt, iteration_idx)
+                     future_to_task[future] = task
+
+                for future in concurrent.futures.as_completed(future_to_task):
+                    try:
+                        responses.append(future.result())
+                    except Exception as e:
+                        task = future_to_task[future]
+                        responses.append({
+                            "model": task["model_id"],
+                            "instance": task["instance"],
+                            "error": str(e)
+                        })
         return responses
 
+    def _revision_options(self, model: Any, iteration: int) -> Dict[str, int]:
+        """``max_tokens`` for revision turns (iteration > 1), when ``revision_max_tokens`` is set
+        and the model accepts a max-tokens option."""
+        limit = self.config.revision_max_tokens
+        if not limit or iteration == 1:
+            return {}
+        fields = getattr(getattr(model, "Options", None), "model_fields", None)
+        if not isinstance(fields, dict):
+            return {}
+        for option in ("max_tokens", "max_output_tokens"):
+            if option in fields:
+                return {option: limit}
+        return {}
+
+    def _record_token_usage(self, iteration_data: Dict[str, Any]) -> None:
+        """Sum the member tokens of a new iteration and log the change from the previous one.
+
+        Carried-forward responses were not called again and are not counted.
+        """
+        called = [r for r in iteration_data["model_responses"] if not r.get("carried_forward")]
+        usage = {key: sum(r.get(key) or 0 for r in called) for key in ("input_tokens", "output_tokens")}
+        iteration_data["token_usage"] = usage
+        previous = self.iteration_history[-1].get("token_usage") if self.iteration_history else None
+        if previous:
+            changes = ", ".join(
+                f"{key.split('_')[0]} {previous[key]} -> {usage[key]}"
+                + (f" ({(1 - usage[key] / previous[key]) * 100:.1f}% fewer)" if previous[key] else "")
+                for key in usage
+            )
+            logger.info(f"Member tokens iteration {iteration_data['iteration']}: {changes}")
+
     def _get_single_response_automatic(self, task: Dict[str, Any], prompt: str, iteration: int) -> Dict[str, Any]:
         try:
             model_id = task["model_id"]
@@ -405,8 +627,11 @@ class ConsortiumOrchestrator:
 
 {prompt}"""
             
-            response = conversation.prompt(full_prompt, system=instance_system_prompt)
+            started = time.monotonic()
+            response = conversation.prompt(full_prompt, system=instance_system_prompt,
+                                           **self._revision_options(getattr(conversation, 'model', None), iteration))
             text = response.text()
+            latency = time.monotonic() - started
             
             rid = hash(f"{model_id}_{task['instance']}_{iteration}") % 1000
 
@@ -417,6 +642,8 @@ class ConsortiumOrchestrator:
                 "confidence": 0.5,
                 "id": rid,
                 "response_id": str(getattr(response, 'id', rid)),
+                "latency": latency,
+                **_token_usage(response),
             }
             
             if hasattr(response, 'id') and self.consortium_id:
@@ -430,6 +657,11 @@ class ConsortiumOrchestrator:
 
     def _synthesize_responses_manual(self, prompt: str, responses: List[Dict[str, Any]], 
                                    history: List[Dict[str, Any]], iteration: int) -> Dict[str, Any]:
+        if self.judging_method == 'json':
+            json_result = self._synthesize_json(prompt, responses, iteration)
+            if json_result is not None:
+                return json_result
+
         if not self.arbiter:
              return {
                  "synthesis": responses[0].get("response", ""),
@@ -443,7 +675,10 @@ class ConsortiumOrchestrator:
                   "centroid_vector": None,
              }
 
-        arbiter_prompt = self._prepare_arbiter_prompt(prompt, responses, history)
+        arbiter_inputs = self._arbiter_inputs(prompt, responses, history, iteration)
+        arbiter_prompt = self._prepare_arbiter_prompt(prompt, arbiter_inputs, history)
+        if self._ensemble_arbiters():
+            return self._synthesize_with_ensemble(arbiter_prompt, arbiter_inputs, responses, iteration)
         arbiter_model = llm.get_model(self.arbiter)
         
         response = arbiter_model.prompt(arbiter_prompt, stream=False)
@@ -457,7 +692,9 @@ class ConsortiumOrchestrator:
             if self.judging_method == 'rank':
                 parsed_result = self._parse_rank_response(raw_arbiter_text, responses)
             else:
-                parsed_result = self._parse_arbiter_response(raw_arbiter_text, responses=responses)
+                parsed_result = self._parse_arbiter_response(raw_arbiter_text, responses=arbiter_inputs)
+            if self._groups_members(arbiter_inputs):
+                parsed_result = self._expand_member_ranking(parsed_result, arbiter_inputs, responses)
             
             parsed_result = self._enrich_with_geometry(parsed_result, responses)
             parsed_result['raw_arbiter_response'] = raw_arbiter_text
@@ -490,6 +727,11 @@ class ConsortiumOrchestrator:
 
     def _synthesize_responses_automatic(self, prompt: str, valid_responses: List[Dict[str, Any]], 
                                       history: List[Dict[str, Any]], iteration: int) -> Dict[str, Any]:
+        if self.judging_method == 'json':
+            json_result = self._synthesize_json(prompt, valid_responses, iteration)
+            if json_result is not None:
+                return json_result
+
         if not self.arbiter:
              return {
                  "synthesis": valid_responses[0].get("response", ""),
@@ -501,15 +743,29 @@ class ConsortiumOrchestrator:
                   "centroid_vector": None,
              }
 
+        arbiter_inputs = self._arbiter_inputs(prompt, valid_responses, history, iteration)
+        arbiter_prompt = self._prepare_arbiter_prompt(prompt, arbiter_inputs, history)
+        if self._ensemble_arbiters():
+            # Ensemble arbiters answer independently, outside the arbiter conversation
+            return self._synthesize_with_ensemble(arbiter_prompt, arbiter_inputs, valid_responses, iteration)
+
         arbiter_model = llm.get_model(self.arbiter)
         arbiter_conversation = self._get_arbiter_conversation()
         if arbiter_conversation is None:
             arbiter_conversation = arbiter_model.conversation()
-        
-        arbiter_prompt = self._prepare_arbiter_prompt(prompt, valid_responses, history)
-        
+
+        primed = arbiter_conversation is self._primed_arbiter_conversation
+        if primed:
+            # The conversation already holds the instructions, the original prompt and
+            # every earlier synthesis; send only this iteration's responses and focus
+            full_tokens = estimate_tokens(arbiter_prompt)
+            arbiter_prompt = self._prepare_lean_arbiter_prompt(prompt, arbiter_inputs, history)
+            self._log_token_efficiency(iteration, full_tokens, estimate_tokens(arbiter_prompt))
+
         arbiter_response = arbiter_conversation.prompt(arbiter_prompt, stream=False)
         raw_arbiter_text = arbiter_response.text()
+        if not primed:
+            self._primed_arbiter_conversation = arbiter_conversation
         log_response(arbiter_response, self.arbiter, self.consortium_id)
         
         if hasattr(arbiter_response, 'id') and self.consortium_id:
@@ -519,7 +775,9 @@ class ConsortiumOrchestrator:
             if self.judging_method == 'rank':
                 parsed_result = self._parse_rank_response(raw_arbiter_text, valid_responses)
             else:
-                parsed_result = self._parse_arbiter_response(raw_arbiter_text, responses=valid_responses)
+                parsed_result = self._parse_arbiter_response(raw_arbiter_text, responses=arbiter_inputs)
+            if self._groups_members(arbiter_inputs):
+                parsed_result = self._expand_member_ranking(parsed_result, arbiter_inputs, valid_responses)
             
             parsed_result = self._enrich_with_geometry(parsed_result, valid_responses)
             parsed_result['raw_arbiter_response'] = raw_arbiter_text
@@ -550,28 +808,609 @@ class ConsortiumOrchestrator:
                 "raw_arbiter_response": raw_arbiter_text
             }
 
+    def _prepare_lean_arbiter_prompt(self, prompt: str, responses: List[Dict[str, Any]],
+                                     history: List[Dict[str, Any]]) -> str:
+        """Arbiter prompt for a conversation that has already seen the full one.
+
+        Rank judging resends its (history-free) ranking instructions; otherwise
+        only the new responses and the refinement focus are sent.
+        """
+        formatted_responses = self._format_responses(responses)
+        if self.judging_method == 'rank':
+            template = _read_lean_rank_prompt() or (
+                "Original prompt: {original_prompt}\nModel responses:\n{formatted_responses}\n"
+                'Rank the responses as <ranking><rank position="1">ID</rank>...</ranking>.'
+            )
+            return template.format(original_prompt=prompt, formatted_responses=formatted_responses)
+
+        template = _read_lean_arbiter_prompt() or (
+            "New model responses:\n{formatted_responses}\nFocus: {iteration_focus}\n"
+            "Provide an updated synthesis in the same format as before."
+        )
+        return template.format(formatted_responses=formatted_responses,
+                               iteration_focus=self._iteration_focus(history))
+
+    def _iteration_focus(self, history: List[Dict[str, Any]]) -> str:
+        """Short refinement brief built from the previous synthesis."""
+        previous = history[-1].get("synthesis", {}) if history else {}
+        confidence = previous.get("confidence", 0.0) or 0.0
+        areas = previous.get("refinement_areas") or []
+        if confidence >= self.confidence_threshold:
+            return f"Previous confidence {confidence:.2f}. Fine-tuning and polishing."
+        if confidence >= 0.6:
+            return f"Previous confidence {confidence:.2f}. Address: {', '.join(areas[:2] or ['quality improvement'])}."
+        return (f"Previous confidence {confidence:.2f}. Major improvements needed: "
+                f"{', '.join(areas[:3] or ['overall accuracy and completeness'])}.")
+
+    @staticmethod
+    def _log_token_efficiency(iteration: int, full_tokens: int, lean_tokens: int) -> None:
+        """Log the arbiter prompt tokens saved by the lean template."""
+        if full_tokens > 0:
+            savings_pct = (1 - lean_tokens / full_tokens) * 100
+            logger.info(f"Arbiter prompt iteration {iteration}: {savings_pct:.1f}% fewer tokens "
+                        f"with the lean template ({full_tokens} -> {lean_tokens})")
+
+    def _ensemble_arbiters(self) -> List[str]:
+        """Arbiter models judging in parallel; empty unless an ensemble is configured."""
+        models = list(dict.fromkeys(([self.arbiter] if self.arbiter else []) + list(self.config.arbiter_ensemble)))
+        return models if len(models) > 1 else []
+
+    def _parse_arbiter_text(self, text: str, arbiter_inputs: List[Dict[str, Any]],
+                            responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Parse one arbiter answer, raising ValueError when it is unusable.
+
+        Rankings are resolved against the original ``responses`` so that rank
+        judging returns the uncompacted, untruncated text of the top response.
+        """
+        if self.judging_method == 'rank':
+            return self._parse_rank_response(text, responses)
+        if not re.search(r"<synthesis>", text, re.IGNORECASE):
+            raise ValueError("Could not find a <synthesis> tag.")
+        return self._parse_arbiter_response(text, responses=arbiter_inputs)
+
+    def _synthesize_with_ensemble(self, arbiter_prompt: str, arbiter_inputs: List[Dict[str, Any]],
+                                  responses: List[Dict[str, Any]], iteration: int) -> Dict[str, Any]:
+        """Prompt every ensemble arbiter in parallel and merge the first ``arbiter_quorum`` that parse.
+
+        Slower arbiters are not waited for, and an arbiter that fails or returns
+        an unparseable answer is skipped instead of failing the iteration.
+        """
+        models = self._ensemble_arbiters()
+        quorum = min(self.config.arbiter_quorum or len(models) // 2 + 1, len(models))
+        decisions = []
+        failures = []
+
+        def judge(model_id: str):
+            # Responses are lazy; text() makes the request, so it must run in the worker
+            response = llm.get_model(model_id).prompt(arbiter_prompt, stream=False)
+            return response, response.text()
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(models))
+        future_to_model = {executor.submit(judge, model_id): model_id for model_id in models}
+        try:
+            for future in concurrent.futures.as_completed(future_to_model):
+                model_id = future_to_model[future]
+                try:
+                    response, raw_text = future.result()
+                    log_response(response, model_id, self.consortium_id)
+                    parsed = self._parse_arbiter_text(raw_text, arbiter_inputs, responses)
+                except Exception as e:
+                    logger.warning(f"Ensemble arbiter {model_id} failed: {e}")
+                    failures.append(model_id)
+                    continue
+                parsed['raw_arbiter_response'] = raw_text
+                decisions.append((model_id, response, parsed))
+                if hasattr(response, 'id') and self.consortium_id:
+                    save_consortium_member(str(self.consortium_id), str(response.id), 'arbiter', iteration,
+                                           models.index(model_id))
+                    save_arbiter_decision(str(self.consortium_id), iteration, str(response.id), parsed,
+                                          self.judging_method, node=f"ensemble:{model_id}")
+                if len(decisions) >= quorum:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if not decisions:
+            logger.error(f"No ensemble arbiter produced a parseable decision ({', '.join(failures)})")
+            return {
+                "synthesis": "",
+                "confidence": 0.0,
+                "analysis": "Parsing failed - no ensemble arbiter produced a parseable decision",
+                "dissent": "",
+                "needs_iteration": False,
+                "refinement_areas": [],
+                "geometric_confidence": 0.0,
+                "centroid_vector": None,
+                "raw_arbiter_response": "",
+            }
+        if len(decisions) < quorum:
+            logger.warning(f"Arbiter quorum not reached ({len(decisions)}/{quorum}); merging available decisions")
+
+        parsed_result = self._merge_arbiter_decisions([parsed for _, _, parsed in decisions], responses)
+        parsed_result["arbiter_ensemble"] = {
+            "models": [model_id for model_id, _, _ in decisions],
+            "confidences": [parsed.get("confidence", 0.0) for _, _, parsed in decisions],
+            "failed": failures,
+            "quorum": quorum,
+        }
+        if self._groups_members(arbiter_inputs):
+            parsed_result = self._expand_member_ranking(parsed_result, arbiter_inputs, responses)
+        parsed_result = self._enrich_with_geometry(parsed_result, responses)
+
+        response = decisions[0][1]
+        if hasattr(response, 'id') and self.consortium_id:
+            save_arbiter_decision(
+                str(self.consortium_id),
+                iteration,
+                str(response.id),
+                parsed_result,
+                self.judging_method,
+                geometric_confidence=parsed_result.get('geometric_confidence'),
+                centroid_vector=parsed_result.get('centroid_vector'),
+            )
+        return parsed_result
+
+    @staticmethod
+    def _borda_ranking(rankings: List[List[Any]]) -> List[Any]:
+        """Borda count: in a ranking of n ids, position p scores n - 1 - p; ties keep first-seen order."""
+        points: Dict[Any, int] = {}
+        for ranking in rankings:
+            for position, rid in enumerate(ranking):
+                points[rid] = points.get(rid, 0) + len(ranking) - 1 - position
+        return sorted(points, key=lambda rid: -points[rid])
+
+    def _merge_arbiter_decisions(self, decisions: List[Dict[str, Any]],
+                                 responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge ensemble decisions: mean confidence, Borda ranking, majority needs_iteration.
+
+        The synthesis, analysis and dissent come from the most confident arbiter;
+        with rank judging the synthesis is the top response of the merged ranking.
+        """
+        lead = max(decisions, key=lambda parsed: parsed.get("confidence", 0.0))
+        merged = dict(lead)
+        merged["confidence"] = sum(parsed.get("confidence", 0.0) for parsed in decisions) / len(decisions)
+        merged["needs_iteration"] = sum(bool(parsed.get("needs_iteration")) for parsed in decisions) * 2 > len(decisions)
+        merged["refinement_areas"] = list(dict.fromkeys(
+            area for parsed in decisions for area in parsed.get("refinement_areas", [])
+        ))
+
+        ranking = self._borda_ranking([parsed.get("ranking") or [] for parsed in decisions])
+        merged["ranking"] = ranking
+        top = next((r for r in responses if ranking and r.get("id") == ranking[0]), None)
+        merged["chosen_response_id"] = top.get("response_id") if top else None
+        if self.judging_method == 'rank' and top:
+            merged["synthesis"] = top.get("response", "")
+            merged["analysis"] = f"Top: #{ranking[0]} ({top.get('model', 'unknown')}). Borda ranking: {ranking}"
+        return merged
+
+    def _synthesize_json(self, prompt: str, responses: List[Dict[str, Any]], iteration: int) -> Optional[Dict[str, Any]]:
+        """Field-level consensus over JSON member answers; the arbiter only sees disputed fields.
+
+        Returns None when no member produced usable JSON so the caller can fall
+        back to a regular arbiter synthesis.
+        """
+        schema = getattr(self.config, 'json_schema', None)
+        consensus, indices = build_consensus([r.get("response", "") for r in responses], schema)
+        if not consensus.documents:
+            logger.warning("JSON judging: no member response parsed as JSON; falling back to arbiter synthesis")
+            return None
+
+        stats = consensus.stats()
+        logger.info(
+            f"JSON consensus iteration {iteration}: {stats['consensus_fields']}/{stats['fields']} fields agreed "
+            f"across {consensus.documents}/{len(responses)} documents; disputed: {stats['unresolved_fields'] or 'none'}"
+        )
+
+        decision_id = f"json-consensus-{iteration}"
+        raw_arbiter_text = ""
+        if consensus.unresolved and self.arbiter:
+            decision_id, raw_arbiter_text = self._resolve_json_fields(prompt, consensus, iteration)
+        elif consensus.unresolved:
+            logger.info("JSON judging without an arbiter: keeping the plurality value for disputed fields")
+
+        parsed_result = {
+            "synthesis": json.dumps(consensus.document, indent=2, ensure_ascii=False),
+            "confidence": consensus.confidence,
+            "analysis": (
+                f"Merged {consensus.documents} JSON documents: {stats['consensus_fields']} of {stats['fields']} "
+                f"fields reached consensus; arbiter resolved {len(stats['unresolved_fields']) - len(consensus.unresolved)}."
+            ),
+            "dissent": "",
+            "needs_iteration": False,
+            "refinement_areas": [f"Disputed field: {path}" for path in stats["unresolved_fields"]],
+            "ranking": [responses[index].get("id") for index in indices],
+            "chosen_response_id": None,
+            "json_consensus": stats,
+        }
+        parsed_result = self._enrich_with_geometry(parsed_result, responses)
+        parsed_result["raw_arbiter_response"] = raw_arbiter_text
+
+        if self.consortium_id:
+            save_arbiter_decision(
+                str(self.consortium_id),
+                iteration,
+                decision_id,
+                parsed_result,
+                self.judging_method,
+                geometric_confidence=parsed_result.get('geometric_confidence'),
+                centroid_vector=parsed_result.get('centroid_vector'),
+            )
+        return parsed_result
+
+    def _resolve_json_fields(self, prompt: str, consensus: JsonConsensus, iteration: int):
+        """Ask the arbiter to decide only the disputed fields; returns (decision id, raw text)."""
+        disputed = "\n".join(
+            f"{path}: " + " | ".join(json.dumps(value, ensure_ascii=False) for value in values)
+            for path, values in consensus.unresolved.items()
+        )
+        template = _read_json_field_prompt() or (
+            "Original prompt: {original_prompt}\nMerged JSON:\n{merged_document}\n"
+            "Disputed fields:\n{disputed_fields}\nReturn a JSON object mapping each disputed path to its value."
+        )
+        field_prompt = template.format(
+            original_prompt=prompt,
+            merged_document=json.dumps(consensus.document, indent=2, ensure_ascii=False),
+            disputed_fields=disputed,
+            user_instructions=self.system_prompt or "",
+        )
+
+        response = llm.get_model(self.arbiter).prompt(field_prompt, stream=False)
+        raw_text = response.text()
+        log_response(response, self.arbiter, self.consortium_id)
+        if hasattr(response, 'id') and self.consortium_id:
+            save_consortium_member(str(self.consortium_id), str(response.id), 'arbiter', iteration, 0)
+
+        decisions = parse_json_response(raw_text)
+        if isinstance(decisions, dict):
+            consensus.resolve(decisions)
+        else:
+            logger.warning("JSON judging: arbiter field decisions were not a JSON object; keeping plurality values")
+        return str(getattr(response, 'id', f"json-consensus-{iteration}")), raw_text
+
     def _enrich_with_geometry(self, parsed_result: Dict[str, Any], responses: List[Dict[str, Any]]) -> Dict[str, Any]:
-        embeddings = [response.get("embedding") for response in responses if response.get("embedding") is not None]
+        embedded = [response for response in responses if response.get("embedding") is not None]
+        embeddings = [response["embedding"] for response in embedded]
         if not embeddings:
             parsed_result.setdefault("geometric_confidence", 0.0)
             parsed_result.setdefault("centroid_vector", None)
             return parsed_result
 
-        confidence, centroid = GeometricConfidenceCalculator.compute(embeddings)
+        geometry = self.get_response_geometry(embeddings)
+        confidence, centroid = GeometricConfidenceCalculator.compute(embeddings, geometry=geometry)
         parsed_result["geometric_confidence"] = confidence
         parsed_result["centroid_vector"] = centroid.tolist()
-        parsed_result["outlier_indices"] = GeometricConfidenceCalculator.detect_outliers(embeddings)
+        parsed_result["outlier_indices"] = GeometricConfidenceCalculator.detect_outliers(embeddings, geometry=geometry)
+        parsed_result["outlier_response_ids"] = [
+            embedded[i].get("response_id") for i in parsed_result["outlier_indices"]
+            if embedded[i].get("response_id") is not None
+        ]
         return parsed_result
 
-    def _prepare_arbiter_prompt(self, prompt: str, responses: List[Dict[str, Any]], 
-                               history: List[Dict[str, Any]]) -> str:
+    def _arbiter_inputs(self, prompt: str, responses: List[Dict[str, Any]],
+                        history: List[Dict[str, Any]], iteration: int) -> List[Dict[str, Any]]:
+        """What the final arbiter call sees: the responses that pass screening, compacted
+        to the per-response token budget, or their partial syntheses when judging
+        hierarchically."""
+        responses = self._dedupe_responses(responses)
+        responses = self._screen_responses(prompt, responses, iteration)
+        responses = self._select_diverse(responses, iteration)
+        responses = self._compact_responses(prompt, responses, iteration)
+        if self.judging_method != 'hierarchical' or len(responses) <= self.config.arbiter_group_size:
+            return responses
+        return self._reduce_hierarchically(prompt, responses, history, iteration)
+
+    @staticmethod
+    def _groups_members(arbiter_inputs: List[Dict[str, Any]]) -> bool:
+        """True when some arbiter input stands for several members (deduplicated or partial syntheses)."""
+        return any("members" in item for item in arbiter_inputs)
+
+    def _dedupe_responses(self, responses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Collapse responses whose normalized text is identical into one entry.
+
+        Each collapsed entry is a copy of the first such response carrying the
+        ``members`` it stands for and the other ``duplicates``; responses without
+        a duplicate are returned unchanged.
+        """
+        if not self.config.dedupe_responses or len(responses) < 2:
+            return responses
+        normalized = self.get_iteration_features().normalized([r.get("response", "") for r in responses])
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for r, text in zip(responses, normalized):
+            groups.setdefault(hashlib.sha256(text.encode("utf-8")).hexdigest(), []).append(r)
+        if len(groups) == len(responses):
+            return responses
+
+        deduped = []
+        for group in groups.values():
+            if len(group) == 1:
+                deduped.append(group[0])
+                continue
+            entry = dict(group[0])
+            entry["members"] = [r.get("id") for r in group]
+            entry["duplicates"] = group[1:]
+            deduped.append(entry)
+        logger.info(f"Collapsed {len(responses)} responses into {len(deduped)} distinct answers")
+        return deduped
+
+    def _screen_responses(self, prompt: str, responses: List[Dict[str, Any]], iteration: int) -> List[Dict[str, Any]]:
+        """Score responses with the ``pre_arbiter`` model and keep those worth the arbiter's time.
+
+        Responses are scored in parallel batches of ``pre_arbiter_batch_size``.
+        A response scored below ``pre_arbiter_min_score``, or outside the
+        ``pre_arbiter_top_k`` best, is dropped. Unscored responses (a failed or
+        unparseable screening call) are always kept, and at least one response
+        is always forwarded. Scores are recorded as ``screening_score``.
+        """
+        if not self.config.pre_arbiter or len(responses) < 2:
+            return responses
+
+        size = self.config.pre_arbiter_batch_size
+        batches = [responses[start:start + size] for start in range(0, len(responses), size)]
+        scores: Dict[Any, float] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(batches), 10)) as executor:
+            for batch_scores in executor.map(lambda batch: self._screen_batch(prompt, batch, iteration), batches):
+                scores.update(batch_scores)
+
+        for r in responses:
+            r["screening_score"] = scores.get(r.get("id"))
+            for duplicate in r.get("duplicates", []):
+                duplicate["screening_score"] = r["screening_score"]
+        scored = sorted((r for r in responses if r["screening_score"] is not None),
+                        key=lambda r: r["screening_score"], reverse=True)
+        passing = scored
+        if self.config.pre_arbiter_min_score is not None:
+            passing = [r for r in passing if r["screening_score"] >= self.config.pre_arbiter_min_score]
+        if self.config.pre_arbiter_top_k is not None:
+            passing = passing[:self.config.pre_arbiter_top_k]
+        if scored and not passing and len(scored) == len(responses):
+            passing = scored[:1]
+
+        dropped = {id(r) for r in scored} - {id(r) for r in passing}
+        kept = [r for r in responses if id(r) not in dropped]
+
+        if self.consortium_id:
+            save_screening_scores(str(self.consortium_id), {
+                member["response_id"]: r["screening_score"]
+                for r in scored for member in [r] + r.get("duplicates", []) if member.get("response_id")
+            })
+        logger.info(f"Pre-arbiter screening iteration {iteration}: forwarding {len(kept)}/{len(responses)} responses")
+        return kept
+
+    def _response_similarity(self, responses: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, Optional[ResponseGeometry]]:
+        """Pairwise similarity, relevance to the consensus and (with embeddings) the geometry of ``responses``.
+
+        Uses the responses' embeddings, or embeds them when an embedding backend
+        is configured; otherwise falls back to lexical shingle similarity, where
+        relevance is a response's mean similarity to the others.
+        """
+        embeddings = [r.get("embedding") for r in responses]
+        if any(vector is None for vector in embeddings) and self.config.embedding_backend:
+            try:
+                embeddings = self.get_iteration_features().embeddings([r.get("response", "") for r in responses])
+            except Exception as e:
+                logger.warning(f"Could not embed responses for arbiter selection; using lexical similarity: {e}")
+        if all(vector is not None for vector in embeddings):
+            geometry = self.get_response_geometry(list(embeddings))
+            return geometry.similarity, 1.0 - 2.0 * geometry.distances_to_centroid(), geometry
+
+        normalized = self.get_iteration_features().normalized([r.get("response", "") for r in responses])
+        similarity = similarity_matrix(normalized)
+        relevance = (similarity.sum(axis=1) - 1.0) / max(len(responses) - 1, 1)
+        return similarity, relevance, None
+
+    def _select_diverse(self, responses: List[Dict[str, Any]], iteration: int) -> List[Dict[str, Any]]:
+        """Drop geometric outliers (``drop_outliers``) and cap the arbiter's input at ``arbiter_top_k``.
+
+        The cap keeps the responses chosen by maximal marginal relevance, so
+        each distinct viewpoint stays represented. Relevance is the screening
+        score when every response has one, otherwise similarity to the
+        consensus. The original response order is preserved.
+        """
+        top_k = self.config.arbiter_top_k
+        if len(responses) < 2 or not (self.config.drop_outliers or (top_k and len(responses) > top_k)):
+            return responses
+
+        similarity, relevance, geometry = self._response_similarity(responses)
+        keep = list(range(len(responses)))
+        if self.config.drop_outliers:
+            if geometry is None:
+                logger.warning("drop_outliers needs response embeddings; no outliers were dropped")
+            else:
+                outliers = set(GeometricConfidenceCalculator.detect_outliers(geometry.vectors, geometry=geometry))
+                keep = [i for i in keep if i not in outliers] or keep
+
+        if top_k and len(keep) > top_k:
+            scores = [r.get("screening_score") for r in responses]
+            if all(score is not None for score in scores):
+                relevance = np.asarray(scores, dtype=np.float64)
+            indices = np.asarray(keep)
+            picked = mmr_select(similarity[np.ix_(indices, indices)], relevance[indices], top_k, self.config.mmr_lambda)
+            keep = sorted(keep[i] for i in picked)
+
+        logger.info(f"Arbiter selection iteration {iteration}: forwarding {len(keep)}/{len(responses)} responses")
+        return [responses[i] for i in keep]
+
+    def _compact_responses(self, prompt: str, responses: List[Dict[str, Any]], iteration: int) -> List[Dict[str, Any]]:
+        """Shorten responses longer than ``arbiter_response_tokens`` before the arbiter reads them.
+
+        Over-budget responses are summarized in parallel by ``compaction_model``;
+        without one, or when a summary fails, the response is truncated at block
+        boundaries instead. Compacted entries are copies, so the full originals
+        are what the ``responses`` table and later iterations keep. The ratio of
+        compacted to original tokens is recorded as ``compaction_ratio``.
+        """
+        budget = self.config.arbiter_response_tokens
+        oversized = [r for r in responses if budget and estimate_tokens(r.get("response", "")) > budget]
+        if not oversized:
+            return responses
+
+        summaries: List[Optional[str]] = [None] * len(oversized)
+        if self.config.compaction_model:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(oversized), 10)) as executor:
+                summaries = list(executor.map(lambda r: self._summarize_response(prompt, r, iteration), oversized))
+
+        compacted = {}
+        for r, summary in zip(oversized, summaries):
+            original = r.get("response", "")
+            entry = dict(r)
+            entry["response"] = truncate_to_tokens(summary if summary else original, budget)
+            entry["compaction_ratio"] = estimate_tokens(entry["response"]) / estimate_tokens(original)
+            compacted[id(r)] = entry
+
+        if self.consortium_id:
+            save_compaction_ratios(str(self.consortium_id), {
+                member["response_id"]: entry["compaction_ratio"]
+                for r in oversized for entry in [compacted[id(r)]]
+                for member in [r] + r.get("duplicates", []) if member.get("response_id")
+            })
+        ratios = ", ".join(f"{entry.get('id')}: {entry['compaction_ratio']:.2f}" for entry in compacted.values())
+        logger.info(f"Arbiter compaction iteration {iteration}: compacted {len(compacted)}/{len(responses)} "
+                    f"responses to {budget} tokens (ratios {ratios})")
+        return [compacted.get(id(r), r) for r in responses]
+
+    def _summarize_response(self, prompt: str, response: Dict[str, Any], iteration: int) -> Optional[str]:
+        """A ``compaction_model`` summary of one response; None when the call fails."""
+        template = _read_compaction_prompt() or (
+            "Original prompt: {original_prompt}\nResponse:\n{response}\n"
+            "Condense this response to at most {token_budget} tokens, keeping its conclusions."
+        )
+        try:
+            result = llm.get_model(self.config.compaction_model).prompt(
+                template.format(original_prompt=prompt, response=response.get("response", ""),
+                                token_budget=self.config.arbiter_response_tokens),
+                stream=False,
+            )
+            text = result.text().strip()
+            log_response(result, self.config.compaction_model, self.consortium_id)
+            if hasattr(result, 'id') and self.consortium_id:
+                save_consortium_member(str(self.consortium_id), str(result.id), 'compactor', iteration, 0)
+        except Exception as e:
+            logger.warning(f"Compaction model failed; truncating response {response.get('id')} instead: {e}")
+            return None
+        return text or None
+
+    def _screen_batch(self, prompt: str, batch: List[Dict[str, Any]], iteration: int) -> Dict[Any, float]:
+        """Screening scores for one batch, keyed by response ``id``; empty when the call fails."""
+        template = _read_pre_arbiter_prompt() or (
+            "Original prompt: {original_prompt}\nModel responses:\n{formatted_responses}\n"
+            'Score each response from 0.0 to 1.0 as <score id="ID">SCORE</score>.'
+        )
+        try:
+            response = llm.get_model(self.config.pre_arbiter).prompt(
+                template.format(original_prompt=prompt, formatted_responses=self._format_responses(batch)),
+                stream=False,
+            )
+            text = response.text()
+            log_response(response, self.config.pre_arbiter, self.consortium_id)
+            if hasattr(response, 'id') and self.consortium_id:
+                save_consortium_member(str(self.consortium_id), str(response.id), 'pre_arbiter', iteration, 0)
+        except Exception as e:
+            logger.warning(f"Pre-arbiter screening failed; forwarding the batch unscored: {e}")
+            return {}
+
+        ids = {str(r.get("id")): r.get("id") for r in batch}
+        scores = {}
+        for rid, value in re.findall(r'<score id="([^"]+)">\s*([\d.]+)\s*</score>', text, re.IGNORECASE):
+            if rid in ids:
+                try:
+                    score = float(value)
+                except ValueError:
+                    continue
+                scores[ids[rid]] = score / 100 if score > 1 else score
+        return scores
+
+    def _reduce_hierarchically(self, prompt: str, responses: List[Dict[str, Any]],
+                               history: List[Dict[str, Any]], iteration: int) -> List[Dict[str, Any]]:
+        """Tree-reduce responses until one arbiter call can see every remaining partial synthesis.
+
+        Each level splits its inputs into groups of ``arbiter_group_size`` and
+        synthesizes the groups in parallel, so arbiter latency grows with the
+        number of levels (log N) rather than with N. Every partial keeps the
+        member response ids it covers, best first.
+        """
+        size = self.config.arbiter_group_size
+        items = [
+            {"id": r.get("id", i), "model": r.get("model", "unknown"), "response": r.get("response", ""),
+             "members": r.get("members", [r.get("id", i)])}
+            for i, r in enumerate(responses)
+        ]
+        level = 0
+        while len(items) > size:
+            level += 1
+            groups = [items[start:start + size] for start in range(0, len(items), size)]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(groups), 10)) as executor:
+                futures = [
+                    executor.submit(self._sub_arbitrate, prompt, group, history, iteration, f"L{level}.G{index}")
+                    for index, group in enumerate(groups)
+                ]
+                items = [dict(future.result(), id=index) for index, future in enumerate(futures)]
+            logger.info(f"Hierarchical judging iteration {iteration}: level {level} reduced "
+                        f"{sum(len(group) for group in groups)} inputs to {len(items)} partial syntheses")
+        return items
+
+    def _sub_arbitrate(self, prompt: str, group: List[Dict[str, Any]], history: List[Dict[str, Any]],
+                       iteration: int, node: str) -> Dict[str, Any]:
+        """Synthesize one group of a hierarchical reduction and record it as sub-decision ``node``."""
+        response = llm.get_model(self.arbiter).prompt(self._prepare_arbiter_prompt(prompt, group, history), stream=False)
+        raw_text = response.text()
+        log_response(response, self.arbiter, self.consortium_id)
+
+        parsed = self._parse_arbiter_response(raw_text, responses=group)
+        parsed["raw_arbiter_response"] = raw_text
+        if hasattr(response, 'id') and self.consortium_id:
+            save_consortium_member(str(self.consortium_id), str(response.id), 'arbiter', iteration, 0)
+            save_arbiter_decision(str(self.consortium_id), iteration, str(response.id), parsed,
+                                  self.judging_method, node=node)
+        return {
+            "model": f"sub-arbiter {node}",
+            "response": parsed.get("synthesis", raw_text),
+            "confidence": parsed.get("confidence", 0.0),
+            "members": self._members_by_rank(parsed.get("ranking") or [], group),
+            "node": node,
+        }
+
+    @staticmethod
+    def _members_by_rank(ranking: List[Any], items: List[Dict[str, Any]]) -> List[Any]:
+        """Member ids covered by ``items``, in the order ``ranking`` puts the items (unranked last)."""
+        ordered = [item for rid in ranking for item in items if item["id"] == rid]
+        ordered += [item for item in items if item not in ordered]
+        return [member for item in ordered for member in item.get("members", [item["id"]])]
+
+    def _expand_member_ranking(self, parsed_result: Dict[str, Any], arbiter_inputs: List[Dict[str, Any]],
+                               responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Map the arbiter's ranking of grouped inputs (partial syntheses or deduplicated
+        answers) back onto every member response they stand for."""
+        if any("node" in item for item in arbiter_inputs):
+            parsed_result["hierarchy"] = {
+                "nodes": [partial["node"] for partial in arbiter_inputs],
+                "partial_confidences": [partial["confidence"] for partial in arbiter_inputs],
+            }
+        parsed_result["chosen_response_id"] = None
+        if parsed_result.get("ranking"):
+            ranking = self._members_by_rank(parsed_result["ranking"], arbiter_inputs)
+            parsed_result["ranking"] = ranking
+            top = next((r for r in responses if r.get("id") == ranking[0]), None)
+            parsed_result["chosen_response_id"] = top.get("response_id") if top else None
+        return parsed_result
+
+    @staticmethod
+    def _format_responses(responses: List[Dict[str, Any]]) -> str:
         formatted_responses = ""
         for i, r in enumerate(responses):
             rid = r.get("id", i)
             model_name = r.get("model", "unknown")
             response_text = r.get("response", "")
+            if len(r.get("members", [])) > 1 and "node" not in r:
+                models = ", ".join(dict.fromkeys(d.get("model", "unknown") for d in [r] + r.get("duplicates", [])))
+                ids = ", ".join(str(member) for member in r["members"])
+                model_name = f"{models}; given by {len(r['members'])} members (ids {ids})"
             formatted_responses += f"--- RESPONSE {rid} (Model: {model_name}) ---\\n"
             formatted_responses += response_text + "\\n\\n"
+        return formatted_responses
+
+    def _prepare_arbiter_prompt(self, prompt: str, responses: List[Dict[str, Any]], 
+                               history: List[Dict[str, Any]]) -> str:
+        formatted_responses = self._format_responses(responses)
 
         formatted_history = ""
         for item in history:
@@ -674,7 +1513,24 @@ def create_consortium(models: Any, arbiter: Optional[str] = None,
                      strategy: str = "default", strategy_params: Optional[Dict[str, Any]] = None,
                      config_name: Optional[str] = None,
                      embedding_backend: Optional[str] = None,
-                     embedding_model: Optional[str] = None) -> ConsortiumOrchestrator:
+                     embedding_model: Optional[str] = None,
+                     json_schema: Optional[Dict[str, Any]] = None,
+                     arbiter_group_size: int = 5,
+                     arbiter_ensemble: Optional[List[str]] = None,
+                     arbiter_quorum: Optional[int] = None,
+                     pre_arbiter: Optional[str] = None,
+                     pre_arbiter_top_k: Optional[int] = None,
+                     pre_arbiter_min_score: Optional[float] = None,
+                     arbiter_top_k: Optional[int] = None,
+                     mmr_lambda: float = 0.5,
+                     drop_outliers: bool = False,
+                     dedupe_responses: bool = True,
+                     arbiter_response_tokens: Optional[int] = None,
+                     compaction_model: Optional[str] = None,
+                     refinement: str = "all",
+                     refinement_threshold: float = 0.8,
+                     iteration_prompt: str = "full",
+                     revision_max_tokens: Optional[int] = None) -> ConsortiumOrchestrator:
     
     from .models import parse_models
     
@@ -694,6 +1550,23 @@ def create_consortium(models: Any, arbiter: Optional[str] = None,
         strategy=strategy,
         strategy_params=strategy_params,
         embedding_backend=embedding_backend,
-        embedding_model=embedding_model
+        embedding_model=embedding_model,
+        json_schema=json_schema,
+        arbiter_group_size=arbiter_group_size,
+        arbiter_ensemble=arbiter_ensemble or [],
+        arbiter_quorum=arbiter_quorum,
+        pre_arbiter=pre_arbiter,
+        pre_arbiter_top_k=pre_arbiter_top_k,
+        pre_arbiter_min_score=pre_arbiter_min_score,
+        arbiter_top_k=arbiter_top_k,
+        mmr_lambda=mmr_lambda,
+        drop_outliers=drop_outliers,
+        dedupe_responses=dedupe_responses,
+        arbiter_response_tokens=arbiter_response_tokens,
+        compaction_model=compaction_model,
+        refinement=refinement,
+        refinement_threshold=refinement_threshold,
+        iteration_prompt=iteration_prompt,
+        revision_max_tokens=revision_max_tokens,
     )
     return ConsortiumOrchestrator(config, config_name=config_name)
@@ -0,0 +1,40 @@
+"""Diversity-preserving selection of the responses an arbiter reads.
+
+Maximal marginal relevance (MMR) picks responses one at a time, trading off
+relevance against redundancy with the responses already picked::
+
+    score(i) = lambda * relevance[i] - (1 - lambda) * max_j similarity[i, j]
+
+so a cap of ``k`` keeps one representative of each distinct viewpoint instead
+of ``k`` copies of the majority answer.
+"""
+from typing import List, Sequence
+
+import numpy as np
+
+
+def mmr_select(similarity: np.ndarray, relevance: Sequence[float], k: int, mmr_lambda: float = 0.5) -> List[int]:
+    """Indices of up to ``k`` items chosen by maximal marginal relevance, in selection order.
+
+    Args:
+        similarity: (N, N) pairwise similarity matrix.
+        relevance: Relevance of each item; the first pick is the most relevant.
+        k: Number of items to select.
+        mmr_lambda: 1.0 ranks by relevance only, 0.0 by novelty only.
+    """
+    relevance = np.asarray(relevance, dtype=np.float64)
+    count = relevance.size
+    if k >= count:
+        return list(range(count))
+    selected: List[int] = []
+    redundancy = np.full(count, -np.inf)
+    available = np.ones(count, dtype=bool)
+    for _ in range(max(k, 0)):
+        penalty = np.where(np.isfinite(redundancy), redundancy, 0.0)
+        scores = mmr_lambda * relevance - (1.0 - mmr_lambda) * penalty
+        scores[~available] = -np.inf
+        pick = int(np.argmax(scores))
+        selected.append(pick)
+        available[pick] = False
+        redundancy = np.maximum(redundancy, similarity[pick])
+    return selected
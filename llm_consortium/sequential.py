@@ -0,0 +1,50 @@
+"""Stopping rules for sequential self-consistency sampling.
+
+After each wave of samples, the share of responses agreeing with the leading
+answer is tested against a 50% majority:
+
+- ``wilson``: stop when the one-sided Wilson score lower bound of the leader's
+  share exceeds 0.5.
+- ``sprt``: Wald's sequential probability ratio test of H1 (share = ``p1``)
+  against H0 (share = 0.5); stop when the log-likelihood ratio crosses the
+  upper boundary ``log((1 - beta) / alpha)``.
+
+Neither rule ever stops on disagreement: an unsettled vote keeps sampling
+until the instance budget is spent.
+"""
+import math
+
+STOPPING_RULES = ("wilson", "sprt")
+
+
+def wilson_lower_bound(successes: int, trials: int, z: float = 1.645) -> float:
+    """Lower bound of the Wilson score interval for a binomial proportion."""
+    if trials <= 0:
+        return 0.0
+    share = successes / trials
+    z2 = z * z
+    centre = share + z2 / (2 * trials)
+    margin = z * math.sqrt(share * (1 - share) / trials + z2 / (4 * trials * trials))
+    return (centre - margin) / (1 + z2 / trials)
+
+
+def sprt_log_likelihood_ratio(successes: int, trials: int, p1: float, p0: float = 0.5) -> float:
+    """log L(p1) / L(p0) for ``successes`` out of ``trials`` Bernoulli observations."""
+    failures = trials - successes
+    return successes * math.log(p1 / p0) + failures * math.log((1 - p1) / (1 - p0))
+
+
+def sprt_upper_bound(alpha: float, beta: float) -> float:
+    return math.log((1 - beta) / alpha)
+
+
+def majority_settled(leader: int, trials: int, rule: str, z: float = 1.645, p1: float = 0.85,
+                     alpha: float = 0.05, beta: float = 0.2) -> bool:
+    """True when ``leader`` agreeing responses out of ``trials`` settle the majority under ``rule``."""
+    if trials <= 0:
+        return False
+    if rule == "wilson":
+        return wilson_lower_bound(leader, trials, z) > 0.5
+    if rule == "sprt":
+        return sprt_log_likelihood_ratio(leader, trials, p1) >= sprt_upper_bound(alpha, beta)
+    raise ValueError(f"Unknown stopping rule '{rule}'. Choose from: {', '.join(STOPPING_RULES)}")
@@ -0,0 +1,168 @@
+"""Lexical near-duplicate detection for consortium responses.
+
+Each response is normalized once and reduced to a set of hashed character
+shingles. Pairwise similarity is the Dice coefficient of the shingle sets
+(``2|A & B| / (|A| + |B|)``), the set analogue of ``difflib``'s
+``SequenceMatcher.ratio()``, so thresholds keep their meaning. For larger
+inputs, MinHash signatures with LSH banding limit the exact comparisons to
+candidate pairs.
+"""
+import re
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+_PREAMBLE_PATTERNS = [
+    re.compile(r"^(certainly|sure|okay|ok|absolutely|i can help with that|here is|here's|the answer is|based on the information)\b", re.IGNORECASE),
+    re.compile(r"^(i'd be happy|i would be happy|let me help|let's look at this)\b", re.IGNORECASE),
+    re.compile(r"^\s*[\!\.\,\:\;]+\s*"),  # Leading punctuation
+]
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+_SHINGLE_BASE = np.uint64(0x100000001B3)
+
+# Below this many responses every pair is compared exactly; LSH only pays off on larger sets.
+LSH_MIN_RESPONSES = 24
+
+
+def normalize_answer(text: str) -> str:
+    """Lowercase, strip conversational preambles, punctuation and repeated whitespace."""
+    text = (text or "").lower().strip()
+
+    # Remove common conversational prefixes (apply a few times to catch chains)
+    for _ in range(3):
+        changed = False
+        for pattern in _PREAMBLE_PATTERNS:
+            new_text = pattern.sub("", text).strip()
+            if new_text != text:
+                text = new_text
+                changed = True
+        if not changed:
+            break
+
+    text = _PUNCTUATION.sub("", text)
+    return _WHITESPACE.sub(" ", text.strip())
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def shingle_hashes(text: str, size: int = 3) -> np.ndarray:
+    """Sorted unique 64-bit hashes of the character ``size``-grams of ``text``."""
+    if not text:
+        return np.zeros(0, dtype=np.uint64)
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    size = min(size, codes.shape[0])
+    count = codes.shape[0] - size + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    for offset in range(size):
+        hashes = hashes * _SHINGLE_BASE + codes[offset:offset + count]
+    return np.unique(_mix64(hashes))
+
+
+def auto_shingle_size(lengths: Sequence[int]) -> int:
+    """Small alphabets saturate short shingles on long texts, so grow k with the typical length."""
+    median = float(np.median(lengths)) if len(lengths) else 0.0
+    if median < 64:
+        return 2
+    if median < 512:
+        return 4
+    return 5
+
+
+def dice(left: FrozenSet[int], right: FrozenSet[int]) -> float:
+    if not left or not right:
+        return 1.0 if left == right else 0.0
+    return 2.0 * len(left & right) / (len(left) + len(right))
+
+
+def similarity_matrix(normalized: Sequence[str], shingle_size: Optional[int] = None) -> np.ndarray:
+    """Symmetric matrix of Dice similarities between already-normalized texts (1.0 on the diagonal)."""
+    count = len(normalized)
+    matrix = np.eye(count)
+    if count < 2:
+        return matrix
+    size = shingle_size or auto_shingle_size([len(text) for text in normalized])
+    shingles = [frozenset(shingle_hashes(text, size).tolist()) for text in normalized]
+    for i in range(count):
+        for j in range(i + 1, count):
+            matrix[i, j] = matrix[j, i] = dice(shingles[i], shingles[j])
+    return matrix
+
+
+def pairwise_agreement(normalized: Sequence[str], shingle_size: Optional[int] = None) -> float:
+    """Mean Dice similarity over all pairs of already-normalized texts (1.0 for fewer than two)."""
+    if len(normalized) < 2:
+        return 1.0
+    matrix = similarity_matrix(normalized, shingle_size)
+    return float(matrix[np.triu_indices(len(normalized), k=1)].mean())
+
+
+def lsh_bands(threshold: float, num_perm: int) -> Optional[Tuple[int, int]]:
+    """Pick (bands, rows) so pairs at ``threshold`` Jaccard become candidates with >= 99% probability.
+
+    Returns None when no banding reaches that recall, i.e. every pair must be compared.
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1.0 - (1.0 - threshold ** rows) ** bands >= 0.99:
+            best = (bands, rows)
+        else:
+            break
+    return best
+
+
+class NearDuplicateIndex:
+    """Shingle sets and MinHash/LSH candidates for a batch of texts."""
+
+    def __init__(self, texts: Sequence[str], threshold: float, answer_length: int = 2000,
+                 shingle_size: Optional[int] = None, num_perm: int = 128, seed: int = 0,
+                 normalized: Optional[Sequence[str]] = None):
+        self.threshold = threshold
+        if normalized is None:
+            normalized = [normalize_answer(text) for text in texts]
+        self.normalized = [text[:answer_length] for text in normalized]
+        self.shingle_size = shingle_size or auto_shingle_size([len(text) for text in self.normalized])
+        hashes = [shingle_hashes(text, self.shingle_size) for text in self.normalized]
+        self.shingles: List[FrozenSet[int]] = [frozenset(h.tolist()) for h in hashes]
+        # Dice threshold t corresponds to Jaccard t / (2 - t)
+        banding = lsh_bands(threshold / (2.0 - threshold), num_perm)
+        self._candidates: Optional[Dict[int, Set[int]]] = None
+        if banding is not None and len(texts) >= LSH_MIN_RESPONSES:
+            self._candidates = self._lsh_candidates(hashes, num_perm, seed, *banding)
+
+    def _lsh_candidates(self, hashes: List[np.ndarray], num_perm: int, seed: int,
+                        bands: int, rows: int) -> Dict[int, Set[int]]:
+        seeds = np.random.default_rng(seed).integers(0, np.iinfo(np.uint64).max, size=(num_perm, 1), dtype=np.uint64)
+        signatures = np.full((len(hashes), num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+        for index, values in enumerate(hashes):
+            if values.size:
+                signatures[index] = _mix64(values ^ seeds).min(axis=1)
+
+        candidates: Dict[int, Set[int]] = defaultdict(set)
+        for band in range(bands):
+            buckets: Dict[bytes, List[int]] = defaultdict(list)
+            block = signatures[:, band * rows:(band + 1) * rows]
+            for index in range(len(hashes)):
+                buckets[block[index].tobytes()].append(index)
+            for members in buckets.values():
+                for position, left in enumerate(members):
+                    candidates[left].update(members[position + 1:])
+        return candidates
+
+    def candidates(self, index: int) -> List[int]:
+        """Indices after ``index`` that may reach the threshold, in input order."""
+        if self._candidates is None:
+            return list(range(index + 1, len(self.shingles)))
+        return sorted(self._candidates.get(index, ()))
+
+    def similarity(self, left: int, right: int) -> float:
+        return dice(self.shingles[left], self.shingles[right])
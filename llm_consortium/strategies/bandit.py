@@ -0,0 +1,181 @@
+"""Bandit Strategy for llm-consortium.
+
+This strategy treats each configured model as an arm of a multi-armed bandit.
+Each run calls only ``k`` models, chosen with UCB1 or Thompson sampling from
+reward statistics that persist across runs in the consortium database.
+"""
+
+from .base import ConsortiumStrategy
+from ..db import get_model_rewards, save_model_reward
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import logging
+import math
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from llm_consortium import IterationContext
+
+
+class BanditStrategy(ConsortiumStrategy):
+    """
+    Strategy that learns which models are worth calling.
+
+    Rewards are in [0, 1]. With a ranking (``judging_method=rank``) a model
+    scores by its position (best 1.0, worst 0.0); otherwise it scores 1.0 when
+    its response is the arbiter's ``chosen_response_id`` and 0.0 when another
+    one is. Failed calls score 0.0. Slow responses lose up to
+    ``latency_weight``. Iterations without any quality signal update nothing.
+
+    Strategy parameters (passed via params dict):
+        - k: int (default 3)
+          Number of models called per run
+        - algorithm: str (default "thompson")
+          "thompson" samples Beta(1 + rewards, 1 + pulls - rewards);
+          "ucb1" uses mean + exploration * sqrt(2 ln N / n)
+        - exploration: float (default 1.0)
+          UCB1 exploration coefficient
+        - latency_weight: float (default 0.1)
+          Reward lost by a response taking ``latency_target`` seconds or more
+        - latency_target: float (default 30.0)
+          Latency in seconds at which the full penalty applies
+        - scope: str (default: the consortium name)
+          Key under which reward statistics are stored and shared
+        - persist: bool (default True)
+          Load and save statistics in the consortium database
+        - seed: int (default none)
+          Seed for Thompson sampling
+    """
+
+    ALGORITHMS = ("thompson", "ucb1")
+    TRUE_VALUES = ("1", "true", "yes", "on")
+    FALSE_VALUES = ("0", "false", "no", "off")
+
+    def _validate_params(self):
+        """Validate strategy-specific parameters"""
+        self.k = int(self.params.get('k', 3))
+        self.algorithm = str(self.params.get('algorithm', 'thompson')).strip().lower()
+        self.exploration = float(self.params.get('exploration', 1.0))
+        self.latency_weight = float(self.params.get('latency_weight', 0.1))
+        self.latency_target = float(self.params.get('latency_target', 30.0))
+        persist = str(self.params.get('persist', 'true')).strip().lower()
+        if persist not in self.TRUE_VALUES + self.FALSE_VALUES:
+            raise ValueError(f"persist must be one of: {', '.join(self.TRUE_VALUES + self.FALSE_VALUES)}")
+        self.persist = persist in self.TRUE_VALUES
+        scope = self.params.get('scope') or getattr(self.orchestrator, 'config_name', None)
+        self.scope = scope if isinstance(scope, str) and scope else 'default'
+        seed = self.params.get('seed')
+        self._rng = np.random.default_rng(int(seed) if seed not in (None, "") else None)
+        # Reward statistics per model; without persistence they live on this instance across runs
+        self.model_stats: Optional[Dict[str, Dict[str, Any]]] = None
+
+        if self.k < 1:
+            raise ValueError("k must be at least 1")
+        if self.algorithm not in self.ALGORITHMS:
+            raise ValueError(f"algorithm must be one of: {', '.join(self.ALGORITHMS)}")
+        if self.exploration < 0:
+            raise ValueError("exploration must be non-negative")
+        if not 0 <= self.latency_weight <= 1:
+            raise ValueError("latency_weight must be between 0 and 1")
+        if self.latency_target <= 0:
+            raise ValueError("latency_target must be positive")
+
+    def initialize_state(self):
+        """Load reward statistics and clear the per-run selection"""
+        super().initialize_state()
+        self.iteration_state['selected_models'] = None
+        self.iteration_state['rewards'] = []
+        if self.persist:
+            self.model_stats = get_model_rewards(self.scope)
+
+    def _stats(self) -> Dict[str, Dict[str, Any]]:
+        if self.model_stats is None:
+            self.model_stats = get_model_rewards(self.scope) if self.persist else {}
+        return self.model_stats
+
+    def _scores(self, models: List[str]) -> Dict[str, float]:
+        stats = self._stats()
+        pulls = np.array([stats.get(model, {}).get('pulls', 0) for model in models], dtype=float)
+        rewards = np.array([stats.get(model, {}).get('reward_sum', 0.0) for model in models], dtype=float)
+        if self.algorithm == 'thompson':
+            scores = self._rng.beta(1.0 + rewards, 1.0 + np.maximum(pulls - rewards, 0.0))
+        else:
+            total = max(pulls.sum(), 1.0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scores = rewards / pulls + self.exploration * np.sqrt(2.0 * math.log(total) / pulls)
+            # Untried models come first
+            scores[pulls == 0] = np.inf
+        return dict(zip(models, scores.tolist()))
+
+    def select_models(self, available_models: Dict[str, int],
+                     current_prompt: str, iteration: int) -> Dict[str, int]:
+        """Pick k models once per run and keep them for every iteration"""
+        selected = self.iteration_state.get('selected_models')
+        if selected is None:
+            scores = self._scores(list(available_models))
+            chosen = sorted(available_models, key=lambda model: scores[model], reverse=True)[:self.k]
+            selected = {model: available_models[model] for model in available_models if model in chosen}
+            self.iteration_state['selected_models'] = selected
+            logger.info(f"[BanditStrategy] Selected {len(selected)}/{len(available_models)} models "
+                       f"({self.algorithm}): {', '.join(selected)}")
+        return {model: count for model, count in selected.items() if model in available_models}
+
+    def process_responses(self, successful_responses: List[Dict[str, Any]],
+                         iteration: int) -> List[Dict[str, Any]]:
+        """Pass through all responses (selection happens before the calls)"""
+        return successful_responses
+
+    def _quality(self, response: Dict[str, Any], ranking: List[Any], chosen: Optional[str]) -> Optional[float]:
+        if response.get('error') is not None:
+            return 0.0
+        if ranking:
+            if response.get('id') not in ranking:
+                return 0.0
+            if len(ranking) == 1:
+                return 1.0
+            return 1.0 - ranking.index(response.get('id')) / (len(ranking) - 1)
+        if chosen is not None:
+            return 1.0 if str(response.get('response_id')) == str(chosen) else 0.0
+        return None
+
+    def _reward(self, response: Dict[str, Any], quality: float) -> float:
+        latency = response.get('latency')
+        if latency is None:
+            return quality
+        penalty = self.latency_weight * min(float(latency) / self.latency_target, 1.0)
+        return min(max(quality - penalty, 0.0), 1.0)
+
+    def update_state(self, iteration_context: 'IterationContext'):
+        """Credit each called model with the mean reward of its responses"""
+        synthesis = iteration_context.synthesis or {}
+        ranking = list(synthesis.get('ranking') or [])
+        chosen = synthesis.get('chosen_response_id')
+        if not ranking and chosen is None:
+            logger.debug("[BanditStrategy] No ranking or chosen response; rewards not updated")
+            return
+
+        per_model: Dict[str, List[float]] = {}
+        latencies: Dict[str, List[float]] = {}
+        for response in iteration_context.model_responses:
+            quality = self._quality(response, ranking, chosen)
+            if quality is None:
+                continue
+            model = response.get('model')
+            per_model.setdefault(model, []).append(self._reward(response, quality))
+            if response.get('latency') is not None:
+                latencies.setdefault(model, []).append(float(response['latency']))
+
+        stats = self._stats()
+        for model, rewards in per_model.items():
+            entry = stats.setdefault(model, {'pulls': 0, 'reward_sum': 0.0, 'latency_sum': 0.0})
+            entry['pulls'] = int(entry.get('pulls', 0)) + 1
+            entry['reward_sum'] = float(entry.get('reward_sum', 0.0)) + float(np.mean(rewards))
+            if model in latencies:
+                entry['latency_sum'] = float(entry.get('latency_sum', 0.0)) + float(np.mean(latencies[model]))
+            if self.persist:
+                save_model_reward(self.scope, model, entry)
+        self.iteration_state.setdefault('rewards', []).append({
+            model: float(np.mean(rewards)) for model, rewards in per_model.items()
+        })
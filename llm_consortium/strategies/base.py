@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, TYPE_CHECKING, Optional
+from typing import List, Dict, Any, TYPE_CHECKING, Optional, Set, Tuple
+
+from ..compaction import novel_sentences
+from ..features import IterationFeatures
+from ..geometry import ResponseGeometry
 
 # Avoid circular import for type hinting using TYPE_CHECKING
 if TYPE_CHECKING:
@@ -30,6 +34,7 @@ class ConsortiumStrategy(ABC):
         # Dictionary to hold any state the strategy needs to maintain across iterations
         # within a single orchestrate() run. Reset by initialize_state().
         self.iteration_state: Dict[str, Any] = {}
+        self._local_features: Optional[IterationFeatures] = None
         self._validate_params() # Allow subclasses to validate params on init
 
     def _validate_params(self):
@@ -89,6 +94,31 @@ class ConsortiumStrategy(ABC):
         """
         pass
 
+    def _features(self) -> IterationFeatures:
+        """
+        Returns the orchestrator's per-iteration feature cache, so normalized text,
+        embeddings and similarity matrices are computed once per iteration no matter
+        how many strategies (or pipeline stages) use them.
+        """
+        shared = getattr(self.orchestrator, 'get_iteration_features', None)
+        features = shared() if callable(shared) else None
+        if isinstance(features, IterationFeatures):
+            return features
+        if self._local_features is None:
+            self._local_features = IterationFeatures(lambda: self.orchestrator.get_embedding_service())
+        return self._local_features
+
+    def _response_geometry(self, embeddings: List[Any]) -> 'ResponseGeometry':
+        """
+        Returns the pairwise geometry for `embeddings`, shared with the orchestrator
+        so the similarity matrix is computed once per iteration.
+        """
+        shared = getattr(self.orchestrator, 'get_response_geometry', None)
+        geometry = shared(embeddings) if callable(shared) else None
+        if isinstance(geometry, ResponseGeometry):
+            return geometry
+        return self._features().geometry(embeddings)
+
     def update_state(self, iteration_context: 'IterationContext'):
         """
         **OPTIONAL:** Called at the end of each iteration, allowing the strategy to update
@@ -106,6 +136,36 @@ class ConsortiumStrategy(ABC):
         # manage elimination lists, etc., using `self.iteration_state`.
         pass
 
+    def needs_iteration(self, iteration_context: 'IterationContext') -> bool:
+        """
+        **OPTIONAL:** Called after `update_state`. Returning True keeps the orchestrator
+        iterating even when the arbiter is confident (still bounded by max_iterations),
+        e.g. because the strategy escalated to different models.
+        """
+        return False
+
+    def excluded_instances(self) -> Set[Tuple[str, int]]:
+        """
+        **OPTIONAL:** Return (model, instance) pairs of the selected models that should
+        not be prompted this iteration. Default excludes none.
+        """
+        return set()
+
+    def sampling_wave_size(self) -> Optional[int]:
+        """
+        **OPTIONAL:** Return a wave size to have the orchestrator launch the selected
+        instances in waves of this many, calling `sampling_settled` between waves.
+        Default None launches every instance at once.
+        """
+        return None
+
+    def sampling_settled(self, responses: List[Dict[str, Any]], iteration: int) -> bool:
+        """
+        **OPTIONAL:** Called between sampling waves with the successful responses so
+        far. Returning True stops launching the remaining instances this iteration.
+        """
+        return False
+
     def get_instance_system_prompt(self, model: str, instance: int, default_prompt: Optional[str]) -> Optional[str]:
         """
         **OPTIONAL:** Allows a strategy to modify the system prompt per-instance.
@@ -138,12 +198,58 @@ class ConsortiumStrategy(ABC):
         """
         if not self.orchestrator.iteration_history:
              return original_prompt
-             
-        prev_synth = self.orchestrator.iteration_history[-1].get("synthesis", {}).get("synthesis", "")
-        
-        guidance = f"""Iteration Guidance:\nPlease improve upon the previous iteration based on this synthesis:\n{prev_synth}"""
-        
+
+        guidance = self._iteration_guidance(model_id, instance)
         if getattr(self.orchestrator, 'manual_context', False):
              return f"Original Context/Prompt: {original_prompt}\n---\n{guidance}"
         else:
              return guidance
+
+    def _previous_response(self, model_id: str, instance: int) -> Optional[str]:
+        """This member's response in the previous iteration, if it gave one."""
+        history = self.orchestrator.iteration_history
+        for response in (history[-1].get("model_responses", []) if history else []):
+            if (response.get("model") == model_id and response.get("instance") == instance
+                    and response.get("error") is None):
+                return response.get("response")
+        return None
+
+    def _iteration_guidance(self, model_id: str, instance: int) -> str:
+        """The "Iteration Guidance" block of an iteration prompt (iteration > 1).
+
+        By default it carries the whole previous synthesis and its refinement
+        areas. With ``iteration_prompt="delta"`` in automatic context, a member
+        whose previous answer is already in its conversation gets only the
+        refinement areas, the dissent and the synthesis sentences its answer
+        lacks. ``revision_max_tokens`` adds a length target for the revision.
+        """
+        config = getattr(self.orchestrator, 'config', None)
+        synthesis = self.orchestrator.iteration_history[-1].get("synthesis", {})
+        refinement_areas = synthesis.get("refinement_areas", [])
+        areas = "\nSpecific areas to refine:\n" + "\n".join(f"- {area}" for area in refinement_areas) if refinement_areas else ""
+
+        previous = self._previous_response(model_id, instance)
+        delta = (
+            getattr(config, 'iteration_prompt', 'full') == 'delta'
+            and not getattr(self.orchestrator, 'manual_context', False)
+            and previous is not None
+        )
+        if delta:
+            missing = novel_sentences(synthesis.get("synthesis", ""), previous)
+            guidance = (f"Iteration Guidance:\nRevise your previous answer. "
+                        f"The arbiter's confidence in the current synthesis is {synthesis.get('confidence', 0.0) or 0.0:.2f}.")
+            guidance += areas
+            if synthesis.get("dissent"):
+                guidance += f"\nDissenting views to weigh:\n{synthesis['dissent']}"
+            if missing:
+                guidance += "\nPoints in the synthesis that your previous answer lacks:\n" + "\n".join(f"- {point}" for point in missing)
+            else:
+                guidance += "\nYour previous answer already covers every point of the synthesis."
+        else:
+            guidance = f"""Iteration Guidance:\nPlease improve upon the previous iteration based on this synthesis:\n{synthesis.get("synthesis", "")}"""
+            guidance += areas
+
+        revision_max_tokens = getattr(config, 'revision_max_tokens', None)
+        if isinstance(revision_max_tokens, int) and revision_max_tokens > 0:
+            guidance += f"\nKeep your revised answer under {revision_max_tokens} tokens."
+        return guidance
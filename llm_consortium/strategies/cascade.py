@@ -0,0 +1,178 @@
+"""Cascade Strategy for llm-consortium.
+
+This strategy orders models into cost tiers. Iteration 1 queries only the
+first (cheapest) tier; the run escalates to the next tier only when the
+arbiter's confidence or the agreement between members is too low. Calls,
+latency, tokens and spend are recorded per tier so savings can be measured.
+"""
+
+from .base import ConsortiumStrategy
+from ..db import save_tier_usage
+from ..similarity import pairwise_agreement
+from typing import List, Dict, Any, TYPE_CHECKING
+import logging
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from llm_consortium import IterationContext
+
+
+def parse_tiers(value: Any) -> List[List[str]]:
+    """Accept "a,b;c", ["a,b", "c"] or [["a", "b"], ["c"]]."""
+    if value is None or value == "":
+        return []
+    entries = value if isinstance(value, (list, tuple)) else str(value).split(";")
+    tiers = []
+    for entry in entries:
+        models = entry if isinstance(entry, (list, tuple)) else str(entry).split(",")
+        models = [str(model).strip() for model in models if str(model).strip()]
+        if models:
+            tiers.append(models)
+    return tiers
+
+
+def _parse_floats(value: Any) -> List[float]:
+    if value is None or value == "":
+        return []
+    values = value if isinstance(value, (list, tuple)) else str(value).split(",")
+    return [float(item) for item in values]
+
+
+class CascadeStrategy(ConsortiumStrategy):
+    """
+    Strategy that escalates to larger models only when needed.
+
+    After each iteration the strategy escalates one tier if the arbiter's
+    confidence is below ``confidence_threshold`` or member agreement is below
+    ``agreement_threshold``, and asks the orchestrator for another iteration.
+    Agreement is the geometric confidence when responses were embedded,
+    otherwise the mean pairwise lexical (character-shingle Dice) similarity.
+
+    Strategy parameters (passed via params dict):
+        - tiers: str or list (required)
+          Ordered tiers, cheapest first: "cheap-a,cheap-b;frontier-a,frontier-b"
+          or one repeated ``tiers=...`` entry per tier
+        - confidence_threshold: float (default: the consortium's confidence threshold)
+          Escalate when arbiter confidence is below this
+        - agreement_threshold: float (default 0.5)
+          Escalate when member agreement is below this
+        - cumulative: bool (default False)
+          Keep querying lower tiers after escalating
+        - tier_costs: str or list (default 1 per tier)
+          Cost per 1,000 tokens for each tier, used to report spend
+    """
+
+    def _validate_params(self):
+        """Validate strategy-specific parameters"""
+        self.tiers = parse_tiers(self.params.get('tiers'))
+        default_threshold = getattr(self.orchestrator, 'confidence_threshold', None)
+        if not isinstance(default_threshold, (int, float)):
+            default_threshold = 0.8
+        self.confidence_threshold = float(self.params.get('confidence_threshold', default_threshold))
+        self.agreement_threshold = float(self.params.get('agreement_threshold', 0.5))
+        self.cumulative = str(self.params.get('cumulative', 'false')).lower() == 'true'
+        self.tier_costs = _parse_floats(self.params.get('tier_costs')) or [1.0] * len(self.tiers)
+
+        if not self.tiers:
+            raise ValueError("cascade strategy requires tiers, e.g. tiers=cheap-a,cheap-b;frontier-a")
+        if not 0 <= self.confidence_threshold <= 1:
+            raise ValueError("confidence_threshold must be between 0 and 1")
+        if not 0 <= self.agreement_threshold <= 1:
+            raise ValueError("agreement_threshold must be between 0 and 1")
+        if len(self.tier_costs) != len(self.tiers):
+            raise ValueError(f"tier_costs needs one value per tier ({len(self.tiers)})")
+
+    def initialize_state(self):
+        """Start every run at the first tier"""
+        super().initialize_state()
+        self.iteration_state['tier'] = 0
+        self.iteration_state['escalated'] = False
+        self.iteration_state['tier_usage'] = []
+
+    def _tier_models(self, available_models: Dict[str, int], tier: int) -> Dict[str, int]:
+        tiers = self.tiers[:tier + 1] if self.cumulative else [self.tiers[tier]]
+        return {
+            model: available_models[model]
+            for models in tiers for model in models
+            if model in available_models
+        }
+
+    def select_models(self, available_models: Dict[str, int],
+                     current_prompt: str, iteration: int) -> Dict[str, int]:
+        """Return the current tier's models, skipping tiers with none configured"""
+        tier = self.iteration_state.get('tier', 0)
+        selected = self._tier_models(available_models, tier)
+        while not selected and tier + 1 < len(self.tiers):
+            logger.warning(f"[CascadeStrategy] Tier {tier + 1} has no configured models; skipping it")
+            tier += 1
+            selected = self._tier_models(available_models, tier)
+        self.iteration_state['tier'] = tier
+        self.iteration_state['iteration'] = iteration
+
+        unassigned = [model for model in available_models if not any(model in models for models in self.tiers)]
+        if unassigned and iteration == 1:
+            logger.warning(f"[CascadeStrategy] Models not in any tier are never called: {', '.join(unassigned)}")
+        logger.info(f"[CascadeStrategy Iteration {iteration}] Tier {tier + 1}/{len(self.tiers)}: "
+                   f"{', '.join(selected)}")
+        return selected
+
+    def process_responses(self, successful_responses: List[Dict[str, Any]],
+                         iteration: int) -> List[Dict[str, Any]]:
+        """Measure lexical agreement between members; responses pass through unchanged"""
+        texts = [r.get('response', '') for r in successful_responses if r.get('error') is None]
+        self.iteration_state['lexical_agreement'] = pairwise_agreement(self._features().normalized(texts))
+        return successful_responses
+
+    def _usage(self, responses: List[Dict[str, Any]], tier: int) -> Dict[str, Any]:
+        latencies = [float(r['latency']) for r in responses if r.get('latency') is not None]
+        input_tokens = sum(r.get('input_tokens') or 0 for r in responses)
+        output_tokens = sum(r.get('output_tokens') or 0 for r in responses)
+        return {
+            'tier': tier + 1,
+            'models': sorted({r.get('model') for r in responses if r.get('model')}),
+            'calls': len(responses),
+            'errors': sum(1 for r in responses if r.get('error') is not None),
+            'latency_total': sum(latencies),
+            'latency_max': max(latencies, default=0.0),
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'spend': (input_tokens + output_tokens) / 1000.0 * self.tier_costs[tier],
+        }
+
+    def update_state(self, iteration_context: 'IterationContext'):
+        """Record tier usage and escalate if confidence or agreement is too low"""
+        synthesis = iteration_context.synthesis or {}
+        tier = self.iteration_state.get('tier', 0)
+        confidence = float(synthesis.get('confidence', 0.0) or 0.0)
+        if synthesis.get('centroid_vector') is not None:
+            agreement = float(synthesis.get('geometric_confidence', 0.0) or 0.0)
+        else:
+            agreement = float(self.iteration_state.get('lexical_agreement', 1.0))
+
+        escalate = (
+            (confidence < self.confidence_threshold or agreement < self.agreement_threshold)
+            and tier + 1 < len(self.tiers)
+        )
+
+        usage = self._usage(iteration_context.model_responses, tier)
+        usage.update({
+            'iteration': self.iteration_state.get('iteration'),
+            'confidence': confidence,
+            'agreement': agreement,
+            'escalated': escalate,
+        })
+        self.iteration_state.setdefault('tier_usage', []).append(usage)
+        run_id = getattr(self.orchestrator, 'consortium_id', None)
+        if isinstance(run_id, str) and run_id:
+            save_tier_usage(run_id, usage)
+
+        self.iteration_state['escalated'] = escalate
+        if escalate:
+            self.iteration_state['tier'] = tier + 1
+            logger.info(f"[CascadeStrategy] Escalating to tier {tier + 2} "
+                       f"(confidence {confidence:.2f}, agreement {agreement:.2f})")
+
+    def needs_iteration(self, iteration_context: 'IterationContext') -> bool:
+        """A run that just escalated needs the next tier's iteration"""
+        return bool(self.iteration_state.get('escalated', False))
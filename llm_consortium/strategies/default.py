@@ -36,13 +36,8 @@ class DefaultStrategy(ConsortiumStrategy):
         """
         if not self.orchestrator.iteration_history:
              return original_prompt
-             
-        prev_synth = self.orchestrator.iteration_history[-1].get("synthesis", {}).get("synthesis", "")
-        
-        guidance = f"""Iteration Guidance:
-Please improve upon the previous iteration based on this synthesis:
-{prev_synth}"""
 
+        guidance = self._iteration_guidance(model_id, instance)
         if getattr(self.orchestrator, 'manual_context', False):
             # Cache-optimized layout: Static content first, dynamic content last
             return f"Original Context/Prompt: {original_prompt}\n---\n{guidance}"
@@ -1,18 +1,28 @@
 """Elimination Strategy for llm-consortium.
 
 This strategy progressively eliminates underperforming models based on
-their confidence scores across iterations.
+their arbiter ranking across iterations, optionally weighted by the latency
+and token cost measured for each model.
 """
 
 from .base import ConsortiumStrategy
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple, TYPE_CHECKING
 import logging
 
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from llm_consortium import IterationContext
+
 class EliminationStrategy(ConsortiumStrategy):
     """
     Strategy that eliminates worst-performing models each iteration based on Arbiter ranking.
+
+    Each ranked member gets an elimination score: its rank position (best 0.0,
+    worst 1.0) plus ``latency_weight`` times its mean latency and ``cost_weight``
+    times its mean token usage, both relative to the slowest / most expensive
+    active model. The highest scores are eliminated. The top-ranked response of
+    the iteration is never eliminated.
     
     Strategy parameters (passed via params dict):
         - eliminate_count: int (default 1)
@@ -24,7 +34,20 @@ class EliminationStrategy(ConsortiumStrategy):
           Never eliminate if it would drop the active models below this number.
         - elimination_delay: int (default 1)
           Number of iterations to wait before starting elimination.
+        - latency_weight: float (default 0.0)
+          Weight of measured latency in the elimination score.
+        - cost_weight: float (default 0.0)
+          Weight of measured token usage (input + output) in the elimination score.
+        - granularity: str (default "model")
+          "model" eliminates every instance of a model; "instance" eliminates
+          one instance at a time (counts and keep_minimum are then in instances);
+          eliminated instances are reported through ``excluded_instances``.
+        - marginal: bool (default False)
+          Eliminate models that have never produced the winning response
+          first, slowest first, before any model that has.
     """
+
+    GRANULARITIES = ("model", "instance")
     
     def _validate_params(self):
         """Validate strategy-specific parameters"""
@@ -40,6 +63,10 @@ class EliminationStrategy(ConsortiumStrategy):
         self.elimination_delay = int(
             self.params.get('elimination_delay', 1)
         )
+        self.latency_weight = float(self.params.get('latency_weight', 0.0))
+        self.cost_weight = float(self.params.get('cost_weight', 0.0))
+        self.granularity = str(self.params.get('granularity', 'model')).strip().lower()
+        self.marginal = str(self.params.get('marginal', 'false')).lower() == 'true'
         
         if self.eliminate_count < 0:
             raise ValueError("eliminate_count must be non-negative")
@@ -49,17 +76,28 @@ class EliminationStrategy(ConsortiumStrategy):
             raise ValueError("keep_minimum must be at least 1")
         if self.elimination_delay < 0:
             raise ValueError("elimination_delay must be non-negative")
+        if self.latency_weight < 0 or self.cost_weight < 0:
+            raise ValueError("latency_weight and cost_weight must be non-negative")
+        if self.granularity not in self.GRANULARITIES:
+            raise ValueError(f"granularity must be one of: {', '.join(self.GRANULARITIES)}")
     
     def initialize_state(self):
         """Initialize elimination tracking"""
         super().initialize_state()
         self.iteration_state['eliminated_models'] = set()
+        # Instance granularity: eliminated (model, instance) pairs
+        self.iteration_state['eliminated_instances'] = set()
+        # Per-model running totals of calls, latency, tokens and wins
+        self.iteration_state['model_costs'] = {}
+        self.iteration_state['elimination_log'] = []
         self.iteration_state['iteration_count'] = 0
     
     def select_models(self, available_models: Dict[str, int], 
                      current_prompt: str, iteration: int) -> Dict[str, int]:
         """Select models, excluding eliminated ones"""
         self.iteration_state['iteration_count'] = iteration
+        if self.granularity == 'instance':
+            return self._select_instances(available_models, iteration)
         eliminated = self.iteration_state['eliminated_models']
         
         # Filter out eliminated models
@@ -84,19 +122,110 @@ class EliminationStrategy(ConsortiumStrategy):
                    f"Selected {len(selected)} models "
                    f"({len(self.iteration_state['eliminated_models'])} eliminated)")
         return selected
+
+    def _select_instances(self, available_models: Dict[str, int], iteration: int) -> Dict[str, int]:
+        """Models with an active instance, at their full count; the eliminated
+        instances themselves are skipped through ``excluded_instances``."""
+        eliminated = self.iteration_state.setdefault('eliminated_instances', set())
+        instances = [(model, i) for model, count in available_models.items() for i in range(count)]
+        active = [pair for pair in instances if pair not in eliminated]
+
+        # Restore instances, one at a time, until keep_minimum instances are active
+        for pair in instances:
+            if len(active) >= self.keep_minimum:
+                break
+            if pair in eliminated:
+                eliminated.remove(pair)
+                active.append(pair)
+
+        selected = {model: available_models[model] for model in dict.fromkeys(model for model, _ in active)}
+        logger.info(f"[EliminationStrategy Iteration {iteration}] "
+                   f"Selected {len(active)} instances "
+                   f"({len(eliminated)} eliminated)")
+        return selected
+
+    def excluded_instances(self) -> Set[Tuple[str, int]]:
+        if self.granularity != 'instance':
+            return set()
+        return set(self.iteration_state.get('eliminated_instances', set()))
     
     def process_responses(self, successful_responses: List[Dict[str, Any]], 
                          iteration: int) -> List[Dict[str, Any]]:
         """Pass through all responses (no filtering before synthesis)"""
         return successful_responses
-    
+
+    def _record_costs(self, model_responses: List[Dict[str, Any]], winner: Optional[Any]):
+        costs = self.iteration_state.setdefault('model_costs', {})
+        for response in model_responses:
+            model = response.get('model')
+            if model is None or response.get('carried_forward'):
+                continue
+            entry = costs.setdefault(model, {'calls': 0, 'latency_sum': 0.0, 'tokens_sum': 0, 'wins': 0})
+            entry['calls'] += 1
+            entry['latency_sum'] += float(response.get('latency') or 0.0)
+            entry['tokens_sum'] += (response.get('input_tokens') or 0) + (response.get('output_tokens') or 0)
+        for response in model_responses:
+            if winner is not None and response.get('id') == winner and response.get('model') in costs:
+                costs[response['model']]['wins'] += 1
+
+    def _mean_costs(self, models: List[str]) -> Dict[str, Tuple[float, float]]:
+        """Mean latency and tokens per model, each relative to the highest among ``models``."""
+        costs = self.iteration_state.get('model_costs', {})
+        means = {}
+        for model in models:
+            entry = costs.get(model, {})
+            calls = max(entry.get('calls', 0), 1)
+            means[model] = (entry.get('latency_sum', 0.0) / calls, entry.get('tokens_sum', 0) / calls)
+        max_latency = max((latency for latency, _ in means.values()), default=0.0)
+        max_tokens = max((tokens for _, tokens in means.values()), default=0.0)
+        return {
+            model: (latency / max_latency if max_latency else 0.0, tokens / max_tokens if max_tokens else 0.0)
+            for model, (latency, tokens) in means.items()
+        }
+
+    def _elimination_order(self, candidates: List[Dict[str, Any]], ranked_ids: List[Any]) -> List[Dict[str, Any]]:
+        """Candidates ordered most-eliminable first, each annotated with its score.
+
+        At model granularity a model's responses are merged and ranked by their
+        mean position.
+        """
+        last = max(len(ranked_ids) - 1, 1)
+        position = {rid: index for index, rid in enumerate(ranked_ids)}
+        merged: Dict[Any, Dict[str, Any]] = {}
+        for candidate in candidates:
+            key = candidate['model'] if self.granularity == 'model' else candidate['id']
+            entry = merged.setdefault(key, {'id': candidate['id'], 'model': candidate['model'], 'positions': []})
+            entry['id'] = candidate['id']
+            entry['positions'].append(position[candidate['id']])
+
+        relative = self._mean_costs(sorted({c['model'] for c in candidates}))
+        wins = {model: entry.get('wins', 0) for model, entry in self.iteration_state.get('model_costs', {}).items()}
+        ordered = []
+        for entry in merged.values():
+            positions = entry.pop('positions')
+            latency, tokens = relative[entry['model']]
+            entry['latency'] = latency
+            entry['score'] = (
+                sum(positions) / len(positions) / last
+                + self.latency_weight * latency
+                + self.cost_weight * tokens
+            )
+            entry['contributed'] = wins.get(entry['model'], 0) > 0
+            ordered.append(entry)
+
+        if self.marginal:
+            # Models that never produced the winner go first, slowest first
+            return sorted(ordered, key=lambda c: (c['contributed'], 0.0 if c['contributed'] else -c['latency'], -c['score']))
+        return sorted(ordered, key=lambda c: -c['score'])
+
     def update_state(self, iteration_context: 'IterationContext'):
-        """Eliminate worst-ranked models after each iteration"""
-        from llm_consortium import IterationContext
-        
+        """Eliminate the highest-scoring models (or instances) after each iteration"""
         synthesis = iteration_context.synthesis
         model_responses = iteration_context.model_responses
         iteration = self.iteration_state['iteration_count']
+
+        ranking = synthesis.get('ranking', [])
+        self._record_costs(model_responses, ranking[0] if ranking else None)
         
         # Only eliminate after delay period
         if iteration < self.elimination_delay:
@@ -104,25 +233,29 @@ class EliminationStrategy(ConsortiumStrategy):
                         f"(iteration {iteration} < delay {self.elimination_delay})")
             return
             
-        ranking = synthesis.get('ranking', [])
         if not ranking:
             logger.warning("[EliminationStrategy] No ranking found in synthesis! This strategy requires a ranking-capable arbiter (judging_method='rank').")
             return
             
         eliminated = self.iteration_state['eliminated_models']
         current_active = {r.get('id'): r.get('model') for r in model_responses if r.get('model') not in eliminated and r.get('id') is not None}
+        instance_of = {r.get('id'): r.get('instance') for r in model_responses}
+        if self.granularity == 'model':
+            active_count = len(set(current_active.values()))
+        else:
+            active_count = len(current_active)
         
-        if len(current_active) <= self.keep_minimum:
+        if active_count <= self.keep_minimum:
             return
             
         # Count how many we are supposed to eliminate
         target_eliminate = self.eliminate_count
         if self.eliminate_fraction > 0:
-            fraction_count = int(len(current_active) * self.eliminate_fraction)
+            fraction_count = int(active_count * self.eliminate_fraction)
             target_eliminate = max(target_eliminate, fraction_count)
             
         # Prevent eliminating beyond keep_minimum
-        max_can_eliminate = len(current_active) - self.keep_minimum
+        max_can_eliminate = active_count - self.keep_minimum
         target_eliminate = min(target_eliminate, max_can_eliminate)
         
         if target_eliminate <= 0:
@@ -135,13 +268,32 @@ class EliminationStrategy(ConsortiumStrategy):
         if not active_ranked_ids:
             return
 
-        # Take the worst-ranked active models
-        to_eliminate_ids = active_ranked_ids[-target_eliminate:]
-        
-        for rid in to_eliminate_ids:
-            model = current_active[rid]
-            eliminated.add(model)
-            logger.info(f"[EliminationStrategy] Eliminated worst-ranked model: {model} (Response ID: {rid})")
+        # The top-ranked response (and, at model granularity, its model) is never eliminated
+        winner = active_ranked_ids[0]
+        candidates = [
+            {'id': rid, 'model': current_active[rid]}
+            for rid in active_ranked_ids
+            if rid != winner and (self.granularity == 'instance' or current_active[rid] != current_active[winner])
+        ]
+
+        for candidate in self._elimination_order(candidates, active_ranked_ids)[:target_eliminate]:
+            model = candidate['model']
+            instance = instance_of.get(candidate['id'])
+            if self.granularity == 'model':
+                eliminated.add(model)
+            else:
+                self.iteration_state.setdefault('eliminated_instances', set()).add((model, instance))
+            self.iteration_state.setdefault('elimination_log', []).append({
+                'iteration': iteration,
+                'model': model,
+                'instance': instance if self.granularity == 'instance' else None,
+                'response_id': candidate['id'],
+                'score': candidate['score'],
+                'contributed': candidate['contributed'],
+            })
+            target = model if self.granularity == 'model' else f"instance {instance} of {model}"
+            logger.info(f"[EliminationStrategy] Eliminated {target} "
+                       f"(Response ID: {candidate['id']}, score {candidate['score']:.2f})")
 
     def prepare_iteration_prompt(self, model_id: str, instance: int, original_prompt: str, iteration: int) -> str:
         """
@@ -149,19 +301,8 @@ class EliminationStrategy(ConsortiumStrategy):
         """
         if not self.orchestrator.iteration_history:
              return original_prompt
-             
-        prev_synth = self.orchestrator.iteration_history[-1].get("synthesis", {}).get("synthesis", "")
-        refinement_areas = self.orchestrator.iteration_history[-1].get("synthesis", {}).get("refinement_areas", [])
-        
-        refinement_text = ""
-        if refinement_areas:
-            refinement_text = "\nSpecific areas to refine:\n" + "\n".join(f"- {area}" for area in refinement_areas) + "\n"
-        
-        guidance = f"""Iteration Guidance:
-Please improve upon the previous iteration based on this synthesis:
-{prev_synth}
-{refinement_text}"""
 
+        guidance = self._iteration_guidance(model_id, instance)
         if getattr(self.orchestrator, 'manual_context', False):
             # Cache-optimized layout
             return f"Original Context/Prompt: {original_prompt}\n---\n{guidance.strip()}"
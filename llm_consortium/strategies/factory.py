@@ -1,6 +1,9 @@
 from .base import ConsortiumStrategy
+from .bandit import BanditStrategy
+from .cascade import CascadeStrategy
 from .default import DefaultStrategy
 from .elimination import EliminationStrategy
+from .pipeline import PipelineStrategy
 from .role import RoleStrategy
 from .voting import VotingStrategy
 
@@ -24,15 +27,21 @@ if TYPE_CHECKING:
 
 # --- Strategy Registry ---
 _strategy_registry: Dict[str, Type[ConsortiumStrategy]] = {
+    "bandit": BanditStrategy,
+    "cascade": CascadeStrategy,
     "default": DefaultStrategy,
     "elimination": EliminationStrategy,
+    "pipeline": PipelineStrategy,
     "role": RoleStrategy,
     "voting": VotingStrategy,
 }
 
 _strategy_descriptions: Dict[str, str] = {
+    "bandit": "Call only k models per run, chosen by UCB1/Thompson sampling on rewards persisted across runs.",
+    "cascade": "Query cheap tiers first and escalate to larger models only on low confidence or agreement.",
     "default": "Run all configured members and synthesize their responses.",
     "elimination": "Use arbiter ranking to remove weaker models across iterations.",
+    "pipeline": "Run several strategies as stages over a shared per-iteration feature cache.",
     "role": "Assign distinct cognitive roles or personalities to member instances.",
     "voting": "Group similar answers and prefer the consensus cluster.",
 }
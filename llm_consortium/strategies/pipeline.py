@@ -0,0 +1,153 @@
+"""Pipeline Strategy for llm-consortium.
+
+Runs several strategies as stages of one run, e.g.
+``--strategy pipeline --strategy-param stages=semantic,voting,elimination``.
+Stages share the orchestrator's per-iteration feature cache, so responses
+embedded by ``semantic`` are not embedded again by ``voting``.
+"""
+
+from .base import ConsortiumStrategy
+from ..features import IterationFeatures
+from typing import List, Dict, Any, Optional, Set, Tuple, TYPE_CHECKING
+import logging
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from llm_consortium import IterationContext
+
+
+def parse_stage_names(value: Any) -> List[str]:
+    """Accept "semantic,voting", ["semantic", "voting"] or None."""
+    if value is None or value == "":
+        return []
+    names = value if isinstance(value, (list, tuple)) else [value]
+    stages = []
+    for name in names:
+        stages.extend(part.strip().lower() for part in str(name).split(",") if part.strip())
+    return stages
+
+
+class PipelineStrategy(ConsortiumStrategy):
+    """
+    Strategy that chains other strategies.
+
+    Model selection runs through the stages in order, each narrowing the models
+    the previous stage selected. Responses are processed by each stage in turn;
+    a stage that returns no responses ends the pipeline for that iteration.
+    Every stage sees ``update_state``.
+
+    Strategy parameters (passed via params dict):
+        - stages: str or list (required)
+          Comma-separated stage strategy names, run in order
+        - <stage>.<param>: any
+          Parameter for one stage only, e.g. ``voting.similarity_threshold=0.7``.
+          Un-prefixed parameters are passed to every stage.
+    """
+
+    def _validate_params(self):
+        """Validate strategy-specific parameters and build the stages"""
+        from .factory import create_strategy
+
+        self.stage_names = parse_stage_names(self.params.get('stages'))
+        if not self.stage_names:
+            raise ValueError("pipeline strategy requires stages, e.g. stages=semantic,voting")
+        if 'pipeline' in self.stage_names:
+            raise ValueError("pipeline stages cannot include 'pipeline'")
+
+        self.stages: List[ConsortiumStrategy] = [
+            create_strategy(name, self.orchestrator, self._stage_params(name))
+            for name in self.stage_names
+        ]
+        # Orchestrators provide a per-iteration cache; without one, the stages share this one
+        self._local_features = IterationFeatures(lambda: self.orchestrator.get_embedding_service())
+        for stage in self.stages:
+            stage._local_features = self._local_features
+
+    def _stage_params(self, name: str) -> Dict[str, Any]:
+        shared = {
+            key: value for key, value in self.params.items()
+            if key != 'stages' and '.' not in key
+        }
+        prefix = f"{name}."
+        shared.update({
+            key[len(prefix):]: value for key, value in self.params.items()
+            if key.lower().startswith(prefix)
+        })
+        return shared
+
+    def initialize_state(self):
+        """Initialize every stage"""
+        super().initialize_state()
+        self.iteration_state['stage_history'] = []
+        for stage in self.stages:
+            stage.initialize_state()
+
+    def select_models(self, available_models: Dict[str, int],
+                     current_prompt: str, iteration: int) -> Dict[str, int]:
+        """Let each stage narrow the models selected by the previous one"""
+        selected = dict(available_models)
+        for name, stage in zip(self.stage_names, self.stages):
+            selected = stage.select_models(selected, current_prompt, iteration)
+            if not selected:
+                logger.info(f"[PipelineStrategy Iteration {iteration}] Stage '{name}' selected no models")
+                break
+        return selected
+
+    def process_responses(self, successful_responses: List[Dict[str, Any]],
+                         iteration: int) -> List[Dict[str, Any]]:
+        """Run the responses through each stage in order"""
+        if 'stage_history' not in self.iteration_state:
+            self.iteration_state['stage_history'] = []
+
+        responses = successful_responses
+        counts = []
+        for name, stage in zip(self.stage_names, self.stages):
+            before = len(responses)
+            responses = stage.process_responses(responses, iteration)
+            counts.append({'stage': name, 'input': before, 'output': len(responses)})
+            logger.debug(f"[PipelineStrategy Iteration {iteration}] {name}: {before} -> {len(responses)} responses")
+            if not responses:
+                break
+
+        self.iteration_state['stage_history'].append({'iteration': iteration, 'stages': counts})
+        return responses
+
+    def update_state(self, iteration_context: 'IterationContext'):
+        """Pass the iteration results to every stage"""
+        for stage in self.stages:
+            stage.update_state(iteration_context)
+
+    def needs_iteration(self, iteration_context: 'IterationContext') -> bool:
+        """Keep iterating if any stage asks to"""
+        return any(stage.needs_iteration(iteration_context) for stage in self.stages)
+
+    def excluded_instances(self) -> Set[Tuple[str, int]]:
+        """Instances excluded by any stage"""
+        return set().union(*(stage.excluded_instances() for stage in self.stages))
+
+    def sampling_wave_size(self) -> Optional[int]:
+        """The smallest wave size requested by any stage"""
+        sizes = [size for size in (stage.sampling_wave_size() for stage in self.stages) if size]
+        return min(sizes) if sizes else None
+
+    def sampling_settled(self, responses: List[Dict[str, Any]], iteration: int) -> bool:
+        """Stop sampling once any sequential stage is settled"""
+        return any(
+            stage.sampling_settled(responses, iteration)
+            for stage in self.stages if stage.sampling_wave_size()
+        )
+
+    def get_instance_system_prompt(self, model: str, instance: int, default_prompt: Optional[str]) -> Optional[str]:
+        """Each stage may modify the system prompt produced by the previous one"""
+        prompt = default_prompt
+        for stage in self.stages:
+            prompt = stage.get_instance_system_prompt(model, instance, prompt)
+        return prompt
+
+    def prepare_iteration_prompt(self, model_id: str, instance: int, original_prompt: str, iteration: int) -> str:
+        """Use the first stage that customizes iteration prompts, else the default"""
+        for stage in self.stages:
+            if type(stage).prepare_iteration_prompt is not ConsortiumStrategy.prepare_iteration_prompt:
+                return stage.prepare_iteration_prompt(model_id, instance, original_prompt, iteration)
+        return super().prepare_iteration_prompt(model_id, instance, original_prompt, iteration)
@@ -94,12 +94,8 @@ class RoleStrategy(ConsortiumStrategy):
         """
         if not self.orchestrator.iteration_history:
              return original_prompt
-             
-        prev_synth = self.orchestrator.iteration_history[-1].get("synthesis", {}).get("synthesis", "")
-        
-        guidance = f"""Iteration Guidance:
-Please improve upon the previous iteration based on this synthesis:
-{prev_synth}
+
+        guidance = f"""{self._iteration_guidance(model_id, instance)}
 
 Remember to strictly adhere to your assigned cognitive role/personality trait matrix."""
 
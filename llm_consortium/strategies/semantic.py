@@ -1,16 +1,17 @@
 """
 Semantic Clustering Strategy for LLM Consortium.
-Uses sklearn for clustering if available, otherwise provides a helpful error.
+Clusters response embeddings with the NumPy algorithms in llm_consortium.clustering
+(dbscan, agglomerative, tropical), or hdbscan when that package is installed.
 """
 import logging
-import json
 from collections import Counter
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 
 from ..db import save_cluster_metadata, save_response_embedding, DatabaseConnection
-from ..geometry import TropicalConsensus, _cosine_distance
+from ..clustering import CLUSTERING_ALGORITHMS, cluster
+from ..geometry import ResponseGeometry
 from .base import ConsortiumStrategy
 
 logger = logging.getLogger(__name__)
@@ -25,36 +26,41 @@ class SemanticClusteringStrategy(ConsortiumStrategy):
         self._check_dependencies()
     
     def _check_dependencies(self):
-        """Check if sklearn is available when the strategy is used."""
-        try:
-            from sklearn.cluster import DBSCAN  # noqa: F401
-            self._sklearn_available = True
-        except ImportError:
-            self._sklearn_available = False
-            logger.warning(
-                "SemanticClusteringStrategy requires sklearn. "
-                "Install with: pip install llm-consortium[embeddings]"
-            )
+        """Only hdbscan needs an optional package; the other algorithms are NumPy-only."""
+        self._hdbscan_available = True
+        if self.clustering_algorithm == "hdbscan":
+            try:
+                import hdbscan  # noqa: F401
+            except ImportError:
+                self._hdbscan_available = False
+                logger.warning(
+                    "clustering_algorithm=hdbscan requires the hdbscan package. "
+                    "Install with: pip install llm-consortium[embeddings]"
+                )
     
     def _validate_params(self):
         """Validate and set default parameters."""
         self.clustering_algorithm = str(self.params.get("clustering_algorithm", "dbscan")).strip().lower()
         self.eps = float(self.params.get("eps", 0.5))
         self.min_samples = int(self.params.get("min_samples", 2))
+        self.linkage = str(self.params.get("linkage", "average")).strip().lower()
         self.use_centroid_synthesis = bool(self.params.get("use_centroid_synthesis", False))
         
-        if self.clustering_algorithm != "dbscan":
-            logger.warning(f"Unsupported clustering algorithm: {self.clustering_algorithm}. Using DBSCAN.")
-            self.clustering_algorithm = "dbscan"
+        if self.clustering_algorithm not in CLUSTERING_ALGORITHMS:
+            raise ValueError(
+                f"Unsupported clustering algorithm: {self.clustering_algorithm}. "
+                f"Choose from: {', '.join(CLUSTERING_ALGORITHMS)}"
+            )
+        if self.min_samples < 1:
+            raise ValueError("min_samples must be at least 1")
         
     def _ensure_dependencies(self):
-        if not self._sklearn_available:
+        if not self._hdbscan_available:
             raise ImportError(
-                "The 'semantic' strategy requires optional dependencies (sklearn).\n"
-                "To use semantic clustering, install the embeddings extras:\n"
+                "The 'hdbscan' clustering algorithm requires optional dependencies.\n"
+                "Install the embeddings extras:\n"
                 "  pip install llm-consortium[embeddings]\n"
-                "Or install sklearn directly:\n"
-                "  pip install scikit-learn\n"
+                "Or choose clustering_algorithm=dbscan, agglomerative or tropical.\n"
             )
 
     def select_models(self, available_models: Dict[str, int], current_prompt: str, iteration: int) -> Dict[str, int]:
@@ -68,22 +74,15 @@ class SemanticClusteringStrategy(ConsortiumStrategy):
 
         self._ensure_dependencies()
         
-        # 1. Get embedding service
-        try:
-            service = self.orchestrator.get_embedding_service()
-        except Exception as e:
-            logger.error(f"Failed to get embedding service: {e}")
-            raise RuntimeError(f"Semantic strategy failed to initialize embedding service: {e}")
-
-        # 2. Get embeddings for responses
+        # 1. Embed responses through the iteration's shared feature cache
         texts = [r.get("response", "") for r in successful_responses]
         try:
-            embeddings = service.embed_batch(texts)
+            embeddings = self._features().embeddings(texts)
         except Exception as e:
             logger.error(f"Failed to embed responses: {e}")
             raise RuntimeError(f"Semantic strategy failed to get embeddings: {e}")
 
-        # 3. Save embeddings if we have a run ID
+        # 2. Save embeddings if we have a run ID
         run_id = getattr(self.orchestrator, 'consortium_id', None)
         model_name = getattr(self.orchestrator.config, 'embedding_model', "unknown")
         
@@ -93,18 +92,19 @@ class SemanticClusteringStrategy(ConsortiumStrategy):
                 save_response_embedding(
                     str(resp["response_id"]),
                     str(run_id),
-                    vec.tolist(),
+                    vec,
                     resp.get("model", "unknown"),
                     embedding_model=model_name
                 )
 
-        # 4. Cluster embeddings
-        labels = self._cluster_responses(embeddings)
+        # 3. Cluster embeddings on the shared pairwise geometry
+        geometry = self._response_geometry(embeddings)
+        labels = self._cluster_responses(embeddings, geometry=geometry)
         
         for i, label in enumerate(labels):
             successful_responses[i]["cluster_id"] = label
 
-        # 5. Identify largest cluster (ignoring noise -1)
+        # 4. Identify largest cluster (ignoring noise -1)
         cluster_counts = Counter([label for label in labels if label != -1])
         if not cluster_counts:
             logger.info("No semantic clusters found. Returning all responses as outliers.")
@@ -116,49 +116,36 @@ class SemanticClusteringStrategy(ConsortiumStrategy):
         largest_cluster_id = cluster_counts.most_common(1)[0][0]
         logger.info(f"Largest cluster: {largest_cluster_id} with {cluster_counts[largest_cluster_id]} members")
 
+        # 5. Centroids and distances for every cluster, read off the same matrix
+        cluster_stats = geometry.cluster_stats(labels)
+        for resp in successful_responses:
+            resp["distance_to_centroid"] = 1.0 # Max distance for outliers
+        for stats in cluster_stats:
+            if stats["cluster_id"] != largest_cluster_id:
+                continue
+            for index, distance in zip(stats["members"], stats["distances"]):
+                successful_responses[index]["distance_to_centroid"] = float(distance)
+
         # 6. Filter to largest cluster
         consensus_responses = [r for r in successful_responses if r.get("cluster_id") == largest_cluster_id]
-        
-        # 7. Compute centroid and distances
-        cluster_embeddings = [r["embedding"] for r in consensus_responses]
-        centroid = np.mean(np.vstack(cluster_embeddings), axis=0)
-        
-        for resp in successful_responses:
-            if resp.get("cluster_id") == largest_cluster_id:
-                resp["distance_to_centroid"] = _cosine_distance(resp["embedding"], centroid)
-            else:
-                resp["distance_to_centroid"] = 1.0 # Max distance for outliers
 
-        # 8. Save cluster metadata
+        # 7. Save cluster metadata
         if run_id:
-            # Prepare metadata for all found clusters
-            all_cluster_ids = set(labels)
-            metadata = []
-            for cid in all_cluster_ids:
-                if cid == -1: continue
-                c_responses = [successful_responses[i] for i, label in enumerate(labels) if label == cid]
-                c_embeddings = [r["embedding"] for r in c_responses]
-                c_centroid = np.mean(np.vstack(c_embeddings), axis=0)
-                
-                # Calculate density (1 - mean distance)
-                c_distances = [_cosine_distance(vec, c_centroid) for vec in c_embeddings]
-                density = 1.0 - float(np.mean(c_distances))
-                
-                metadata.append({
-                    "cluster_id": int(cid),
-                    "centroid": c_centroid.tolist(),
-                    "density": density,
-                    "radius": float(np.max(c_distances)) if c_distances else 0.0
-                })
+            metadata = [
+                {
+                    "cluster_id": stats["cluster_id"],
+                    "centroid": stats["centroid"].tolist(),
+                    "density": stats["density"],
+                    "radius": stats["radius"],
+                }
+                for stats in cluster_stats
+            ]
             save_cluster_metadata(str(run_id), iteration, metadata)
 
         return consensus_responses
 
-    def _cluster_responses(self, embeddings: List[np.ndarray]) -> List[int]:
-        """Cluster embeddings using DBSCAN."""
+    def _cluster_responses(self, embeddings: List[np.ndarray], geometry: Optional[ResponseGeometry] = None) -> List[int]:
+        """Cluster embeddings on the precomputed cosine distance matrix."""
         self._ensure_dependencies()
-        from sklearn.cluster import DBSCAN
-        
-        embeddings_array = np.vstack(embeddings)
-        clustering = DBSCAN(eps=self.eps, min_samples=self.min_samples, metric='cosine').fit(embeddings_array)
-        return clustering.labels_.tolist()
+        geometry = geometry or ResponseGeometry(embeddings)
+        return cluster(self.clustering_algorithm, geometry, self.eps, self.min_samples, linkage=self.linkage)
@@ -5,12 +5,16 @@ implementing a consensus-based approach to model selection.
 """
 
 from .base import ConsortiumStrategy
-from typing import List, Dict, Any, TYPE_CHECKING
-from collections import Counter
+from ..answers import extract_answer, parse_extractor_names
+from ..sequential import STOPPING_RULES, majority_settled
+from ..similarity import NearDuplicateIndex, normalize_answer
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 import difflib
-import re
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -29,7 +33,41 @@ class VotingStrategy(ConsortiumStrategy):
           If True, only select consensus if majority (>50%) agree
         - fallback_to_all: bool (default True)
           If no consensus found, use all responses instead of filtering
+        - similarity_method: str (default "minhash")
+          "minhash" compares character-shingle sets (Dice coefficient, with
+          MinHash/LSH candidate generation for large batches); "difflib" uses
+          pairwise SequenceMatcher ratios
+        - shingle_size: int (default: chosen from the typical answer length)
+          Character n-gram size for the "minhash" method
+        - similarity_backend: str (default "lexical")
+          "embedding" groups responses by cosine similarity of their embeddings,
+          using the orchestrator's embedding service, so paraphrases that agree
+          land in the same group
+        - embedding_threshold: float (default 0.85)
+          Minimum cosine similarity for the "embedding" backend
+        - answer_extractor: str (default none)
+          Comma-separated extractors tried in order ("tag", "regex", "number",
+          "boolean", "choice"). Responses whose final answer can be extracted
+          are grouped by exact canonical answer; only the rest fall back to
+          similarity grouping
+        - answer_tag: str (default "answer")
+          Tag name for the "tag" extractor (<answer>...</answer> or "ANSWER: ...")
+        - answer_pattern: str
+          Regular expression for the "regex" extractor (first group is the answer)
+        - sequential: str (default "off")
+          "wilson" or "sprt" launches instances in waves of ``wave_size`` and
+          stops once the leading group's majority is statistically settled
+          (see llm_consortium.sequential); instances after that are not called
+        - wave_size: int (default 3)
+          Instances launched per wave in sequential mode
+        - wilson_z: float (default 1.645)
+          z-score of the one-sided Wilson lower bound (95%)
+        - sprt_p1, sprt_alpha, sprt_beta: float (defaults 0.85, 0.05, 0.2)
+          Alternative leader share and error rates for the SPRT rule
     """
+
+    SIMILARITY_METHODS = ("minhash", "difflib")
+    SIMILARITY_BACKENDS = ("lexical", "embedding")
     
     def _validate_params(self):
         """Validate strategy-specific parameters"""
@@ -45,11 +83,61 @@ class VotingStrategy(ConsortiumStrategy):
         self.fallback_to_all = bool(
             self.params.get('fallback_to_all', True)
         )
+        self.similarity_method = str(
+            self.params.get('similarity_method', 'minhash')
+        ).strip().lower()
+        self.similarity_backend = str(
+            self.params.get('similarity_backend', 'lexical')
+        ).strip().lower()
+        self.embedding_threshold = float(
+            self.params.get('embedding_threshold', 0.85)
+        )
+        self.answer_extractors = parse_extractor_names(
+            self.params.get('answer_extractor')
+        )
+        self.answer_options = {
+            'answer_tag': self.params.get('answer_tag', 'answer'),
+            'answer_pattern': self.params.get('answer_pattern'),
+        }
+        self.sequential = str(
+            self.params.get('sequential', 'off')
+        ).strip().lower()
+        self.wave_size = int(self.params.get('wave_size', 3))
+        self.wilson_z = float(self.params.get('wilson_z', 1.645))
+        self.sprt_p1 = float(self.params.get('sprt_p1', 0.85))
+        self.sprt_alpha = float(self.params.get('sprt_alpha', 0.05))
+        self.sprt_beta = float(self.params.get('sprt_beta', 0.2))
+        shingle_size = self.params.get('shingle_size')
+        self.shingle_size = int(shingle_size) if shingle_size not in (None, "") else None
         
         if not 0 <= self.similarity_threshold <= 1:
             raise ValueError("similarity_threshold must be between 0 and 1")
         if self.answer_length < 10:
             raise ValueError("answer_length must be at least 10 characters")
+        if self.similarity_method not in self.SIMILARITY_METHODS:
+            raise ValueError(
+                f"similarity_method must be one of: {', '.join(self.SIMILARITY_METHODS)}"
+            )
+        if self.similarity_backend not in self.SIMILARITY_BACKENDS:
+            raise ValueError(
+                f"similarity_backend must be one of: {', '.join(self.SIMILARITY_BACKENDS)}"
+            )
+        if not 0 <= self.embedding_threshold <= 1:
+            raise ValueError("embedding_threshold must be between 0 and 1")
+        if self.shingle_size is not None and self.shingle_size < 1:
+            raise ValueError("shingle_size must be at least 1")
+        if 'regex' in self.answer_extractors and not self.answer_options['answer_pattern']:
+            raise ValueError("answer_pattern is required for the regex answer extractor")
+        if self.sequential not in ('off',) + STOPPING_RULES:
+            raise ValueError(
+                f"sequential must be one of: off, {', '.join(STOPPING_RULES)}"
+            )
+        if self.wave_size < 1:
+            raise ValueError("wave_size must be at least 1")
+        if not 0.5 < self.sprt_p1 < 1:
+            raise ValueError("sprt_p1 must be between 0.5 and 1")
+        if not (0 < self.sprt_alpha < 1 and 0 < self.sprt_beta < 1):
+            raise ValueError("sprt_alpha and sprt_beta must be between 0 and 1")
     
     def initialize_state(self):
         """Initialize voting tracking state"""
@@ -57,6 +145,7 @@ class VotingStrategy(ConsortiumStrategy):
         self.iteration_state['voting_history'] = []
         self.iteration_state['consensus_count'] = 0
         self.iteration_state['no_consensus_count'] = 0
+        self.iteration_state['sampling_history'] = []
     
     def select_models(self, available_models: Dict[str, int], 
                      current_prompt: str, iteration: int) -> Dict[str, int]:
@@ -64,6 +153,31 @@ class VotingStrategy(ConsortiumStrategy):
         logger.debug(f"[VotingStrategy Iteration {iteration}] Using all models: {available_models}")
         return available_models.copy()
     
+    def sampling_wave_size(self) -> Optional[int]:
+        """Launch instances in waves when sequential sampling is enabled."""
+        return self.wave_size if self.sequential != 'off' else None
+
+    def sampling_settled(self, responses: List[Dict[str, Any]], iteration: int) -> bool:
+        """Whether the leading group's majority is settled by the samples so far."""
+        if self.sequential == 'off' or len(responses) < 2:
+            return False
+        # Group copies so the final vote in process_responses starts from clean responses
+        groups = self._group_similar_responses([dict(response) for response in responses])
+        leader = max(len(group) for group in groups)
+        settled = majority_settled(
+            leader, len(responses), self.sequential,
+            z=self.wilson_z, p1=self.sprt_p1, alpha=self.sprt_alpha, beta=self.sprt_beta,
+        )
+        self.iteration_state.setdefault('sampling_history', []).append({
+            'iteration': iteration,
+            'samples': len(responses),
+            'leader': leader,
+            'settled': settled,
+        })
+        logger.debug(f"[VotingStrategy Iteration {iteration}] Sequential {self.sequential}: "
+                     f"leader {leader}/{len(responses)}, settled={settled}")
+        return settled
+
     def _add_voting_metadata(self, responses: List[Dict[str, Any]], 
                            selected: bool, group_size: int, total: int):
         """Add voting metadata to responses."""
@@ -74,81 +188,141 @@ class VotingStrategy(ConsortiumStrategy):
     
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two text snippets."""
-        # Common conversational preambles to strip
-        preamble_patterns = [
-            r"^(certainly|sure|okay|ok|absolutely|i can help with that|here is|here's|the answer is|based on the information)\b",
-            r"^(i'd be happy|i would be happy|let me help|let's look at this)\b",
-            r"^\s*[\!\.\,\:\;]+\s*" # Leading punctuation
-        ]
-
-        def normalize(text):
-            text = text.lower().strip()
-            
-            # Remove common conversational prefixes (apply a few times to catch chains)
-            for _ in range(3):
-                changed = False
-                for pattern in preamble_patterns:
-                    new_text = re.sub(pattern, "", text, flags=re.IGNORECASE).strip()
-                    if new_text != text:
-                        text = new_text
-                        changed = True
-                if not changed:
-                    break
-            
-            # Remove common punctuation
-            text = re.sub(r'[^\w\s]', '', text)
-            # Normalize whitespace
-            text = re.sub(r'\s+', ' ', text.strip())
-            return text
-        
+        if self.similarity_method == 'minhash':
+            return self._build_index([text1, text2]).similarity(0, 1)
+
         # Normalize the strings before slicing to ensure we compare the content
-        n1: str = normalize(text1)
-        n2: str = normalize(text2)
-        norm1 = n1[:self.answer_length]
-        norm2 = n2[:self.answer_length]
-        
+        return self._difflib_ratio(
+            normalize_answer(text1)[:self.answer_length],
+            normalize_answer(text2)[:self.answer_length],
+        )
+
+    @staticmethod
+    def _difflib_ratio(norm1: str, norm2: str) -> float:
         if not norm1 or not norm2:
             return 1.0 if norm1 == norm2 else 0.0
+        return difflib.SequenceMatcher(None, norm1, norm2).ratio()
+
+    def _build_index(self, texts: List[str], normalized: Optional[List[str]] = None) -> NearDuplicateIndex:
+        return NearDuplicateIndex(
+            texts,
+            threshold=self.similarity_threshold,
+            answer_length=self.answer_length,
+            shingle_size=self.shingle_size,
+            normalized=normalized,
+        )
 
-        # Use difflib's sequence matcher for similarity
-        similarity = difflib.SequenceMatcher(None, norm1, norm2).ratio()
-        return similarity
-    
     def _group_similar_responses(self, responses: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
-        """Group responses by similarity."""
+        """Group responses by extracted final answer, then by similarity."""
+        if not self.answer_extractors:
+            return self._group_by_similarity(responses)
+
+        groups, unresolved = self._group_by_answer(responses)
+        if unresolved:
+            groups.extend(self._group_by_similarity(unresolved))
+        return groups
+
+    def _group_by_answer(self, responses: List[Dict[str, Any]]):
+        """Exact voting on canonical answers with a hash map; returns (groups, unresolved)."""
+        by_answer: Dict[str, List[Dict[str, Any]]] = OrderedDict()
+        unresolved = []
+        for response in responses:
+            answer = extract_answer(response.get('response', ''), self.answer_extractors, self.answer_options)
+            response['extracted_answer'] = answer
+            if answer is None:
+                unresolved.append(response)
+                continue
+            group = by_answer.setdefault(answer, [])
+            if group:
+                response['similarity_to_group'] = 1.0
+            group.append(response)
+        if unresolved:
+            logger.debug(f"[VotingStrategy] No final answer extracted from {len(unresolved)} response(s); "
+                         f"using similarity grouping for those")
+        return list(by_answer.values()), unresolved
+
+    def _group_by_similarity(self, responses: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group responses by similarity.
+
+        Each response is normalized once. Groups are built greedily: the first
+        ungrouped response seeds a group and absorbs every later ungrouped
+        response at or above ``similarity_threshold``.
+        """
         if not responses:
             return []
-        
+
+        texts = [response.get('response', '') for response in responses]
+        if self.similarity_backend == 'embedding':
+            return self._group_by_embedding(responses, texts)
+        normalized = self._features().normalized(texts)
+        if self.similarity_method == 'minhash':
+            index = self._build_index(texts, normalized)
+            candidates = index.candidates
+            similarity = index.similarity
+        else:
+            normalized = [text[:self.answer_length] for text in normalized]
+
+            def candidates(i):
+                return range(i + 1, len(responses))
+
+            def similarity(i, j):
+                return self._difflib_ratio(normalized[i], normalized[j])
+
         groups = []
         used_indices = set()
-        
+
         for i, response in enumerate(responses):
             if i in used_indices:
                 continue
-            
+
             # Start a new group
             current_group = [response]
-            current_text = response.get('response', '')
             used_indices.add(i)
-            
-            # Find all similar responses
-            for j, other in enumerate(responses):
-                if j <= i or j in used_indices:
+
+            # Find all similar responses among the candidates
+            for j in candidates(i):
+                if j in used_indices:
                     continue
-                
-                other_text = other.get('response', '')
-                similarity = self._calculate_similarity(current_text, other_text)
-                
+
+                score = similarity(i, j)
+
                 # Only add to group if similarity is high enough
-                if similarity >= self.similarity_threshold:
-                    current_group.append(other)
+                if score >= self.similarity_threshold:
+                    current_group.append(responses[j])
                     used_indices.add(j)
-                    other['similarity_to_group'] = similarity
-            
+                    responses[j]['similarity_to_group'] = score
+
             groups.append(current_group)
-        
+
         return groups
     
+    def _group_by_embedding(self, responses: List[Dict[str, Any]], texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Greedy grouping on the cosine similarity matrix, one vectorized row per group."""
+        try:
+            embeddings = self._features().embeddings(texts)
+        except Exception as e:
+            logger.error(f"Failed to embed responses for voting: {e}")
+            raise RuntimeError(f"Voting strategy failed to get embeddings: {e}")
+
+        for response, vector in zip(responses, embeddings):
+            response['embedding'] = vector
+
+        similarity = self._response_geometry(embeddings).similarity
+        ungrouped = np.ones(len(responses), dtype=bool)
+        groups = []
+        for i in range(len(responses)):
+            if not ungrouped[i]:
+                continue
+            members = np.flatnonzero(ungrouped & (similarity[i] >= self.embedding_threshold))
+            members = members[members != i]
+            ungrouped[i] = False
+            ungrouped[members] = False
+            for j in members:
+                responses[j]['similarity_to_group'] = float(similarity[i, j])
+            groups.append([responses[i]] + [responses[j] for j in members])
+
+        return groups
+
     def process_responses(self, successful_responses: List[Dict[str, Any]], 
                          iteration: int) -> List[Dict[str, Any]]:
         """Select most common answer from responses."""
@@ -192,7 +366,7 @@ class VotingStrategy(ConsortiumStrategy):
         # Record voting history
         self.iteration_state['voting_history'].append({
             'iteration': iteration,
-            'groups': [{'size': len(g), 'responses': g} for g in groups],
+            'groups': [{'size': len(g), 'responses': g, 'answer': g[0].get('extracted_answer')} for g in groups],
             'selected_group_size': largest_size,
             'total_responses': total_responses,
             'consensus': has_consensus
@@ -1,11 +1,10 @@
-import json
 from typing import List
 
 import numpy as np
 import plotly.graph_objects as go
 from sklearn.manifold import TSNE
 
-from .db import get_embedding_records_for_run, save_run_visualization
+from .db import decode_embedding, get_embedding_records_for_run, save_run_visualization
 
 
 class EmbeddingProjector:
@@ -25,7 +24,7 @@ def generate_run_visualization(run_id: str):
     if not records:
         raise ValueError(f"No embeddings found for run '{run_id}'")
 
-    embeddings = [json.loads(record["embedding_json"]) for record in records]
+    embeddings = [decode_embedding(record) for record in records]
     coordinates = EmbeddingProjector().project_tsne(embeddings, perplexity=min(5, len(embeddings) - 1 or 1))
 
     hover_text: List[str] = []
@@ -0,0 +1,71 @@
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+from llm_consortium.db import DatabaseConnection
+
+SYNTHESIS = "<synthesis>ok</synthesis><confidence>0.9</confidence>"
+
+
+def rank_highest_first(ids):
+    """Arbiter answer merging the responses it sees and ranking the highest id first."""
+    ranking = "".join(f'<rank position="{p}">{rid}</rank>' for p, rid in enumerate(sorted(ids, reverse=True), 1))
+    return f"<synthesis>merged {ids}</synthesis><confidence>0.9</confidence><ranking>{ranking}</ranking>"
+
+
+def _stub_arbiter(reply=SYNTHESIS):
+    """Arbiter model that records each prompt and the response ids it lists.
+
+    ``reply`` is the arbiter's answer, or a callable building it from those ids.
+    """
+    model = MagicMock()
+    model.prompts, model.seen = [], []
+
+    def prompt(text, stream=False):
+        ids = [int(rid) for rid in re.findall(r"--- RESPONSE (\d+) ", text)]
+        model.prompts.append(text)
+        model.seen.append(sorted(ids))
+        response = MagicMock()
+        response.id = f"arbiter-{len(model.prompts)}"
+        response.text.return_value = reply(ids) if callable(reply) else reply
+        return response
+
+    model.prompt.side_effect = prompt
+    return model
+
+
+def _synthesize(stubs, responses, consortium_id=None, **config):
+    """One manual-mode arbiter synthesis of ``responses``; ``stubs`` maps model ids to stub models."""
+    config.setdefault("models", {"m": len(responses)})
+    orchestrator = ConsortiumOrchestrator(ConsortiumConfig(arbiter="arbiter", **config))
+    orchestrator.consortium_id = consortium_id
+    with patch("llm_consortium.orchestrator.llm.get_model", side_effect=lambda model_id: stubs[model_id]), \
+            patch("llm_consortium.orchestrator.log_response"):
+        return orchestrator._synthesize_responses_manual("question", responses, [], 1)
+
+
+@pytest.fixture
+def stub_arbiter():
+    return _stub_arbiter
+
+
+@pytest.fixture
+def ranking_arbiter():
+    return lambda: _stub_arbiter(rank_highest_first)
+
+
+@pytest.fixture
+def synthesize():
+    return _synthesize
+
+
+@pytest.fixture
+def isolated_db(monkeypatch, tmp_path):
+    monkeypatch.setattr("llm_consortium.db.user_dir", lambda: tmp_path)
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+    yield tmp_path
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
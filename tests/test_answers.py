@@ -0,0 +1,59 @@
+import pytest
+
+from llm_consortium.answers import (
+    available_answer_extractors,
+    canonical_number,
+    extract_answer,
+    parse_extractor_names,
+    register_answer_extractor,
+)
+
+
+@pytest.mark.parametrize(
+    "extractors, text, expected",
+    [
+        (["tag"], "Working...\n<answer> 1,000 </answer>", "1000"),
+        (["tag"], "Step 1...\nANSWER: 2", "2"),
+        (["tag"], "<answer>Paris</answer> then <answer>Lyon.</answer>", "lyon"),
+        (["number"], "so x = 0.50, earlier we had 3", "3"),
+        (["number"], "The total is 3/6.", "1/2"),
+        (["number"], "No digits in v2 or x3", None),
+        (["boolean"], "YES. The query interpolates user input.", "yes"),
+        (["boolean"], "False - this is not correct", "no"),
+        (["boolean"], "The query has no errors, so the verdict is YES.", "yes"),
+        (["boolean"], "Checking the joins.\nNo. The filter drops rows.", "no"),
+        (["choice"], "After elimination the answer is (c).", "C"),
+        (["choice"], "B) because the others fail", "B"),
+        (["choice"], "A clear winner emerges", None),
+        (["choice"], "The answer is a prime number, namely 7.", None),
+        (["choice"], "Answer: I believe it is (C).", "C"),
+        (["choice"], "The answer is B because the others fail", "B"),
+        (["tag", "number"], "I think it's 42", "42"),
+    ],
+)
+def test_extract_answer(extractors, text, expected):
+    assert extract_answer(text, extractors) == expected
+
+
+def test_regex_extractor_uses_first_group():
+    options = {"answer_pattern": r"final:\s*(\w+)"}
+    assert extract_answer("final: Alpha\nFINAL: beta", ["regex"], options) == "beta"
+
+
+def test_canonical_number_equates_decimal_and_fraction_forms():
+    assert canonical_number("0.50") == canonical_number("1/2") == "1/2"
+    assert canonical_number("-12.") == "-12"
+    assert canonical_number("abc") is None
+
+
+def test_parse_extractor_names_validates():
+    assert parse_extractor_names("Tag, number") == ["tag", "number"]
+    assert parse_extractor_names(None) == []
+    with pytest.raises(ValueError, match="Unknown answer extractor"):
+        parse_extractor_names("tag,guess")
+
+
+def test_register_answer_extractor():
+    register_answer_extractor("upper-first-word", lambda text, options: text.split()[0].upper() if text.split() else None)
+    assert "upper-first-word" in available_answer_extractors()
+    assert extract_answer("paris is it", ["upper-first-word"]) == "PARIS"
@@ -0,0 +1,141 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+
+
+def _ranking(*ids):
+    return "<ranking>" + "".join(f'<rank position="{p}">{rid}</rank>' for p, rid in enumerate(ids, 1)) + "</ranking>"
+
+
+def _arbiter(text, gate=None):
+    """Arbiter whose responses, like llm's, only make the request when text() is called."""
+    model = MagicMock()
+
+    def prompt(*args, **kwargs):
+        def text_():
+            if gate is not None:
+                gate.wait(5)
+            return text
+
+        response = MagicMock()
+        response.text.side_effect = text_
+        return response
+
+    model.prompt.side_effect = prompt
+    return model
+
+
+def _orchestrator(arbiters, **config):
+    return ConsortiumOrchestrator(ConsortiumConfig(
+        models={"m": 3}, arbiter=arbiters[0], arbiter_ensemble=arbiters[1:], **config
+    ))
+
+
+RESPONSES = [
+    {"id": 0, "model": "a", "response": "zero", "response_id": "r0"},
+    {"id": 1, "model": "b", "response": "one", "response_id": "r1"},
+    {"id": 2, "model": "c", "response": "two", "response_id": "r2"},
+]
+
+
+def _synthesize(orchestrator, models):
+    with patch("llm_consortium.orchestrator.llm.get_model", side_effect=lambda model_id: models[model_id]), \
+            patch("llm_consortium.orchestrator.log_response"):
+        return orchestrator._synthesize_responses_manual("question", RESPONSES, [], 1)
+
+
+def test_quorum_proceeds_without_the_slowest_arbiter():
+    gate = threading.Event()
+    models = {
+        "a": _arbiter(f"<synthesis>A</synthesis><confidence>0.9</confidence>{_ranking(0, 1, 2)}"),
+        "b": _arbiter(f"<synthesis>B</synthesis><confidence>0.7</confidence>{_ranking(1, 2, 0)}"),
+        "slow": _arbiter("<synthesis>late</synthesis><confidence>0.1</confidence>", gate=gate),
+    }
+    try:
+        # The slow arbiter is submitted first, so a sequential text() loop would wait for it
+        result = _synthesize(_orchestrator(["slow", "a", "b"], arbiter_quorum=2), models)
+    finally:
+        gate.set()
+
+    assert sorted(result["arbiter_ensemble"]["models"]) == ["a", "b"]
+    assert result["confidence"] == 0.8
+    assert result["synthesis"] == "A"
+    # Borda: 1 -> 4 points, 0 -> 1, 2 -> 1 (tie keeps first-seen order)
+    assert result["ranking"] == [1, 0, 2]
+    assert result["chosen_response_id"] == "r1"
+
+
+def test_unparseable_arbiter_is_skipped():
+    models = {
+        "a": _arbiter("I cannot decide."),
+        "b": _arbiter("<synthesis>B</synthesis><confidence>0.6</confidence><refinement_areas><area>x</area></refinement_areas>"),
+        "c": _arbiter("<synthesis>C</synthesis><confidence>0.8</confidence><needs_iteration>true</needs_iteration>"),
+    }
+
+    result = _synthesize(_orchestrator(["a", "b", "c"], arbiter_quorum=3), models)
+
+    # The quorum cannot be reached, so the two parsed decisions are merged
+    assert result["arbiter_ensemble"]["failed"] == ["a"]
+    assert sorted(result["arbiter_ensemble"]["models"]) == ["b", "c"]
+    assert result["synthesis"] == "C"
+    assert result["refinement_areas"] == ["x"]
+    # One of two arbiters is not a majority
+    assert result["needs_iteration"] is False
+
+
+def test_all_arbiters_failing_reports_parse_failure():
+    models = {"a": _arbiter("nothing"), "b": _arbiter("still nothing")}
+
+    result = _synthesize(_orchestrator(["a", "b"]), models)
+
+    assert result["confidence"] == 0.0
+    assert result["analysis"].startswith("Parsing failed")
+
+
+def test_rank_judging_uses_the_borda_winner():
+    models = {
+        "a": _arbiter(_ranking(2, 0, 1)),
+        "b": _arbiter(_ranking(2, 1, 0)),
+        "c": _arbiter(_ranking(0, 2, 1)),
+    }
+
+    result = _synthesize(_orchestrator(["a", "b", "c"], judging_method="rank", arbiter_quorum=3), models)
+
+    assert result["ranking"][0] == 2
+    assert result["synthesis"] == "two"
+
+
+def test_default_quorum_is_a_majority():
+    models = {name: _arbiter("<synthesis>ok</synthesis><confidence>0.5</confidence>") for name in "abcd"}
+
+    result = _synthesize(_orchestrator(list("abcd")), models)
+
+    assert result["arbiter_ensemble"]["quorum"] == 3
+    assert len(result["arbiter_ensemble"]["models"]) == 3
+
+
+def test_borda_ranking():
+    assert ConsortiumOrchestrator._borda_ranking([[3, 1, 2], [1, 3, 2], [1, 2]]) == [1, 3, 2]
+
+
+def test_ensemble_without_primary_arbiter():
+    config = ConsortiumConfig(models={"m": 1}, arbiter_ensemble=["x", "y"])
+
+    assert config.arbiter == "x"
+
+
+def test_rank_ensemble_returns_the_original_text_of_compacted_responses():
+    long_text = "The tide is caused by the moon's gravity. " + "Further detail follows here. " * 200
+    responses = [dict(RESPONSES[0], response=long_text)] + RESPONSES[1:]
+    models = {"a": _arbiter(_ranking(0, 1, 2)), "b": _arbiter(_ranking(0, 2, 1))}
+    orchestrator = _orchestrator(["a", "b"], judging_method="rank", arbiter_response_tokens=50)
+
+    with patch("llm_consortium.orchestrator.llm.get_model", side_effect=lambda model_id: models[model_id]), \
+            patch("llm_consortium.orchestrator.log_response"):
+        result = orchestrator._synthesize_responses_manual("question", responses, [], 1)
+
+    arbiter_prompt = models["a"].prompt.call_args.args[0]
+    assert long_text not in arbiter_prompt
+    assert result["synthesis"] == long_text
+    assert result["ranking"][0] == 0
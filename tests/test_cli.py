@@ -120,6 +120,31 @@ def test_save_command_persists_embedding_configuration():
     assert float(config.strategy_params["eps"]) == 0.5
 
 
+def test_save_command_persists_json_judging_schema(tmp_path):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps({"type": "object", "properties": {"answer": {"type": "integer"}}}))
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        "consortium", "save", "json-consortium",
+        "--model", "dummy:3",
+        "--arbiter", "dummy",
+        "--judging-method", "json",
+        "--json-schema", str(schema_path),
+    ])
+    assert result.exit_code == 0, result.output
+
+    config = _get_consortium_configs()["json-consortium"]
+    assert config.judging_method == "json"
+    assert config.json_schema["properties"]["answer"]["type"] == "integer"
+
+    bad = runner.invoke(cli, [
+        "consortium", "save", "bad-json", "--model", "dummy", "--arbiter", "dummy",
+        "--judging-method", "json", "--json-schema", "{not json",
+    ])
+    assert bad.exit_code != 0
+    assert "Invalid --json-schema" in bad.output
+
+
 def test_config_to_dict_includes_embedding_fields():
     config = _get_consortium_configs()
     assert isinstance(config, dict)
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from llm_consortium import clustering
+from llm_consortium.geometry import ResponseGeometry
+
+
+def _geometry(vectors):
+    return ResponseGeometry([np.array(vector, dtype=float) for vector in vectors])
+
+
+CONSENSUS = [
+    [1.0, 0.0, 0.0],
+    [0.98, 0.05, 0.0],
+    [0.97, 0.0, 0.05],
+    [0.99, 0.02, 0.02],
+    [0.96, 0.04, 0.03],
+    [0.0, 1.0, 0.0],
+    [0.05, 0.98, 0.0],
+    [0.0, 0.97, 0.06],
+    [0.0, 0.0, 1.0],
+]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_dbscan_matches_sklearn(seed):
+    sklearn_cluster = pytest.importorskip("sklearn.cluster")
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(int(rng.integers(3, 40)), 8))
+    eps = float(rng.uniform(0.2, 0.8))
+    min_samples = int(rng.integers(1, 4))
+
+    expected = sklearn_cluster.DBSCAN(eps=eps, min_samples=min_samples, metric="cosine").fit_predict(vectors)
+    assert clustering.dbscan(_geometry(vectors), eps, min_samples) == expected.tolist()
+
+
+def test_agglomerative_threshold_separates_groups_and_noise():
+    labels = clustering.agglomerative(_geometry(CONSENSUS), eps=0.1, min_samples=2)
+    assert labels == [0, 0, 0, 0, 0, 1, 1, 1, -1]
+
+
+def test_agglomerative_rejects_unknown_linkage():
+    with pytest.raises(ValueError, match="linkage"):
+        clustering.agglomerative(_geometry(CONSENSUS), eps=0.1, min_samples=2, linkage="ward")
+
+
+def test_tropical_keeps_one_consensus_cluster():
+    labels = clustering.tropical(_geometry(CONSENSUS), eps=0.1, min_samples=2)
+    assert labels == [0, 0, 0, 0, 0, -1, -1, -1, -1]
+
+
+def test_tropical_reports_no_consensus_below_min_samples():
+    labels = clustering.tropical(_geometry([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]]), eps=0.05, min_samples=2)
+    assert labels == [-1, -1, -1]
+
+
+def test_empty_input_returns_no_labels():
+    for name in ("dbscan", "agglomerative", "tropical"):
+        assert clustering.cluster(name, _geometry([]), 0.3, 2) == []
+
+
+def test_cluster_rejects_unknown_algorithm():
+    with pytest.raises(ValueError, match="Unsupported clustering algorithm"):
+        clustering.cluster("kmeans", _geometry(CONSENSUS), 0.3, 2)
+
+
+def test_hdbscan_without_package_raises_install_hint(monkeypatch):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == "hdbscan":
+            raise ImportError("No module named 'hdbscan'")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+    with pytest.raises(ImportError, match="pip install llm-consortium\\[embeddings\\]"):
+        clustering.hdbscan_clusters(_geometry(CONSENSUS), 0.3, 2)
@@ -0,0 +1,117 @@
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from llm_consortium import ConsortiumConfig
+from llm_consortium.compaction import estimate_tokens, split_blocks, truncate_to_tokens
+from llm_consortium.db import DatabaseConnection, save_consortium_member
+
+LONG = "\n\n".join(
+    [f"Step {i}. " + "Some supporting detail that goes on for a while. " * 6 for i in range(20)]
+    + ["Conclusion: use option B."]
+)
+
+
+def test_split_blocks_keeps_fenced_code_whole():
+    text = "Intro.\n\n```python\nx = 1\n\ny = 2\n```\n\nOutro."
+
+    assert split_blocks(text) == ["Intro.", "```python\nx = 1\n\ny = 2\n```", "Outro."]
+
+
+def test_truncation_keeps_the_opening_and_the_conclusion():
+    short = truncate_to_tokens(LONG, 200)
+
+    assert estimate_tokens(short) <= 200
+    assert short.startswith("Step 0.")
+    assert short.endswith("Conclusion: use option B.")
+    assert re.search(r"\[\.\.\. \d+ tokens omitted \.\.\.\]", short)
+
+
+def test_short_text_is_not_truncated():
+    assert truncate_to_tokens("A short answer.", 50) == "A short answer."
+
+
+@pytest.fixture
+def models(stub_arbiter):
+    def models(summary="Condensed: use option B.", fail=False):
+        arbiter = stub_arbiter()
+        compactor, calls = _compactor(summary, fail)
+        return {"arbiter": arbiter, "compactor": compactor}, arbiter.prompts, calls
+    return models
+
+
+def _compactor(summary, fail):
+    calls = []
+
+    def compactor_prompt(text, stream=False):
+        calls.append(text)
+        if fail:
+            raise RuntimeError("rate limited")
+        response = MagicMock()
+        response.id = f"compact-{len(calls)}"
+        response.text.return_value = summary
+        return response
+
+    compactor = MagicMock()
+    compactor.prompt.side_effect = compactor_prompt
+    return compactor, calls
+
+
+def _responses():
+    return [
+        {"id": 0, "model": "m0", "response": LONG, "response_id": "resp-0"},
+        {"id": 1, "model": "m1", "response": "Use option A.", "response_id": "resp-1"},
+    ]
+
+
+def test_over_budget_responses_are_summarized(models, synthesize):
+    stubs, seen, calls = models()
+    responses = _responses()
+
+    synthesize(stubs, responses, arbiter_response_tokens=100, compaction_model="compactor")
+
+    assert len(calls) == 1
+    assert "Condensed: use option B." in seen[0]
+    assert "Step 19." not in seen[0]
+    assert "Use option A." in seen[0]
+    # The originals are untouched
+    assert responses[0]["response"] == LONG
+
+
+def test_truncation_is_the_fallback(models, synthesize):
+    stubs, seen, calls = models(fail=True)
+
+    synthesize(stubs, _responses(), arbiter_response_tokens=100, compaction_model="compactor")
+
+    assert len(calls) == 1
+    assert "tokens omitted" in seen[0]
+    assert "Conclusion: use option B." in seen[0]
+
+
+def test_compaction_is_off_by_default(models, synthesize):
+    stubs, seen, calls = models()
+
+    synthesize(stubs, _responses())
+
+    assert not calls
+    assert "Step 19." in seen[0]
+
+
+def test_budget_must_be_positive():
+    with pytest.raises(ValueError):
+        ConsortiumConfig(models={"m": 1}, arbiter="arbiter", arbiter_response_tokens=0)
+
+
+def test_compaction_ratios_are_stored_with_consortium_members(models, synthesize, isolated_db):
+    for i in range(2):
+        save_consortium_member("run-1", f"resp-{i}", f"m{i}", 1, 0)
+    stubs, _, _ = models()
+
+    synthesize(stubs, _responses(), consortium_id="run-1", arbiter_response_tokens=100)
+
+    db = DatabaseConnection.get_connection()
+    rows = {row["response_id"]: row["compaction_ratio"] for row in db.query(
+        "SELECT response_id, compaction_ratio FROM consortium_members WHERE run_id = 'run-1'")}
+    assert 0 < rows["resp-0"] < 0.2
+    assert rows["resp-1"] is None
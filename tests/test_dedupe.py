@@ -0,0 +1,51 @@
+import re
+
+import pytest
+
+
+def _responses():
+    texts = ["The answer is 42."] * 2 + ["The answer is 7."] + ["the answer is 42"] * 3
+    return [
+        {"id": i, "model": f"m{i % 2}", "response": text, "response_id": f"resp-{i}"}
+        for i, text in enumerate(texts)
+    ]
+
+
+@pytest.fixture
+def run(ranking_arbiter, synthesize):
+    def run(**config):
+        arbiter = ranking_arbiter()
+        result = synthesize({"arbiter": arbiter}, _responses(), models={"m0": 3, "m1": 3}, **config)
+        return result, arbiter.prompts
+    return run
+
+
+def test_identical_responses_reach_the_arbiter_once(run):
+    result, prompts = run()
+
+    assert re.findall(r"--- RESPONSE (\d+) ", prompts[0]) == ["0", "2"]
+    assert "Model: m0, m1; given by 5 members (ids 0, 1, 3, 4, 5)" in prompts[0]
+
+
+def test_ranking_expands_to_every_duplicate(run):
+    result, _ = run()
+
+    # The arbiter ranks 2 above 0; 0 stands for members 0, 1, 3, 4 and 5
+    assert result["ranking"] == [2, 0, 1, 3, 4, 5]
+    assert result["chosen_response_id"] == "resp-2"
+    assert "hierarchy" not in result
+
+
+def test_dedupe_can_be_disabled(run):
+    result, prompts = run(dedupe_responses=False)
+
+    assert re.findall(r"--- RESPONSE (\d+) ", prompts[0]) == [str(i) for i in range(6)]
+    assert result["ranking"] == [5, 4, 3, 2, 1, 0]
+
+
+def test_dedupe_composes_with_hierarchical_judging(run):
+    result, prompts = run(judging_method="hierarchical", arbiter_group_size=2)
+
+    # Two distinct answers fit one group, so no reduction happens
+    assert len(prompts) == 1
+    assert result["ranking"] == [2, 0, 1, 3, 4, 5]
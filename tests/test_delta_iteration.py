@@ -0,0 +1,111 @@
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+from llm_consortium.compaction import novel_sentences
+
+SYNTHESIS = {
+    "synthesis": "The answer is 42. It follows from the third term of the series. Check the units.",
+    "confidence": 0.55,
+    "dissent": "One member argued for 17.",
+    "refinement_areas": ["Show the third term"],
+}
+
+
+def _orchestrator(**config):
+    orchestrator = ConsortiumOrchestrator(ConsortiumConfig(models={"m": 2}, arbiter="arbiter", **config))
+    orchestrator.iteration_history = [{
+        "iteration": 1,
+        "model_responses": [{"model": "m", "instance": 0, "response": "I think the answer is 42.", "id": 1}],
+        "synthesis": dict(SYNTHESIS),
+    }]
+    return orchestrator
+
+
+def test_novel_sentences_skip_points_the_reference_makes():
+    assert novel_sentences(SYNTHESIS["synthesis"], "I think the answer is 42.") == [
+        "It follows from the third term of the series.", "Check the units.",
+    ]
+
+
+def test_delta_prompt_sends_only_what_the_member_lacks():
+    orchestrator = _orchestrator(iteration_prompt="delta")
+
+    delta = orchestrator.strategy.prepare_iteration_prompt("m", 0, "Sum the series", 2)
+    full = _orchestrator().strategy.prepare_iteration_prompt("m", 0, "Sum the series", 2)
+
+    assert "confidence in the current synthesis is 0.55" in delta
+    assert "- Show the third term" in delta
+    assert "One member argued for 17." in delta
+    assert "- It follows from the third term of the series." in delta
+    assert "The answer is 42." not in delta
+    assert SYNTHESIS["synthesis"] in full
+
+
+def test_members_without_a_previous_answer_get_the_full_synthesis():
+    orchestrator = _orchestrator(iteration_prompt="delta")
+
+    assert SYNTHESIS["synthesis"] in orchestrator.strategy.prepare_iteration_prompt("m", 1, "Sum the series", 2)
+
+
+def test_manual_context_always_gets_the_full_synthesis():
+    orchestrator = _orchestrator(iteration_prompt="delta", manual_context=True)
+
+    assert SYNTHESIS["synthesis"] in orchestrator.strategy.prepare_iteration_prompt("m", 0, "Sum the series", 2)
+
+
+def test_iteration_prompt_is_validated():
+    with pytest.raises(ValueError):
+        ConsortiumConfig(models={"m": 1}, arbiter="arbiter", iteration_prompt="diff")
+
+
+class _Options(BaseModel):
+    max_tokens: int = 0
+
+
+def test_revision_max_tokens_is_passed_where_supported():
+    orchestrator = _orchestrator(revision_max_tokens=300)
+    supported = MagicMock(Options=_Options)
+
+    assert orchestrator._revision_options(supported, 2) == {"max_tokens": 300}
+    assert orchestrator._revision_options(supported, 1) == {}
+    assert orchestrator._revision_options(MagicMock(), 2) == {}
+    assert "under 300 tokens" in orchestrator.strategy.prepare_iteration_prompt("m", 0, "Sum the series", 2)
+
+
+def test_member_token_usage_is_recorded_per_iteration():
+    usage = iter([(100, 400), (100, 400), (60, 150), (60, 150)])
+
+    def member_prompt(text, system=None, **options):
+        response = MagicMock()
+        response.text.return_value = "I think the answer is 42."
+        response.id = str(uuid.uuid4())
+        tokens = next(usage)
+        response.usage.return_value = MagicMock(input=tokens[0], output=tokens[1])
+        return response
+
+    arbiter_text = ("<synthesis>The answer is 42.</synthesis><confidence>0.5</confidence>"
+                    "<needs_iteration>true</needs_iteration>")
+    member, arbiter = MagicMock(), MagicMock()
+    member.conversation.side_effect = lambda: MagicMock(prompt=MagicMock(side_effect=member_prompt))
+    arbiter.conversation.return_value.prompt.return_value.text.return_value = arbiter_text
+    models = {"m": member, "arbiter": arbiter}
+
+    orchestrator = ConsortiumOrchestrator(ConsortiumConfig(
+        models={"m": 2}, arbiter="arbiter", max_iterations=2, iteration_prompt="delta",
+    ))
+    with patch("llm_consortium.orchestrator.llm.get_model", side_effect=lambda model_id: models[model_id]), \
+            patch("llm_consortium.orchestrator.save_consortium_run"), \
+            patch("llm_consortium.orchestrator.update_consortium_run"), \
+            patch("llm_consortium.orchestrator.save_arbiter_decision"), \
+            patch("llm_consortium.orchestrator.save_consortium_member"), \
+            patch("llm_consortium.orchestrator.log_response"):
+        result = orchestrator.orchestrate("Sum the series", consortium_id=str(uuid.uuid4()))
+
+    assert [it["token_usage"] for it in result["iterations"]] == [
+        {"input_tokens": 200, "output_tokens": 800},
+        {"input_tokens": 120, "output_tokens": 300},
+    ]
@@ -0,0 +1,119 @@
+import gc
+import sys
+import types
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from llm_consortium.embeddings.backends import HashingBackend
+from llm_consortium.embeddings.registry import (
+    EmbeddingBackendRegistry,
+    backend_key,
+    lease_for,
+    preload_backends,
+)
+from llm_consortium.embeddings.service import create_embedding_service
+from llm_consortium.models import ConsortiumConfig
+
+
+def _config(**overrides):
+    values = {"models": {"dummy": 1}, "embedding_backend": "hashing", "embedding_options": {"n_features": 64}}
+    values.update(overrides)
+    return ConsortiumConfig(**values)
+
+
+def test_services_for_the_same_key_share_one_backend():
+    registry = EmbeddingBackendRegistry()
+    first = create_embedding_service(_config(), registry=registry)
+    second = create_embedding_service(_config(), registry=registry)
+
+    assert first.backend is second.backend
+    assert registry.refcount(backend_key("hashing", None, {"n_features": 64})) == 2
+
+
+def test_different_options_get_different_backends():
+    registry = EmbeddingBackendRegistry()
+    first = create_embedding_service(_config(), registry=registry)
+    second = create_embedding_service(_config(embedding_options={"n_features": 32}), registry=registry)
+
+    assert first.backend is not second.backend
+    assert len(registry.keys()) == 2
+
+
+def test_backend_is_released_when_last_service_goes_away():
+    registry = EmbeddingBackendRegistry()
+    key = backend_key("hashing", None, {"n_features": 64})
+    first = create_embedding_service(_config(), registry=registry)
+    second = create_embedding_service(_config(), registry=registry)
+
+    first.close()
+    assert registry.is_loaded(key)
+
+    del second
+    gc.collect()
+    assert registry.refcount(key) == 0
+    assert not registry.is_loaded(key)
+
+
+def test_sentence_transformer_model_loads_once(monkeypatch):
+    loads = []
+
+    class FakeModel:
+        def encode(self, text):
+            return [1.0, 0.0]
+
+        def get_sentence_embedding_dimension(self):
+            return 2
+
+    def load(model_name):
+        loads.append(model_name)
+        return FakeModel()
+
+    monkeypatch.setitem(sys.modules, "sentence_transformers", types.SimpleNamespace(SentenceTransformer=load))
+    registry = EmbeddingBackendRegistry()
+    config = _config(embedding_backend="sentence-transformers", embedding_options=None)
+
+    services = [create_embedding_service(config, registry=registry) for _ in range(3)]
+
+    assert loads == ["all-MiniLM-L6-v2"]
+    assert np.allclose(services[2].embed("x"), [1.0, 0.0])
+
+
+def test_lease_is_lazy_until_preloaded():
+    class Owner:
+        pass
+
+    registry = EmbeddingBackendRegistry()
+    owner = Owner()
+    lease = lease_for(owner, _config(), registry=registry)
+
+    assert not registry.is_loaded(lease.key)
+    lease.preload()
+    assert isinstance(lease.backend, HashingBackend)
+
+    del owner
+    gc.collect()
+    assert registry.keys() == []
+
+
+def test_preload_backends_pins_until_released():
+    registry = EmbeddingBackendRegistry()
+    leases = preload_backends([_config(), _config(embedding_backend=None)], background=False, registry=registry)
+
+    assert len(leases) == 1
+    assert registry.is_loaded(leases[0].key)
+
+    leases[0].release()
+    leases[0].release()
+    assert registry.keys() == []
+    with pytest.raises(RuntimeError):
+        leases[0].backend
+
+
+def test_unknown_backend_is_rejected():
+    registry = EmbeddingBackendRegistry()
+
+    with pytest.raises(ValueError, match="No valid embedding_backend"):
+        create_embedding_service(SimpleNamespace(embedding_backend="nope"), registry=registry)
+    assert registry.keys() == []
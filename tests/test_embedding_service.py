@@ -1,17 +1,23 @@
+import asyncio
 import hashlib
+import http.server
+import json
 import sys
+import threading
 import types
 
+import httpx
 import numpy as np
 import pytest
 
 from llm_consortium.embeddings.backends import (
     BaseEmbeddingBackend,
     ChutesBackend,
+    HashingBackend,
     OpenAIBackend,
     SentenceTransformerBackend,
 )
-from llm_consortium.embeddings.service import EmbeddingService
+from llm_consortium.embeddings.service import EmbeddingService, create_embedding_service
 
 
 class DummyBackend(BaseEmbeddingBackend):
@@ -35,7 +41,7 @@ def test_embedding_backend_contract():
     assert backend.dimension() == 3
 
 
-def test_openai_backend_uses_embeddings_api(monkeypatch):
+def test_openai_backend_reuses_one_client(monkeypatch):
     class Response:
         data = [types.SimpleNamespace(embedding=[0.1, 0.2, 0.3])]
 
@@ -46,14 +52,24 @@ def test_openai_backend_uses_embeddings_api(monkeypatch):
             assert model == "text-embedding-3-small"
             return Response()
 
-    fake_openai = types.SimpleNamespace(embeddings=Embeddings())
+    constructed = []
+
+    def fake_client(**kwargs):
+        constructed.append(kwargs)
+        return types.SimpleNamespace(embeddings=Embeddings())
+
+    fake_openai = types.SimpleNamespace(OpenAI=fake_client)
     monkeypatch.setattr("llm_consortium.embeddings.backends.openai", fake_openai)
 
-    backend = OpenAIBackend(model="text-embedding-3-small")
+    backend = OpenAIBackend(model="text-embedding-3-small", timeout=5, max_retries=1)
     vector = backend.embed("hello")
+    backend.embed("hello")
 
     assert np.allclose(vector, np.array([0.1, 0.2, 0.3]))
-    assert backend.dimension() == 1536
+    assert backend.dimension() == 3
+    assert len(constructed) == 1
+    assert constructed[0]["timeout"] == 5.0
+    assert constructed[0]["max_retries"] == 1
 
 
 def test_sentence_transformer_backend_uses_model_dimension(monkeypatch):
@@ -123,4 +139,271 @@ def test_embedding_service_hard_fails_on_failure():
 
     service = EmbeddingService(backend=FailingBackend(), cache_enabled=False)
     with pytest.raises(RuntimeError):
-        service.embed("fallback")
\ No newline at end of file
+        service.embed("fallback")
+
+@pytest.fixture
+def embedding_server():
+    """Local stand-in for an OpenAI-compatible embeddings endpoint."""
+    state = {"requests": [], "fail_first": 0}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            state["requests"].append({"body": body, "auth": self.headers.get("Authorization")})
+            if state["fail_first"] > 0:
+                state["fail_first"] -= 1
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            payload = json.dumps({"data": [{"embedding": [float(len(body["input"])), 1.0]}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}/v1/embeddings"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_chutes_backend_pools_client_against_local_server(embedding_server):
+    backend = ChutesBackend(endpoint=embedding_server["url"], api_token="local", max_concurrency=3)
+    try:
+        vectors = backend.embed_batch(["a", "bb", "ccc", "dddd"])
+        client = backend.client
+        backend.embed("again")
+    finally:
+        backend.close()
+
+    assert [vector[0] for vector in vectors] == [1.0, 2.0, 3.0, 4.0]
+    assert client is not None and backend.dimension() == 2
+    assert len(embedding_server["requests"]) == 5
+    assert all(request["auth"] == "Bearer local" for request in embedding_server["requests"])
+
+
+def test_chutes_backend_reads_token_once(monkeypatch, embedding_server):
+    monkeypatch.setenv("CHUTES_API_TOKEN", "from-env")
+    backend = ChutesBackend(endpoint=embedding_server["url"])
+    monkeypatch.delenv("CHUTES_API_TOKEN")
+
+    backend.embed("hello")
+    backend.close()
+
+    assert embedding_server["requests"][0]["auth"] == "Bearer from-env"
+
+
+def test_chutes_backend_retries_with_backoff(embedding_server):
+    embedding_server["fail_first"] = 2
+    backend = ChutesBackend(endpoint=embedding_server["url"], api_token="local", max_retries=2, backoff=0.01)
+
+    vector = backend.embed("retry")
+    backend.close()
+
+    assert vector[0] == 5.0
+    assert len(embedding_server["requests"]) == 3
+
+
+def test_chutes_backend_gives_up_after_max_retries(embedding_server):
+    embedding_server["fail_first"] = 5
+    backend = ChutesBackend(endpoint=embedding_server["url"], api_token="local", max_retries=1, backoff=0.01)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        backend.embed("retry")
+    backend.close()
+
+    assert len(embedding_server["requests"]) == 2
+
+
+def test_async_embedding_service_uses_cache_and_backend(embedding_server):
+    backend = ChutesBackend(endpoint=embedding_server["url"], api_token="local", max_concurrency=2)
+    service = EmbeddingService(backend=backend)
+
+    async def run():
+        try:
+            first = await service.aembed_batch(["x", "yy", "x"])
+            second = await service.aembed("yy")
+        finally:
+            await backend.aclose()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert [vector[0] for vector in first] == [1.0, 2.0, 1.0]
+    assert second[0] == 2.0
+    assert len(embedding_server["requests"]) == 2
+
+
+def test_embedding_service_batch_only_embeds_cache_misses():
+    backend = DummyBackend()
+    service = EmbeddingService(backend=backend, cache_enabled=True, cache_size=8)
+
+    service.embed("seen")
+    vectors = service.embed_batch(["seen", "new", "new"])
+
+    assert [vector[0] for vector in vectors] == [4.0, 3.0, 3.0]
+    assert backend.calls == 2
+
+
+def test_create_embedding_service_passes_backend_options():
+    from llm_consortium.models import ConsortiumConfig
+
+    config = ConsortiumConfig(
+        models={"dummy": 1},
+        embedding_backend="chutes",
+        embedding_options={"timeout": "5", "max_concurrency": "8", "max_retries": "0"},
+    )
+
+    backend = create_embedding_service(config).backend
+
+    assert backend.timeout == 5.0
+    assert backend.max_concurrency == 8
+    assert backend.max_retries == 0
+
+
+def test_hashing_backend_places_paraphrases_closer_than_unrelated_text():
+    backend = HashingBackend()
+    paris, paraphrase, unrelated = backend.embed_batch([
+        "The capital of France is Paris.",
+        "Paris is the capital of France!",
+        "Bananas are a yellow fruit rich in potassium.",
+    ])
+
+    assert paris.shape == (backend.dimension(),)
+    assert np.isclose(np.linalg.norm(paris), 1.0)
+    assert float(paris @ paraphrase) > float(paris @ unrelated) + 0.3
+
+
+def test_hashing_backend_is_deterministic():
+    first = HashingBackend(projection_dim=64, seed=7)
+    second = HashingBackend(projection_dim=64, seed=7)
+
+    left = first.embed("same text")
+    right = second.embed("same text")
+
+    assert left.shape == (64,)
+    assert first.dimension() == 64
+    assert np.allclose(left, right)
+
+
+def test_hashing_backend_idf_does_not_depend_on_earlier_calls():
+    backend = HashingBackend(use_idf="true")
+    texts = ["The capital of France is Paris.", "The capital of Spain is Madrid."]
+
+    before = backend.embed_batch(texts)
+    backend.embed_batch(["Unrelated text about bananas."] * 5)
+    after = backend.embed_batch(texts)
+
+    assert all(np.allclose(left, right) for left, right in zip(before, after))
+    assert not np.allclose(before[0], HashingBackend().embed(texts[0]))
+
+
+def test_hashing_backend_accepts_string_ngram_ranges():
+    backend = HashingBackend(n_features="512", char_ngrams="2-4", word_ngrams="none")
+
+    assert backend.char_ngrams == (2, 4)
+    assert backend.word_ngrams is None
+    assert backend.embed("").shape == (512,)
+    with pytest.raises(ValueError):
+        HashingBackend(char_ngrams=None, word_ngrams=None)
+
+
+def test_create_embedding_service_supports_hashing_backend():
+    from llm_consortium.models import ConsortiumConfig
+
+    config = ConsortiumConfig(
+        models={"dummy": 1},
+        embedding_backend="hashing",
+        embedding_options={"n_features": "256"},
+    )
+
+    service = create_embedding_service(config)
+
+    assert isinstance(service.backend, HashingBackend)
+    assert service.embed("hello").shape == (256,)
+
+
+def test_embedding_service_defaults_to_read_only_float32_without_copies():
+    backend = DummyBackend()
+    service = EmbeddingService(backend=backend)
+
+    first = service.embed("repeat")
+    second = service.embed("repeat")
+
+    assert first.dtype == np.float32
+    assert not first.flags.writeable
+    assert second is first
+    with pytest.raises(ValueError):
+        first[0] = 0.0
+
+
+def test_embedding_service_truncates_dimensions():
+    service = EmbeddingService(backend=DummyBackend(), dimensions=2)
+
+    assert np.allclose(service.embed("abc"), [3.0, 1.0])
+
+
+@pytest.mark.parametrize("precision, tolerance", [("float16", 1e-3), ("int8", 1e-2)])
+def test_embedding_service_compact_precisions_round_trip(precision, tolerance):
+    rng = np.random.default_rng(0)
+    vectors = {f"text-{i}": rng.standard_normal(256) for i in range(8)}
+
+    class TableBackend(BaseEmbeddingBackend):
+        def embed(self, text):
+            return vectors[text]
+
+        def dimension(self):
+            return 256
+
+    exact = EmbeddingService(backend=TableBackend(), precision="float64")
+    compact = EmbeddingService(backend=TableBackend(), precision=precision)
+    texts = list(vectors)
+    exact_vectors = exact.embed_batch(texts)
+    compact_vectors = compact.embed_batch(texts)
+
+    assert compact.cache_nbytes() < exact.cache_nbytes() / 3
+    for left, right in zip(exact_vectors, compact_vectors):
+        cosine = float(left @ right / (np.linalg.norm(left) * np.linalg.norm(right)))
+        assert cosine > 1 - tolerance
+    assert np.allclose(compact.embed("text-0"), compact_vectors[0])
+
+
+def test_embedding_service_rejects_unknown_precision():
+    with pytest.raises(ValueError, match="Unsupported embedding precision"):
+        EmbeddingService(backend=DummyBackend(), precision="int4")
+
+
+@pytest.mark.parametrize("precision", ["float32", "float16", "int8"])
+def test_compact_precisions_keep_geometry_decisions(precision):
+    from llm_consortium.geometry import GeometricConfidenceCalculator
+
+    rng = np.random.default_rng(1)
+    base = rng.standard_normal(384)
+    vectors = {f"close-{i}": base + 0.1 * rng.standard_normal(384) for i in range(6)}
+    vectors["far"] = -base
+
+    class TableBackend(BaseEmbeddingBackend):
+        def embed(self, text):
+            return vectors[text]
+
+        def dimension(self):
+            return 384
+
+    texts = list(vectors)
+    exact = EmbeddingService(backend=TableBackend(), precision="float64").embed_batch(texts)
+    compact = EmbeddingService(backend=TableBackend(), precision=precision).embed_batch(texts)
+
+    exact_confidence, _ = GeometricConfidenceCalculator.compute(exact)
+    compact_confidence, _ = GeometricConfidenceCalculator.compute(compact)
+
+    assert abs(exact_confidence - compact_confidence) < 1e-3
+    assert GeometricConfidenceCalculator.detect_outliers(compact, threshold_std=1.5) == \
+        GeometricConfidenceCalculator.detect_outliers(exact, threshold_std=1.5) == [6]
@@ -42,6 +42,18 @@ def test_save_response_embedding_creates_table_and_round_trips_vector():
     assert np.allclose(embeddings[0], np.array([0.1, 0.2, 0.3]))
 
 
+def test_save_response_embedding_stores_arrays_as_compact_blobs():
+    vector = np.array([0.5, -0.25, 1.0], dtype=np.float32)
+    save_response_embedding("resp-blob", "run-blob", vector, "model-a")
+
+    db = DatabaseConnection.get_connection()
+    row = db["response_embeddings"].get("resp-blob")
+
+    assert row["embedding_json"] is None
+    assert len(row["embedding_blob"]) == 12
+    assert np.allclose(get_embeddings_for_run("run-blob")[0], vector)
+
+
 def test_save_cluster_metadata_creates_consensus_clusters_table():
     save_cluster_metadata(
         run_id="run-2",
@@ -1,6 +1,9 @@
 import numpy as np
+import pytest
 
-from llm_consortium.geometry import GeometricConfidenceCalculator
+from llm_consortium.geometry import GeometricConfidenceCalculator, ResponseGeometry, _cosine_distance
+from llm_consortium.models import ConsortiumConfig
+from llm_consortium.orchestrator import ConsortiumOrchestrator
 
 
 def test_compute_confidence_uses_inverse_average_cosine_distance():
@@ -38,4 +41,71 @@ def test_compute_returns_confidence_and_centroid():
 
     assert isinstance(confidence, float)
     assert isinstance(centroid, np.ndarray)
-    assert centroid.shape == (2,)
\ No newline at end of file
+    assert centroid.shape == (2,)
+
+
+def _random_vectors(count, dimensions=16, seed=7):
+    rng = np.random.default_rng(seed)
+    return [rng.standard_normal(dimensions) for _ in range(count)]
+
+
+def test_response_geometry_matches_pairwise_reference():
+    vectors = _random_vectors(12)
+    geometry = ResponseGeometry(vectors)
+    centroid = np.mean(np.vstack(vectors), axis=0)
+
+    expected = [_cosine_distance(vector, centroid) for vector in vectors]
+
+    np.testing.assert_allclose(geometry.distances_to_centroid(), expected, atol=1e-12)
+    np.testing.assert_allclose(geometry.centroid(), centroid)
+    assert geometry.confidence() == pytest.approx(
+        GeometricConfidenceCalculator.compute_confidence(vectors, centroid)
+    )
+    reference = np.array([[1.0 - 2.0 * _cosine_distance(a, b) for b in vectors] for a in vectors])
+    np.testing.assert_allclose(geometry.similarity, reference, atol=1e-12)
+
+
+def test_response_geometry_handles_zero_vectors():
+    geometry = ResponseGeometry([np.zeros(3), np.array([1.0, 0.0, 0.0])])
+
+    np.testing.assert_allclose(geometry.distances_to_centroid(), [1.0, 0.0])
+    assert geometry.cosine_distance_matrix()[0, 1] == 1.0
+
+
+def test_response_geometry_subset_reuses_gram_matrix():
+    vectors = _random_vectors(6)
+    geometry = ResponseGeometry(vectors)
+
+    subset = geometry.subset_for([vectors[4], vectors[1]])
+
+    np.testing.assert_allclose(subset.gram, geometry.gram[np.ix_([4, 1], [4, 1])])
+    np.testing.assert_allclose(subset.similarity, ResponseGeometry([vectors[4], vectors[1]]).similarity)
+    assert geometry.subset_for([np.ones(16)]) is None
+
+
+def test_medoid_and_cluster_stats():
+    vectors = [
+        np.array([1.0, 0.0]),
+        np.array([0.9, 0.1]),
+        np.array([0.95, 0.05]),
+        np.array([0.0, 1.0]),
+    ]
+    geometry = ResponseGeometry(vectors)
+
+    stats = geometry.cluster_stats([0, 0, 0, -1])
+
+    assert [entry["cluster_id"] for entry in stats] == [0]
+    assert stats[0]["members"] == [0, 1, 2]
+    assert stats[0]["medoid"] == 2
+    assert stats[0]["radius"] == pytest.approx(max(stats[0]["distances"]))
+
+
+def test_orchestrator_shares_one_geometry_per_iteration():
+    orchestrator = ConsortiumOrchestrator(ConsortiumConfig(models={"m": 1}, arbiter="m"))
+    vectors = _random_vectors(5)
+
+    full = orchestrator.get_response_geometry(vectors)
+    subset = orchestrator.get_response_geometry(vectors[:3])
+
+    assert orchestrator._iteration_geometry is full
+    np.testing.assert_allclose(subset.gram, full.gram[:3, :3])
@@ -0,0 +1,85 @@
+import pytest
+import sqlite_utils
+
+from llm_consortium import ConsortiumConfig
+from llm_consortium.db import DatabaseConnection
+
+
+@pytest.fixture
+def run(ranking_arbiter, synthesize):
+    def run(count, group_size, consortium_id=None):
+        arbiter = ranking_arbiter()
+        result = synthesize({"arbiter": arbiter}, _responses(count), consortium_id, models={"m": 7},
+                            judging_method="hierarchical", arbiter_group_size=group_size)
+        return result, arbiter.seen
+    return run
+
+
+def _responses(count):
+    return [
+        {"id": i, "model": f"m{i}", "response": f"answer {i}", "response_id": f"resp-{i}"}
+        for i in range(count)
+    ]
+
+
+def test_hierarchical_judging_reduces_groups_then_arbitrates_partials(run):
+    result, calls = run(7, group_size=3)
+
+    # Level 1: groups of 3, 3 and 1; the final call sees the three partial syntheses
+    assert sorted(calls[:3]) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert calls[3] == [0, 1, 2]
+    assert len(calls) == 4
+
+    # Partial 2 (member 6) ranks first, then partial 1 (members 5, 4, 3), then partial 0
+    assert result["ranking"] == [6, 5, 4, 3, 2, 1, 0]
+    assert result["chosen_response_id"] == "resp-6"
+    assert result["hierarchy"]["nodes"] == ["L1.G0", "L1.G1", "L1.G2"]
+
+
+def test_hierarchical_judging_recurses_for_large_consortiums(run):
+    result, calls = run(8, group_size=2)
+
+    # 8 -> 4 -> 2 partials, then the final call
+    assert len(calls) == 4 + 2 + 1
+    assert result["hierarchy"]["nodes"] == ["L2.G0", "L2.G1"]
+    assert sorted(result["ranking"]) == list(range(8))
+
+
+def test_small_consortium_uses_a_single_arbiter_call(run):
+    result, calls = run(4, group_size=5)
+
+    assert calls == [[0, 1, 2, 3]]
+    assert "hierarchy" not in result
+
+
+def test_group_size_must_allow_reduction():
+    with pytest.raises(ValueError, match="arbiter_group_size must be at least 2"):
+        ConsortiumConfig(models={"m": 1}, arbiter_group_size=1)
+
+
+def test_sub_decisions_are_recorded_by_node(run, isolated_db):
+    run(7, group_size=3, consortium_id="run-1")
+
+    db = DatabaseConnection.get_connection()
+    nodes = sorted(row["node"] for row in db["arbiter_decisions"].rows_where("run_id = ?", ["run-1"]))
+    assert nodes == ["", "L1.G0", "L1.G1", "L1.G2"]
+
+
+def test_existing_decision_table_is_migrated(isolated_db):
+    legacy = sqlite_utils.Database(isolated_db / "consortium_logs.db")
+    legacy.execute("""
+        CREATE TABLE arbiter_decisions (
+            run_id TEXT, iteration INTEGER, response_id TEXT, chosen_response_id TEXT,
+            confidence REAL, synthesis TEXT, decision_json TEXT, ranking_json TEXT,
+            refinement_areas TEXT, geometric_confidence REAL, centroid_vector TEXT,
+            PRIMARY KEY (run_id, iteration)
+        )
+    """)
+    legacy["arbiter_decisions"].insert({"run_id": "old", "iteration": 1, "synthesis": "kept"})
+    legacy.conn.commit()
+    legacy.conn.close()
+
+    db = DatabaseConnection.get_connection()
+
+    assert db["arbiter_decisions"].pks == ["run_id", "iteration", "node"]
+    assert [(row["synthesis"], row["node"]) for row in db["arbiter_decisions"].rows] == [("kept", "")]
@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from llm_consortium import ConsortiumConfig
+from llm_consortium.db import DatabaseConnection
+from llm_consortium.history import ConversationHistory
+from llm_consortium.models import ConsortiumModel
+
+
+def _turn(index, length=20):
+    response = MagicMock()
+    response.prompt.prompt = f"Question {index}?"
+    response.text.return_value = f"Answer {index}. " + "Detail. " * length
+    return response
+
+
+@pytest.fixture(autouse=True)
+def isolated_db(monkeypatch, tmp_path):
+    monkeypatch.setattr("llm_consortium.db.user_dir", lambda: tmp_path)
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+    yield tmp_path
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+
+
+def test_only_new_turns_are_formatted():
+    turns = [_turn(0), _turn(1)]
+    history = ConversationHistory("conv-1")
+
+    history.update(turns)
+    text = history.update(turns + [_turn(2)])
+
+    assert all(turn.text.call_count == 1 for turn in turns)
+    assert text.startswith("Human: Question 0?\n\nAssistant: Answer 0.")
+    assert "Human: Question 2?" in text
+
+
+def test_over_budget_history_keeps_recent_turns_verbatim():
+    turns = [_turn(i) for i in range(10)]
+    history = ConversationHistory("conv-1", token_budget=200)
+
+    text = history.update(turns)
+
+    assert text.startswith("Summary of the earlier conversation:")
+    assert turns[-1].text.return_value.strip() in text
+    assert "tokens omitted" in text
+    assert history.summarized > 0
+
+
+def _summarizer():
+    model = MagicMock()
+    model.prompt.return_value.text.return_value = "User asked questions 0-7; all answered."
+    return model
+
+
+def test_summary_is_written_once_and_reused():
+    summarizer = _summarizer()
+    turns = [_turn(i) for i in range(10)]
+
+    with patch("llm_consortium.history.llm.get_model", return_value=summarizer), \
+            patch("llm_consortium.history.log_response"):
+        history = ConversationHistory("conv-1", token_budget=200, summary_model="cheap")
+        history.update(turns)
+        text = history.update(turns + [_turn(10, length=1)])
+
+        # A new process picks the stored summary up instead of summarizing again
+        reloaded = ConversationHistory("conv-1", token_budget=200, summary_model="cheap")
+        reloaded_text = reloaded.update(turns + [_turn(10, length=1)])
+
+    assert summarizer.prompt.call_count == 1
+    assert "User asked questions 0-7; all answered." in text
+    assert reloaded_text == text
+
+
+def test_stored_summary_is_ignored_without_a_budget():
+    turns = [_turn(i) for i in range(10)]
+    ConversationHistory("conv-1", token_budget=200).update(turns)
+
+    text = ConversationHistory("conv-1").update(turns)
+
+    assert not text.startswith("Summary of the earlier conversation:")
+    assert "Human: Question 0?" in text
+
+
+def test_consortium_model_caps_cached_histories():
+    model = ConsortiumModel("cns", ConsortiumConfig(models={"m": 1}, arbiter="arbiter"))
+    model.MAX_CACHED_HISTORIES = 2
+
+    for conversation_id in ("conv-1", "conv-2", "conv-1", "conv-3"):
+        model.conversation_history(MagicMock(id=conversation_id, responses=[_turn(0)]))
+
+    assert list(model._histories) == ["conv-1", "conv-3"]
+
+
+def test_consortium_model_caches_history_per_conversation():
+    model = ConsortiumModel("cns", ConsortiumConfig(models={"m": 1}, arbiter="arbiter"))
+    orchestrator = MagicMock()
+    orchestrator.orchestrate.return_value = {"synthesis": {"synthesis": "ok"}}
+    conversation = MagicMock(id="conv-1", responses=[_turn(0)])
+    prompt = MagicMock(prompt="Question 1?", system=None)
+
+    with patch.object(model, "get_orchestrator", return_value=orchestrator):
+        model.execute(prompt, False, MagicMock(), conversation)
+        conversation.responses.append(_turn(1))
+        model.execute(prompt, False, MagicMock(), conversation)
+
+    histories = [call.kwargs["conversation_history"] for call in orchestrator.orchestrate.call_args_list]
+    assert "Question 0?" in histories[0] and "Question 1?" not in histories[0]
+    assert "Question 0?" in histories[1] and "Question 1?" in histories[1]
+    assert conversation.responses[0].text.call_count == 1
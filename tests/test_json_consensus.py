@@ -0,0 +1,124 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+from llm_consortium.json_consensus import build_consensus, merge_documents, parse_json_response
+
+MEMBER_ANSWERS = [
+    '```json\n{"entities": [{"text": "Tim Cook", "type": "PERSON", "confidence": 0.95},'
+    ' {"text": "Apple", "type": "ORG", "confidence": 0.9}], "sentiment": "positive", "count": 2}\n```',
+    '{"entities": [{"text": "Tim Cook", "type": "PERSON", "confidence": 0.9},'
+    ' {"text": "Apple", "type": "ORG", "confidence": 0.8}, {"text": "Q3 2027", "type": "DATE", "confidence": 0.7}],'
+    ' "sentiment": "neutral", "count": 3}',
+    'Here you go: {"entities": [{"text": "Apple", "type": "ORG", "confidence": 0.85}],'
+    ' "sentiment": "mixed", "count": 2}',
+]
+
+
+def test_parse_json_response_handles_fences_and_prose():
+    assert parse_json_response('```json\n{"a": 1}\n```') == {"a": 1}
+    assert parse_json_response('Sure! {"a": [1, 2]} hope that helps') == {"a": [1, 2]}
+    assert parse_json_response("no json here") is None
+
+
+def test_merge_takes_majority_and_median_per_field():
+    consensus, indices = build_consensus(MEMBER_ANSWERS + ["not json"])
+
+    assert indices == [0, 1, 2]
+    assert consensus.document["count"] == 2
+    assert [entity["text"] for entity in consensus.document["entities"]] == ["Tim Cook", "Apple"]
+    assert consensus.document["entities"][1]["confidence"] == pytest.approx(0.85)
+    assert consensus.unresolved == {"sentiment": ["positive", "neutral", "mixed"]}
+    assert consensus.stats()["consensus_fields"] == consensus.stats()["fields"] - 1
+
+
+def test_schema_controls_integer_rounding_and_required_keys():
+    schema = {
+        "type": "object",
+        "required": ["note"],
+        "properties": {"score": {"type": "integer"}, "note": {"type": "string"}},
+    }
+    consensus = merge_documents([{"score": 3}, {"score": 4}, {"score": 4, "note": "x"}, {"score": 5}], schema)
+
+    assert consensus.document == {"score": 4, "note": "x"}
+
+
+def test_resolve_writes_arbiter_values():
+    consensus, _ = build_consensus(MEMBER_ANSWERS)
+
+    consensus.resolve({"sentiment": "positive", "unknown.path": 1})
+
+    assert consensus.document["sentiment"] == "positive"
+    assert consensus.unresolved == {}
+
+
+def test_resolve_does_not_reinterpret_numeric_or_dotted_keys():
+    consensus = merge_documents([
+        {"2023": {"revenue": "up"}, "a.b": "x"},
+        {"2023": {"revenue": "down"}, "a.b": "y"},
+    ])
+
+    assert set(consensus.unresolved) == {"2023.revenue", "a\\.b"}
+    consensus.resolve({"2023.revenue": "up", "a\\.b": "y"})
+
+    assert consensus.document == {"2023": {"revenue": "up"}, "a.b": "y"}
+    assert consensus.unresolved == {}
+
+
+def _json_orchestrator(arbiter="arbiter_model"):
+    config = ConsortiumConfig(models={"m1": 1, "m2": 1, "m3": 1}, arbiter=arbiter, judging_method="json", manual_context=True)
+    return ConsortiumOrchestrator(config)
+
+
+def _responses(texts):
+    return [{"model": f"m{i}", "response": text, "id": i + 1} for i, text in enumerate(texts)]
+
+
+@patch('llm_consortium.orchestrator.save_arbiter_decision')
+@patch('llm_consortium.orchestrator.save_consortium_member')
+@patch('llm_consortium.orchestrator.log_response')
+@patch('llm_consortium.orchestrator.llm.get_model')
+def test_json_judging_calls_arbiter_only_for_disputed_fields(mock_get_model, mock_log, mock_member, mock_decision):
+    arbiter_response = MagicMock()
+    arbiter_response.id = "arb-1"
+    arbiter_response.text.return_value = '{"sentiment": "positive"}'
+    mock_get_model.return_value.prompt.return_value = arbiter_response
+    orchestrator = _json_orchestrator()
+    orchestrator.consortium_id = "run-json"
+
+    result = orchestrator._synthesize_responses_manual("Extract entities", _responses(MEMBER_ANSWERS), [], 1)
+
+    document = json.loads(result["synthesis"])
+    assert document["sentiment"] == "positive"
+    field_prompt = mock_get_model.return_value.prompt.call_args.args[0]
+    assert "sentiment: " in field_prompt and "Tim Cook" in field_prompt
+    assert "entities.0.text:" not in field_prompt
+    assert result["json_consensus"]["unresolved_fields"] == ["sentiment"]
+    assert mock_decision.call_args.args[2] == "arb-1"
+
+
+@patch('llm_consortium.orchestrator.save_arbiter_decision')
+@patch('llm_consortium.orchestrator.llm.get_model')
+def test_json_judging_skips_arbiter_on_full_consensus(mock_get_model, mock_decision):
+    orchestrator = _json_orchestrator()
+    orchestrator.consortium_id = "run-json"
+    texts = ['{"answer": 42, "unit": "m"}', '{"answer": 42, "unit": "m"}', '{"answer": 41, "unit": "m"}']
+
+    result = orchestrator._synthesize_responses_automatic("Q", _responses(texts), [], 1)
+
+    mock_get_model.assert_not_called()
+    assert json.loads(result["synthesis"]) == {"answer": 42, "unit": "m"}
+    assert result["confidence"] == pytest.approx(1.0)
+    assert mock_decision.call_args.args[2] == "json-consensus-1"
+
+
+@patch('llm_consortium.orchestrator.llm.get_model')
+def test_json_judging_without_parsable_members_falls_back(mock_get_model):
+    orchestrator = _json_orchestrator(arbiter=None)
+
+    result = orchestrator._synthesize_responses_manual("Q", _responses(["plain text", "more text"]), [], 1)
+
+    assert result["synthesis"] == "plain text"
+    mock_get_model.assert_not_called()
@@ -0,0 +1,93 @@
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+
+ARBITER_TEXT = """<synthesis>Draft answer.</synthesis>
+<confidence>0.5</confidence>
+<needs_iteration>true</needs_iteration>
+<refinement_areas><area>cite sources</area></refinement_areas>
+<ranking><rank position="1">{rid}</rank></ranking>"""
+
+
+def _models():
+    arbiter_prompts = []
+
+    def member_prompt(text, system=None):
+        response = MagicMock()
+        response.text.return_value = "A member answer."
+        response.id = str(uuid.uuid4())
+        return response
+
+    def arbiter_prompt(text, stream=False):
+        arbiter_prompts.append(text)
+        response = MagicMock()
+        response.text.return_value = ARBITER_TEXT.format(rid=0)
+        response.id = str(uuid.uuid4())
+        return response
+
+    member, arbiter = MagicMock(), MagicMock()
+    member.conversation.side_effect = lambda: MagicMock(prompt=MagicMock(side_effect=member_prompt))
+    arbiter.conversation.side_effect = lambda: MagicMock(prompt=MagicMock(side_effect=arbiter_prompt))
+    return {"member": member, "arbiter": arbiter}, arbiter_prompts
+
+
+@pytest.fixture
+def patched_db():
+    with patch("llm_consortium.orchestrator.save_consortium_run"), \
+            patch("llm_consortium.orchestrator.update_consortium_run"), \
+            patch("llm_consortium.orchestrator.save_arbiter_decision"), \
+            patch("llm_consortium.orchestrator.save_consortium_member"), \
+            patch("llm_consortium.orchestrator.log_response"):
+        yield
+
+
+def _orchestrator(**config):
+    return ConsortiumOrchestrator(ConsortiumConfig(
+        models={"member": 2}, arbiter="arbiter", max_iterations=2, confidence_threshold=0.9, **config
+    ))
+
+
+def _orchestrate(orchestrator, models, prompt="Explain tides."):
+    with patch("llm_consortium.orchestrator.llm.get_model", side_effect=lambda model_id: models[model_id]):
+        return orchestrator.orchestrate(prompt, consortium_id=str(uuid.uuid4()))
+
+
+def test_later_iterations_send_only_new_responses_and_focus(patched_db):
+    models, prompts = _models()
+
+    _orchestrate(_orchestrator(), models)
+
+    assert len(prompts) == 2
+    assert "<original_prompt>Explain tides.</original_prompt>" in prompts[0]
+    assert "<iteration_focus>" not in prompts[0]
+    assert "<original_prompt>" not in prompts[1]
+    assert "<iteration_history>" not in prompts[1]
+    assert "Major improvements needed: cite sources" in prompts[1]
+    assert "A member answer." in prompts[1]
+    assert len(prompts[1]) < len(prompts[0]) / 2
+
+
+def test_a_new_turn_resends_the_full_prompt(patched_db):
+    models, prompts = _models()
+    orchestrator = _orchestrator()
+
+    _orchestrate(orchestrator, models)
+    _orchestrate(orchestrator, models, prompt="And in lakes?")
+
+    assert len(prompts) == 4
+    assert "<original_prompt>And in lakes?</original_prompt>" in prompts[2]
+    assert "<iteration_focus>" in prompts[3]
+
+
+def test_rank_judging_uses_the_lean_rank_template(patched_db):
+    models, prompts = _models()
+
+    _orchestrate(_orchestrator(judging_method="rank", minimum_iterations=2), models)
+
+    assert len(prompts) == 2
+    assert "<rank_prompt>" in prompts[1]
+    assert "<iteration_history>" not in prompts[1]
+
@@ -0,0 +1,95 @@
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from llm_consortium.db import DatabaseConnection, save_consortium_member
+
+SCORES = {0: 0.9, 1: 0.1, 2: 0.6, 3: 0.4}
+
+
+def _screener(fail=False):
+    model = MagicMock()
+    batches = []
+
+    def prompt(text, stream=False):
+        ids = [int(rid) for rid in re.findall(r"--- RESPONSE (\d+) ", text)]
+        batches.append(ids)
+        if fail:
+            raise RuntimeError("rate limited")
+        response = MagicMock()
+        response.id = f"screen-{len(batches)}"
+        response.text.return_value = "".join(f'<score id="{rid}">{SCORES[rid]}</score>' for rid in ids)
+        return response
+
+    model.prompt.side_effect = prompt
+    return model, batches
+
+
+def _responses():
+    return [
+        {"id": i, "model": f"m{i}", "response": f"answer {i}", "response_id": f"resp-{i}"}
+        for i in range(4)
+    ]
+
+
+@pytest.fixture
+def run(stub_arbiter, synthesize):
+    def run(screener, consortium_id=None, **config):
+        arbiter = stub_arbiter()
+        responses = _responses()
+        synthesize({"arbiter": arbiter, "screener": screener}, responses, consortium_id,
+                   pre_arbiter="screener", **config)
+        return arbiter.seen, responses
+    return run
+
+
+def test_top_k_forwards_only_the_best_scored_responses(run):
+    screener, batches = _screener()
+
+    seen, responses = run(screener, pre_arbiter_top_k=2)
+
+    assert seen == [[0, 2]]
+    assert len(batches) == 4
+    assert [r["screening_score"] for r in responses] == [0.9, 0.1, 0.6, 0.4]
+
+
+def test_min_score_and_batching(run):
+    screener, batches = _screener()
+
+    seen, _ = run(screener, pre_arbiter_min_score=0.5, pre_arbiter_batch_size=2)
+
+    assert sorted(batches) == [[0, 1], [2, 3]]
+    assert seen == [[0, 2]]
+
+
+def test_best_response_is_kept_when_none_pass(run):
+    screener, _ = _screener()
+
+    seen, _ = run(screener, pre_arbiter_min_score=0.95)
+
+    assert seen == [[0]]
+
+
+def test_failed_screening_forwards_everything(run):
+    screener, _ = _screener(fail=True)
+
+    seen, responses = run(screener, pre_arbiter_top_k=1)
+
+    assert seen == [[0, 1, 2, 3]]
+    assert all(r["screening_score"] is None for r in responses)
+
+
+def test_scores_are_stored_with_consortium_members(run, isolated_db):
+    for i in range(4):
+        save_consortium_member("run-1", f"resp-{i}", f"m{i}", 1, 0)
+    screener, _ = _screener()
+
+    run(screener, consortium_id="run-1", pre_arbiter_top_k=2)
+
+    db = DatabaseConnection.get_connection()
+    rows = db.query("SELECT response_id, screening_score FROM consortium_members "
+                    "WHERE run_id = 'run-1' AND response_id LIKE 'resp-%' ORDER BY response_id")
+    assert [(row["response_id"], row["screening_score"]) for row in rows] == [
+        ("resp-0", 0.9), ("resp-1", 0.1), ("resp-2", 0.6), ("resp-3", 0.4)
+    ]
@@ -0,0 +1,130 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+from llm_consortium.orchestrator import create_consortium
+
+
+ANSWERS = {
+    'a': "The answer is 42.",
+    'b': "The answer is 42!",
+    'c': "It is 17, because the series diverges after the third term.",
+}
+
+
+def _arbiter(confidences):
+    arbiter = MagicMock()
+    replies = []
+    for confidence in confidences:
+        response = MagicMock()
+        response.text.return_value = (
+            "<synthesis>The answer is 42.</synthesis>"
+            f"<confidence>{confidence}</confidence>"
+            "<refinement_areas><area>Check the third term</area></refinement_areas>"
+            "<needs_iteration>false</needs_iteration>"
+        )
+        replies.append(response)
+    arbiter.prompt.side_effect = replies
+    return arbiter
+
+
+def _run(refinement):
+    members = {}
+    for model_id, text in ANSWERS.items():
+        member = MagicMock()
+        member.prompt.return_value.text.return_value = text
+        members[model_id] = member
+    members['arbiter'] = _arbiter([0.5, 0.9])
+
+    with patch('llm_consortium.orchestrator.llm.get_model', side_effect=lambda model_id: members[model_id]), \
+            patch('llm_consortium.orchestrator.save_consortium_run'), \
+            patch('llm_consortium.orchestrator.update_consortium_run'):
+        orchestrator = create_consortium(
+            models=['a', 'b', 'c'], arbiter='arbiter', max_iterations=2, manual_context=True,
+            refinement=refinement,
+        )
+        result = orchestrator.orchestrate("Sum the series")
+    return members, result
+
+
+def test_targeted_refinement_reprompts_only_dissenters():
+    members, result = _run('targeted')
+
+    assert members['a'].prompt.call_count == 1
+    assert members['b'].prompt.call_count == 1
+    assert members['c'].prompt.call_count == 2
+    assert "Check the third term" in members['c'].prompt.call_args[0][0]
+
+    second = result['iterations'][1]
+    assert second['carried_forward'] == 2
+    carried = sorted(r['model'] for r in second['model_responses'] if r.get('carried_forward'))
+    assert carried == ['a', 'b']
+
+
+def test_default_refinement_reprompts_everyone():
+    members, result = _run('all')
+
+    assert all(members[model_id].prompt.call_count == 2 for model_id in ANSWERS)
+    assert result['iterations'][1]['carried_forward'] == 0
+
+
+def _orchestrator(**config):
+    return ConsortiumOrchestrator(ConsortiumConfig(models={'a': 1, 'b': 1, 'c': 1}, arbiter='arbiter', **config))
+
+
+def _responses():
+    return [
+        {'model': model_id, 'instance': 0, 'id': index, 'response_id': f'r{index}', 'response': text}
+        for index, (model_id, text) in enumerate(ANSWERS.items())
+    ]
+
+
+def test_ranking_keeps_the_top_half():
+    orchestrator = _orchestrator(refinement='targeted')
+
+    close = orchestrator._close_to_synthesis(_responses(), {'ranking': [2, 0, 1], 'synthesis': ''})
+
+    assert close == [0, 2]
+
+
+def test_chosen_response_is_always_carried():
+    orchestrator = _orchestrator(refinement='targeted', refinement_threshold=0.99)
+
+    close = orchestrator._close_to_synthesis(
+        _responses(), {'synthesis': 'unrelated text', 'chosen_response_id': 'r2'}
+    )
+
+    assert close == [2]
+
+
+def test_outliers_are_matched_by_response_id():
+    orchestrator = _orchestrator(refinement='targeted', refinement_threshold=0.0)
+    # Index 0 of the previous iteration's embedded responses was a member no longer selected
+    synthesis = {'synthesis': 'The answer is 42.', 'outlier_indices': [0], 'outlier_response_ids': ['r1']}
+
+    close = orchestrator._close_to_synthesis(_responses(), synthesis)
+
+    assert close == [0, 2]
+
+
+def test_everyone_close_reprompts_everyone():
+    orchestrator = _orchestrator(refinement='targeted', refinement_threshold=0.0)
+    orchestrator.iteration_history = [{
+        'iteration': 1,
+        'model_responses': _responses(),
+        'synthesis': {'synthesis': 'The answer is 42.'},
+    }]
+
+    assert orchestrator._carry_forward({'a': 1, 'b': 1, 'c': 1}, 2) == []
+
+
+def test_refinement_mode_is_normalized():
+    assert ConsortiumConfig(models={'a': 1}, refinement=' Targeted ').refinement == 'targeted'
+
+
+def test_refinement_settings_are_validated():
+    with pytest.raises(ValueError, match="refinement must be"):
+        ConsortiumConfig(models={'a': 1}, refinement='targetted')
+    with pytest.raises(ValueError, match="refinement_threshold must be"):
+        ConsortiumConfig(models={'a': 1}, refinement_threshold=1.5)
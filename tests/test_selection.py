@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from llm_consortium.selection import mmr_select
+from llm_consortium.similarity import pairwise_agreement, similarity_matrix
+
+
+def test_mmr_prefers_a_distinct_second_pick():
+    similarity = np.array([
+        [1.0, 0.95, 0.1],
+        [0.95, 1.0, 0.1],
+        [0.1, 0.1, 1.0],
+    ])
+
+    assert mmr_select(similarity, [0.9, 0.85, 0.5], k=2) == [0, 2]
+    # Pure relevance ignores redundancy
+    assert mmr_select(similarity, [0.9, 0.85, 0.5], k=2, mmr_lambda=1.0) == [0, 1]
+
+
+def test_mmr_returns_everything_when_k_covers_all():
+    assert mmr_select(np.eye(3), [0.1, 0.2, 0.3], k=5) == [0, 1, 2]
+
+
+def test_similarity_matrix_matches_pairwise_agreement():
+    texts = ["the answer is forty two", "the answer is 42", "paris is the capital"]
+    matrix = similarity_matrix(texts)
+
+    assert np.allclose(matrix, matrix.T)
+    assert np.allclose(np.diag(matrix), 1.0)
+    assert pairwise_agreement(texts) == pytest.approx(matrix[np.triu_indices(3, k=1)].mean())
+
+
+@pytest.fixture
+def run(stub_arbiter, synthesize):
+    def run(responses, **config):
+        arbiter = stub_arbiter()
+        synthesize({"arbiter": arbiter}, responses, **config)
+        return arbiter.seen[0]
+    return run
+
+
+def test_top_k_keeps_each_distinct_answer(run):
+    texts = [
+        "The capital of France is Paris.",
+        "Paris is the capital of France.",
+        "The capital of France is Paris, of course.",
+        "It is Lyon, which was the historic capital.",
+    ]
+    responses = [{"id": i, "model": f"m{i}", "response": text} for i, text in enumerate(texts)]
+
+    assert run(responses, arbiter_top_k=2) in ([0, 3], [2, 3])
+
+
+def test_top_k_uses_screening_scores_as_relevance(run):
+    texts = ["alpha beta gamma", "alpha beta gamma delta", "completely different words"]
+    responses = [
+        {"id": i, "model": f"m{i}", "response": text, "screening_score": score}
+        for i, (text, score) in enumerate(zip(texts, [0.2, 0.9, 0.8]))
+    ]
+
+    assert run(responses, arbiter_top_k=2) == [1, 2]
+
+
+def test_drop_outliers_with_embeddings(run):
+    vectors = [np.array([1.0, 0.0]), np.array([0.99, 0.05]), np.array([0.98, 0.1]),
+               np.array([1.0, 0.02]), np.array([0.97, 0.08]), np.array([-1.0, 0.1])]
+    responses = [
+        {"id": i, "model": f"m{i}", "response": f"answer {i}", "embedding": vector}
+        for i, vector in enumerate(vectors)
+    ]
+
+    assert run(responses, drop_outliers=True) == [0, 1, 2, 3, 4]
+
+
+def test_selection_is_off_by_default(run):
+    responses = [{"id": i, "model": f"m{i}", "response": f"same answer {i}"} for i in range(4)]
+
+    assert run(responses) == [0, 1, 2, 3]
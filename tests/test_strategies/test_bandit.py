@@ -0,0 +1,157 @@
+import pathlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from llm_consortium.db import DatabaseConnection, get_model_rewards
+from llm_consortium.models import ConsortiumConfig, ConsortiumModel
+from llm_consortium.strategies.bandit import BanditStrategy
+from llm_consortium.strategies.factory import create_strategy
+
+
+MODELS = {f"model-{index}": 1 for index in range(10)}
+
+
+@pytest.fixture(autouse=True)
+def isolated_db(monkeypatch, tmp_path: pathlib.Path):
+    monkeypatch.setattr("llm_consortium.db.user_dir", lambda: tmp_path)
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+    yield
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+
+
+def _context(responses, ranking=None, chosen=None):
+    return SimpleNamespace(
+        synthesis={'ranking': ranking or [], 'chosen_response_id': chosen},
+        model_responses=responses,
+    )
+
+
+def _responses(models):
+    return [
+        {'model': model, 'id': index, 'response_id': f'r{index}', 'response': model, 'latency': 1.0}
+        for index, model in enumerate(models)
+    ]
+
+
+def test_registered_in_factory():
+    assert isinstance(create_strategy('bandit', Mock(), {}), BanditStrategy)
+
+
+@pytest.mark.parametrize("params, message", [
+    ({'k': 0}, "k must be at least 1"),
+    ({'algorithm': 'epsilon'}, "algorithm must be one of"),
+    ({'latency_weight': 2}, "latency_weight must be between 0 and 1"),
+    ({'persist': 'maybe'}, "persist must be one of"),
+])
+def test_invalid_params(params, message):
+    with pytest.raises(ValueError, match=message):
+        BanditStrategy(Mock(), params)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ('1', True), ('yes', True), ('On', True), (True, True),
+    ('0', False), ('no', False), ('OFF', False), (False, False),
+])
+def test_persist_accepts_common_boolean_spellings(value, expected):
+    assert BanditStrategy(Mock(), {'persist': value}).persist is expected
+
+
+def test_selects_k_models_and_keeps_them_for_the_run():
+    strategy = BanditStrategy(Mock(), {'k': 3, 'seed': 1})
+    strategy.initialize_state()
+
+    first = strategy.select_models(MODELS, 'prompt', 1)
+    second = strategy.select_models(MODELS, 'prompt', 2)
+
+    assert len(first) == 3
+    assert second == first
+
+
+def test_ucb1_tries_every_model_before_exploiting():
+    strategy = BanditStrategy(Mock(), {'k': 3, 'algorithm': 'ucb1'})
+    tried = set()
+    for _ in range(4):
+        strategy.initialize_state()
+        selected = strategy.select_models(MODELS, 'prompt', 1)
+        strategy.update_state(_context(_responses(selected), chosen='r0'))
+        tried.update(selected)
+
+    assert tried == set(MODELS)
+
+
+def test_ranking_rewards_persist_across_runs():
+    strategy = BanditStrategy(Mock(), {'k': 2, 'scope': 'shared', 'latency_weight': 0})
+    strategy.initialize_state()
+    responses = _responses(['model-0', 'model-1', 'model-2'])
+    strategy.update_state(_context(responses, ranking=[2, 0, 1]))
+
+    stats = get_model_rewards('shared')
+    assert stats['model-2']['reward_sum'] == pytest.approx(1.0)
+    assert stats['model-0']['reward_sum'] == pytest.approx(0.5)
+    assert stats['model-1']['reward_sum'] == pytest.approx(0.0)
+    assert all(entry['pulls'] == 1 for entry in stats.values())
+
+    later_run = BanditStrategy(Mock(), {'k': 2, 'scope': 'shared'})
+    later_run.initialize_state()
+    assert later_run.model_stats['model-2']['pulls'] == 1
+
+
+def test_system_prompt_runs_persist_rewards_under_the_consortium_name():
+    model = ConsortiumModel("my-bandit", ConsortiumConfig(
+        models={"model-0": 1, "model-1": 1}, arbiter="arbiter", strategy="bandit",
+        strategy_params={"k": 2, "latency_weight": 0},
+    ))
+
+    def orchestrate(orchestrator, prompt, **kwargs):
+        orchestrator.strategy.initialize_state()
+        orchestrator.strategy.update_state(_context(_responses(['model-0', 'model-1']), ranking=[1, 0]))
+        return {"synthesis": {"synthesis": "ok"}}
+
+    with patch("llm_consortium.orchestrator.ConsortiumOrchestrator.orchestrate", autospec=True, side_effect=orchestrate):
+        model.execute(MagicMock(prompt="Question?", system="Be brief."), False, MagicMock(), None)
+
+    assert get_model_rewards('my-bandit')['model-1']['reward_sum'] == pytest.approx(1.0)
+    assert get_model_rewards('default') == {}
+
+
+def test_chosen_response_and_latency_shape_the_reward():
+    strategy = BanditStrategy(Mock(), {'persist': 'false', 'latency_weight': 0.2, 'latency_target': 10})
+    strategy.initialize_state()
+    responses = _responses(['model-0', 'model-1'])
+    responses[0]['latency'] = 5.0
+    responses.append({'model': 'model-2', 'error': 'timeout'})
+
+    strategy.update_state(_context(responses, chosen='r0'))
+
+    stats = strategy.model_stats
+    assert stats['model-0']['reward_sum'] == pytest.approx(0.9)
+    assert stats['model-1']['reward_sum'] == pytest.approx(0.0)
+    assert stats['model-2']['reward_sum'] == pytest.approx(0.0)
+    assert get_model_rewards('default') == {}
+
+
+def test_no_quality_signal_leaves_stats_unchanged():
+    strategy = BanditStrategy(Mock(), {'persist': 'false'})
+    strategy.initialize_state()
+
+    strategy.update_state(_context(_responses(['model-0'])))
+
+    assert strategy._stats() == {}
+
+
+def test_thompson_sampling_converges_on_the_winning_model():
+    strategy = BanditStrategy(Mock(), {'k': 1, 'seed': 7, 'persist': 'false', 'latency_weight': 0})
+    picks = []
+    for _ in range(60):
+        strategy.initialize_state()
+        selected = list(strategy.select_models(MODELS, 'prompt', 1))
+        picks.append(selected[0])
+        responses = _responses(selected)
+        chosen = 'r0' if selected[0] == 'model-3' else None
+        strategy.update_state(_context(responses, chosen=chosen or 'elsewhere'))
+
+    assert picks[-20:].count('model-3') >= 15
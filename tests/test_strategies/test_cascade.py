@@ -0,0 +1,152 @@
+import pathlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from llm_consortium.db import DatabaseConnection
+from llm_consortium.orchestrator import create_consortium
+from llm_consortium.strategies.cascade import CascadeStrategy, parse_tiers
+
+
+MODELS = {'cheap-a': 1, 'cheap-b': 1, 'frontier': 1}
+TIERS = 'cheap-a,cheap-b;frontier'
+
+
+@pytest.fixture(autouse=True)
+def isolated_db(monkeypatch, tmp_path: pathlib.Path):
+    monkeypatch.setattr("llm_consortium.db.user_dir", lambda: tmp_path)
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+    yield
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+
+
+def _strategy(**params):
+    strategy = CascadeStrategy(Mock(), {'tiers': TIERS, 'confidence_threshold': 0.8, **params})
+    strategy.initialize_state()
+    return strategy
+
+
+def _responses(texts, latency=1.0):
+    return [
+        {'model': f'm{index}', 'response': text, 'latency': latency, 'input_tokens': 100, 'output_tokens': 400}
+        for index, text in enumerate(texts)
+    ]
+
+
+def _finish(strategy, responses, confidence):
+    strategy.process_responses(responses, 1)
+    context = SimpleNamespace(synthesis={'confidence': confidence}, model_responses=responses)
+    strategy.update_state(context)
+    return strategy.needs_iteration(context)
+
+
+def test_parse_tiers():
+    assert parse_tiers('a, b; c') == [['a', 'b'], ['c']]
+    assert parse_tiers(['a,b', 'c']) == [['a', 'b'], ['c']]
+    assert parse_tiers(None) == []
+
+
+@pytest.mark.parametrize("params, message", [
+    ({'tiers': ''}, "requires tiers"),
+    ({'tiers': TIERS, 'tier_costs': '1'}, "one value per tier"),
+    ({'tiers': TIERS, 'agreement_threshold': 2}, "agreement_threshold must be between 0 and 1"),
+])
+def test_invalid_params(params, message):
+    with pytest.raises(ValueError, match=message):
+        CascadeStrategy(Mock(), params)
+
+
+def test_first_iteration_uses_only_first_tier():
+    assert _strategy().select_models(MODELS, 'prompt', 1) == {'cheap-a': 1, 'cheap-b': 1}
+
+
+def test_confident_agreeing_tier_does_not_escalate():
+    strategy = _strategy()
+    strategy.select_models(MODELS, 'prompt', 1)
+
+    assert not _finish(strategy, _responses(['The answer is 42.', 'The answer is 42.']), 0.9)
+    assert strategy.select_models(MODELS, 'prompt', 2) == {'cheap-a': 1, 'cheap-b': 1}
+
+
+def test_low_confidence_escalates_to_next_tier():
+    strategy = _strategy()
+    strategy.select_models(MODELS, 'prompt', 1)
+
+    assert _finish(strategy, _responses(['The answer is 42.', 'The answer is 42.']), 0.5)
+    assert strategy.select_models(MODELS, 'prompt', 2) == {'frontier': 1}
+
+
+def test_disagreement_escalates_even_when_arbiter_is_confident():
+    strategy = _strategy(cumulative='true')
+    strategy.select_models(MODELS, 'prompt', 1)
+
+    assert _finish(strategy, _responses(['Paris, obviously.', 'It must be 1,234 kilometres.']), 0.95)
+    assert strategy.select_models(MODELS, 'prompt', 2) == MODELS
+
+
+def test_last_tier_never_escalates():
+    strategy = _strategy()
+    strategy.iteration_state['tier'] = 1
+    strategy.select_models(MODELS, 'prompt', 2)
+
+    assert not _finish(strategy, _responses(['a', 'b']), 0.1)
+
+
+def test_tier_usage_records_latency_and_spend():
+    strategy = _strategy(tier_costs='0.5,10')
+    strategy.select_models(MODELS, 'prompt', 1)
+    _finish(strategy, _responses(['x', 'y'], latency=2.0), 0.5)
+
+    usage = strategy.iteration_state['tier_usage'][0]
+    assert usage['tier'] == 1
+    assert usage['calls'] == 2
+    assert usage['latency_total'] == pytest.approx(4.0)
+    assert usage['latency_max'] == pytest.approx(2.0)
+    assert usage['spend'] == pytest.approx(1000 / 1000 * 0.5)
+    assert usage['escalated'] is True
+
+
+def _model(text, response_id):
+    model = MagicMock()
+    response = MagicMock()
+    response.text.return_value = text
+    response.id = response_id
+    response.usage.return_value = SimpleNamespace(input=50, output=150)
+    model.prompt.return_value = response
+    return model
+
+
+@patch('llm_consortium.orchestrator.llm.get_model')
+def test_orchestrator_escalates_and_records_tiers(mock_get_model):
+    arbiter = MagicMock()
+    arbiter_response = MagicMock()
+    arbiter_response.id = "arb"
+    arbiter_response.text.return_value = (
+        "<synthesis>Done.</synthesis><confidence>0.95</confidence><needs_iteration>false</needs_iteration>"
+    )
+    arbiter.prompt.return_value = arbiter_response
+    models = {
+        'cheap-a': _model("Paris, obviously.", "a"),
+        'cheap-b': _model("It must be 1,234 kilometres.", "b"),
+        'frontier': _model("Paris.", "f"),
+        'arbiter': arbiter,
+    }
+    mock_get_model.side_effect = lambda model_id: models[model_id]
+
+    orchestrator = create_consortium(
+        models=list(MODELS),
+        arbiter='arbiter',
+        max_iterations=3,
+        manual_context=True,
+        strategy='cascade',
+        strategy_params={'tiers': TIERS},
+    )
+    result = orchestrator.orchestrate("Capital of France?")
+
+    assert [sorted(item['selected_models']) for item in result['iterations']] == [['cheap-a', 'cheap-b'], ['frontier']]
+    rows = list(DatabaseConnection.get_connection()["cascade_tiers"].rows)
+    assert [(row['iteration'], row['tier'], row['escalated']) for row in rows] == [(1, 1, 1), (2, 2, 0)]
+    assert rows[0]['input_tokens'] == 100 and rows[0]['output_tokens'] == 300
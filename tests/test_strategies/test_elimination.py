@@ -179,3 +179,114 @@ class TestEliminationStrategy:
         # Should only eliminate 1 model to keep minimum of 2
         assert len(strategy.iteration_state['eliminated_models']) == 1
         assert 'gemini' in strategy.iteration_state['eliminated_models']
+
+
+def _context(responses, ranking):
+    context = Mock(spec=IterationContext)
+    context.model_responses = responses
+    context.synthesis = {'ranking': ranking}
+    return context
+
+
+class TestCostAwareElimination:
+    """Latency/cost weighting, instance granularity and the marginal rule."""
+
+    def _strategy(self, **params):
+        strategy = EliminationStrategy(Mock(), {'elimination_delay': 0, 'keep_minimum': 1, **params})
+        strategy.initialize_state()
+        return strategy
+
+    def test_invalid_granularity(self):
+        with pytest.raises(ValueError, match="granularity must be one of"):
+            EliminationStrategy(Mock(), {'granularity': 'token'})
+
+    def test_latency_weight_eliminates_slow_model_over_worst_ranked(self):
+        strategy = self._strategy(latency_weight=2.0)
+        responses = [
+            {'model': 'fast-best', 'id': 1, 'latency': 1.0},
+            {'model': 'slow', 'id': 2, 'latency': 30.0},
+            {'model': 'fast-worst', 'id': 3, 'latency': 1.0},
+        ]
+
+        strategy.update_state(_context(responses, [1, 2, 3]))
+
+        assert strategy.iteration_state['eliminated_models'] == {'slow'}
+
+    def test_cost_weight_uses_token_usage(self):
+        strategy = self._strategy(cost_weight=2.0)
+        responses = [
+            {'model': 'a', 'id': 1, 'input_tokens': 10, 'output_tokens': 10},
+            {'model': 'verbose', 'id': 2, 'input_tokens': 10, 'output_tokens': 2000},
+            {'model': 'c', 'id': 3, 'input_tokens': 10, 'output_tokens': 10},
+        ]
+
+        strategy.update_state(_context(responses, [1, 2, 3]))
+
+        assert strategy.iteration_state['eliminated_models'] == {'verbose'}
+
+    def test_winner_is_never_eliminated(self):
+        strategy = self._strategy(latency_weight=10.0)
+        responses = [
+            {'model': 'slow-winner', 'id': 1, 'latency': 60.0},
+            {'model': 'b', 'id': 2, 'latency': 1.0},
+        ]
+
+        strategy.update_state(_context(responses, [1, 2]))
+
+        assert strategy.iteration_state['eliminated_models'] == {'b'}
+
+    def test_instance_granularity_drops_one_instance(self):
+        strategy = self._strategy(granularity='instance')
+        responses = [
+            {'model': 'a', 'instance': 0, 'id': 1},
+            {'model': 'a', 'instance': 1, 'id': 2},
+            {'model': 'b', 'instance': 0, 'id': 3},
+        ]
+
+        strategy.update_state(_context(responses, [1, 3, 2]))
+
+        assert strategy.iteration_state['eliminated_models'] == set()
+        assert strategy.iteration_state['eliminated_instances'] == {('a', 1)}
+        assert strategy.select_models({'a': 2, 'b': 1}, "prompt", 2) == {'a': 2, 'b': 1}
+        assert strategy.excluded_instances() == {('a', 1)}
+
+    def test_instance_granularity_eliminates_the_ranked_instance(self):
+        strategy = self._strategy(granularity='instance')
+        responses = [
+            {'model': 'x', 'instance': 0, 'id': 0},
+            {'model': 'x', 'instance': 1, 'id': 1},
+            {'model': 'x', 'instance': 2, 'id': 2},
+            {'model': 'y', 'instance': 0, 'id': 3},
+        ]
+
+        strategy.update_state(_context(responses, [3, 0, 1, 2]))
+
+        assert strategy.select_models({'x': 3, 'y': 1}, "prompt", 2) == {'x': 3, 'y': 1}
+        assert strategy.excluded_instances() == {('x', 2)}
+
+    def test_instance_granularity_restores_instances_for_keep_minimum(self):
+        strategy = self._strategy(granularity='instance', keep_minimum=2)
+        strategy.iteration_state['eliminated_instances'] = {('a', 0), ('a', 1), ('b', 0)}
+
+        strategy.select_models({'a': 2, 'b': 1}, "prompt", 3)
+
+        assert len(strategy.excluded_instances()) == 1
+
+    def test_marginal_rule_drops_slow_non_contributors_first(self):
+        strategy = self._strategy(marginal='true')
+        first = [
+            {'model': 'a', 'id': 1, 'latency': 5.0},
+            {'model': 'b', 'id': 2, 'latency': 5.0},
+            {'model': 'slow', 'id': 3, 'latency': 40.0},
+            {'model': 'quick', 'id': 4, 'latency': 1.0},
+        ]
+        strategy.elimination_delay = 3
+        strategy.update_state(_context(first, [2, 1, 4, 3]))
+        strategy.elimination_delay = 0
+
+        # 'b' won the first iteration, so it has contributed even though it ranks last now
+        second = [dict(r, id=r['id'] + 10) for r in first]
+        strategy.update_state(_context(second, [11, 13, 14, 12]))
+
+        assert strategy.iteration_state['eliminated_models'] == {'slow'}
+        assert strategy.iteration_state['elimination_log'][0]['contributed'] is False
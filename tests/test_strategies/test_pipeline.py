@@ -0,0 +1,135 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+from llm_consortium.strategies.elimination import EliminationStrategy
+from llm_consortium.strategies.factory import create_strategy
+from llm_consortium.strategies.pipeline import PipelineStrategy, parse_stage_names
+from llm_consortium.strategies.voting import VotingStrategy
+
+
+VECTORS = {
+    'Paris is the capital of France.': [1.0, 0.05, 0.0],
+    "France's capital city is Paris.": [0.97, 0.1, 0.02],
+    'The capital is Lyon.': [0.1, 1.0, 0.0],
+    'It is Paris.': [0.95, 0.0, 0.1],
+}
+
+
+def _responses():
+    return [
+        {'model': model, 'response': text, 'id': index, 'response_id': f'r{index}'}
+        for index, (model, text) in enumerate(zip(['gpt-4', 'claude', 'gemini', 'llama'], VECTORS), start=1)
+    ]
+
+
+def _service():
+    service = Mock()
+    service.embed_batch.side_effect = lambda texts: [np.array(VECTORS[text]) for text in texts]
+    return service
+
+
+def test_parse_stage_names():
+    assert parse_stage_names('semantic, Voting') == ['semantic', 'voting']
+    assert parse_stage_names(['semantic', 'voting,elimination']) == ['semantic', 'voting', 'elimination']
+    assert parse_stage_names(None) == []
+
+
+def test_stages_are_required():
+    with pytest.raises(ValueError, match="requires stages"):
+        PipelineStrategy(Mock())
+
+
+def test_nested_and_unknown_stages_are_rejected():
+    with pytest.raises(ValueError, match="cannot include 'pipeline'"):
+        PipelineStrategy(Mock(), {'stages': 'voting,pipeline'})
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        PipelineStrategy(Mock(), {'stages': 'voting,nonexistent'})
+
+
+def test_stage_params_are_scoped_by_prefix():
+    strategy = create_strategy('pipeline', Mock(), {
+        'stages': 'voting,elimination',
+        'voting.similarity_threshold': '0.9',
+        'keep_minimum': '3',
+    })
+
+    voting, elimination = strategy.stages
+    assert isinstance(voting, VotingStrategy) and isinstance(elimination, EliminationStrategy)
+    assert voting.similarity_threshold == 0.9
+    assert elimination.keep_minimum == 3
+
+
+def test_select_models_narrows_through_stages():
+    strategy = PipelineStrategy(Mock(), {'stages': 'voting,elimination'})
+    strategy.initialize_state()
+    strategy.stages[1].iteration_state['eliminated_models'].update({'c'})
+
+    selected = strategy.select_models({'a': 1, 'b': 1, 'c': 1}, 'prompt', 2)
+
+    assert selected == {'a': 1, 'b': 1}
+
+
+def test_excluded_instances_are_forwarded_from_stages():
+    strategy = create_strategy('pipeline', Mock(), {
+        'stages': 'voting,elimination', 'elimination.granularity': 'instance',
+    })
+    strategy.initialize_state()
+    strategy.stages[1].iteration_state['eliminated_instances'].add(('a', 1))
+
+    assert strategy.select_models({'a': 2, 'b': 1}, 'prompt', 2) == {'a': 2, 'b': 1}
+    assert strategy.excluded_instances() == {('a', 1)}
+
+
+def test_semantic_then_voting_embeds_each_response_once():
+    service = _service()
+    orchestrator = Mock()
+    orchestrator.consortium_id = None
+    orchestrator.get_embedding_service.return_value = service
+    strategy = PipelineStrategy(orchestrator, {
+        'stages': 'semantic,voting',
+        'eps': 0.2,
+        'voting.similarity_backend': 'embedding',
+    })
+    strategy.initialize_state()
+
+    result = strategy.process_responses(_responses(), 1)
+
+    assert [r['model'] for r in result] == ['gpt-4', 'claude', 'llama']
+    assert all(r['voting_selected'] for r in result)
+    service.embed_batch.assert_called_once()
+    assert strategy._local_features.computed['embeddings'] == 4
+    history = strategy.iteration_state['stage_history'][0]['stages']
+    assert [(entry['stage'], entry['input'], entry['output']) for entry in history] == [
+        ('semantic', 4, 3), ('voting', 3, 3)
+    ]
+
+
+def test_orchestrator_feature_cache_is_shared_and_reset_per_iteration():
+    config = ConsortiumConfig(
+        models={'m': 1},
+        arbiter='m',
+        strategy='pipeline',
+        strategy_params={'stages': 'semantic,voting', 'voting.similarity_backend': 'embedding'},
+    )
+    orchestrator = ConsortiumOrchestrator(config)
+    service = _service()
+    orchestrator._embedding_service = service
+
+    features = orchestrator.get_iteration_features()
+    orchestrator.strategy.process_responses(_responses(), 1)
+
+    assert orchestrator.get_iteration_features() is features
+    assert features.computed['embeddings'] == 4
+    service.embed_batch.assert_called_once()
+
+
+def test_pipeline_with_elimination_forces_rank_judging():
+    config = ConsortiumConfig(
+        models={'m': 1},
+        strategy='pipeline',
+        strategy_params={'stages': 'voting,elimination'},
+    )
+    assert config.judging_method == 'rank'
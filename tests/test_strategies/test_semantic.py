@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 
 import numpy as np
+import pytest
 
 from llm_consortium.strategies.base import ConsortiumStrategy
 from llm_consortium.strategies.semantic import SemanticClusteringStrategy
@@ -90,4 +91,31 @@ def test_process_responses_falls_back_to_all_when_everything_is_outlier():
     filtered = strategy.process_responses(responses, iteration=1)
 
     assert len(filtered) == 3
-    assert {response["cluster_id"] for response in filtered} == {-1}
\ No newline at end of file
+    assert {response["cluster_id"] for response in filtered} == {-1}
+
+def test_validate_params_rejects_unknown_algorithm():
+    with pytest.raises(ValueError, match="Unsupported clustering algorithm"):
+        SemanticClusteringStrategy(_make_orchestrator({}), {"clustering_algorithm": "kmeans"})
+
+
+@pytest.mark.parametrize("algorithm", ["dbscan", "agglomerative", "tropical"])
+def test_process_responses_uses_selected_algorithm(algorithm):
+    mapping = {
+        "cluster-a-1": [1.0, 0.0],
+        "cluster-a-2": [0.95, 0.05],
+        "outlier": [-1.0, 0.0],
+    }
+    strategy = SemanticClusteringStrategy(
+        _make_orchestrator(mapping),
+        {"clustering_algorithm": algorithm, "eps": 0.2, "min_samples": 2},
+    )
+    responses = [
+        {"response": "cluster-a-1", "id": 1, "response_id": "r1", "model": "m1"},
+        {"response": "cluster-a-2", "id": 2, "response_id": "r2", "model": "m2"},
+        {"response": "outlier", "id": 3, "response_id": "r3", "model": "m3"},
+    ]
+
+    filtered = strategy.process_responses(responses, iteration=1)
+
+    assert strategy.clustering_algorithm == algorithm
+    assert [response["response"] for response in filtered] == ["cluster-a-1", "cluster-a-2"]
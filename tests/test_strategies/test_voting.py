@@ -235,3 +235,266 @@ class TestVotingStrategy:
         # State should be preserved
         assert strategy.iteration_state['consensus_count'] == 2
         assert strategy.iteration_state['no_consensus_count'] == 1
+
+
+def _paraphrase_corpus(count, length=150, edits=2, seed=3):
+    """Four base answers, each repeated with a few word-level edits."""
+    import random
+    import string
+
+    rng = random.Random(seed)
+    vocabulary = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))) for _ in range(300)]
+    bases = [" ".join(rng.choice(vocabulary) for _ in range(length // 6)) for _ in range(4)]
+    responses = []
+    for index in range(count):
+        words = bases[index % 4].split()
+        for _ in range(edits):
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        responses.append({'model': f'model-{index}', 'response': " ".join(words)})
+    return responses
+
+
+def _group_sizes(groups):
+    return [[response['model'] for response in group] for group in groups]
+
+
+class TestNearDuplicateVoting:
+    """Shingle/MinHash grouping against the difflib baseline."""
+
+    def test_invalid_similarity_method(self):
+        with pytest.raises(ValueError, match="similarity_method must be one of"):
+            VotingStrategy(Mock(), {'similarity_method': 'levenshtein'})
+
+    def test_difflib_method_matches_previous_ratio(self):
+        strategy = VotingStrategy(Mock(), {'similarity_method': 'difflib'})
+
+        assert strategy._calculate_similarity("Sure! The answer is 42", "the answer is 42") == 1.0
+        assert strategy._calculate_similarity("abcd", "abce") == pytest.approx(0.75)
+
+    @pytest.mark.parametrize("count", [8, 40])
+    def test_minhash_groups_match_difflib(self, count):
+        # Kept under 200 characters: beyond that difflib's autojunk heuristic
+        # discards common letters and the baseline stops grouping paraphrases.
+        responses = _paraphrase_corpus(count)
+        params = {'similarity_threshold': 0.6, 'answer_length': 2000}
+
+        minhash = VotingStrategy(Mock(), params)._group_similar_responses(responses)
+        baseline = VotingStrategy(Mock(), {**params, 'similarity_method': 'difflib'})._group_similar_responses(responses)
+
+        assert _group_sizes(minhash) == _group_sizes(baseline)
+        assert len(minhash) == 4
+
+    def test_lsh_skips_dissimilar_pairs(self):
+        from llm_consortium.similarity import NearDuplicateIndex
+
+        texts = [response['response'] for response in _paraphrase_corpus(40, length=600)]
+        index = NearDuplicateIndex(texts, threshold=0.6)
+
+        candidates = index.candidates(0)
+
+        assert set(range(4, 40, 4)) <= set(candidates)
+        assert len(candidates) < 39
+
+    def test_minhash_groups_long_responses(self):
+        # Timings against difflib live in evals/similarity_benchmark.py
+        responses = _paraphrase_corpus(48, length=1200, edits=6)
+        strategy = VotingStrategy(Mock(), {'similarity_threshold': 0.6, 'similarity_method': 'minhash'})
+
+        assert len(strategy._group_similar_responses(responses)) == 4
+
+
+class TestEmbeddingVoting:
+    """similarity_backend=embedding groups paraphrases by cosine similarity."""
+
+    RESPONSES = [
+        {'model': 'gpt-4', 'response': 'Paris is the capital of France.'},
+        {'model': 'claude', 'response': "France's capital city is Paris."},
+        {'model': 'gemini', 'response': 'The capital is Lyon.'},
+        {'model': 'llama', 'response': 'It is Paris.'},
+    ]
+    VECTORS = {
+        'Paris is the capital of France.': [1.0, 0.05, 0.0],
+        "France's capital city is Paris.": [0.97, 0.1, 0.02],
+        'The capital is Lyon.': [0.1, 1.0, 0.0],
+        'It is Paris.': [0.95, 0.0, 0.1],
+    }
+
+    def _strategy(self, **params):
+        import numpy as np
+
+        service = Mock()
+        service.embed_batch.side_effect = lambda texts: [np.array(self.VECTORS[text]) for text in texts]
+        orchestrator = Mock()
+        orchestrator.get_embedding_service.return_value = service
+        return VotingStrategy(orchestrator, {'similarity_backend': 'embedding', **params}), service
+
+    def test_invalid_similarity_backend(self):
+        with pytest.raises(ValueError, match="similarity_backend must be one of"):
+            VotingStrategy(Mock(), {'similarity_backend': 'vectors'})
+
+    def test_paraphrases_reach_consensus(self):
+        strategy, service = self._strategy(require_majority=True)
+        strategy.initialize_state()
+        responses = [dict(response) for response in self.RESPONSES]
+
+        result = strategy.process_responses(responses, 1)
+
+        assert [r['model'] for r in result] == ['gpt-4', 'claude', 'llama']
+        assert all(r['voting_selected'] for r in result)
+        assert result[1]['similarity_to_group'] > 0.85
+        assert all('embedding' in r for r in responses)
+        service.embed_batch.assert_called_once()
+
+    def test_lexical_backend_splits_the_same_paraphrases(self):
+        strategy = VotingStrategy(Mock(), {'require_majority': True, 'similarity_threshold': 0.7})
+        strategy.initialize_state()
+
+        result = strategy.process_responses([dict(response) for response in self.RESPONSES], 1)
+
+        assert len(result) == 4
+        assert not any(r['voting_selected'] for r in result)
+
+    def test_embedding_failure_raises_runtime_error(self):
+        orchestrator = Mock()
+        orchestrator.get_embedding_service.side_effect = ValueError("No valid embedding_backend configured. Found: None")
+        strategy = VotingStrategy(orchestrator, {'similarity_backend': 'embedding'})
+
+        with pytest.raises(RuntimeError, match="failed to get embeddings"):
+            strategy._group_similar_responses([dict(response) for response in self.RESPONSES])
+
+
+class TestAnswerExtractionVoting:
+    """answer_extractor votes on canonical final answers."""
+
+    def test_invalid_extractor(self):
+        with pytest.raises(ValueError, match="Unknown answer extractor"):
+            VotingStrategy(Mock(), {'answer_extractor': 'guess'})
+
+    def test_regex_extractor_requires_pattern(self):
+        with pytest.raises(ValueError, match="answer_pattern is required"):
+            VotingStrategy(Mock(), {'answer_extractor': 'regex'})
+
+    def test_exact_vote_ignores_differing_reasoning(self):
+        strategy = VotingStrategy(Mock(), {'answer_extractor': 'tag,number', 'require_majority': True})
+        strategy.initialize_state()
+        responses = [
+            {'model': 'a', 'response': 'Expanding (x-1)^4 gives roots at 1... ANSWER: 2'},
+            {'model': 'b', 'response': 'A completely different derivation.\n<answer>2.0</answer>'},
+            {'model': 'c', 'response': 'I get 4/2 after simplifying'},
+            {'model': 'd', 'response': 'ANSWER: 3'},
+        ]
+
+        result = strategy.process_responses(responses, 1)
+
+        assert [r['model'] for r in result] == ['a', 'b', 'c']
+        assert {r['extracted_answer'] for r in result} == {'2'}
+        history = strategy.iteration_state['voting_history'][-1]
+        assert [(g['answer'], g['size']) for g in history['groups']] == [('2', 3), ('3', 1)]
+
+    def test_unextractable_responses_fall_back_to_similarity(self):
+        strategy = VotingStrategy(Mock(), {'answer_extractor': 'boolean', 'similarity_threshold': 0.9})
+        responses = [
+            {'model': 'a', 'response': 'Yes, it is vulnerable'},
+            {'model': 'b', 'response': 'It depends on the driver'},
+            {'model': 'c', 'response': 'It depends on the driver!'},
+        ]
+
+        groups = strategy._group_similar_responses(responses)
+
+        assert [[r['model'] for r in g] for g in groups] == [['a'], ['b', 'c']]
+        assert responses[1]['extracted_answer'] is None
+
+    def test_large_self_consistency_vote(self):
+        strategy = VotingStrategy(Mock(), {'answer_extractor': 'number', 'require_majority': True})
+        strategy.initialize_state()
+        responses = [
+            {'model': f'm{i}', 'response': f"Reasoning path {i} ... so the result is {7 if i % 3 else 8}"}
+            for i in range(600)
+        ]
+
+        result = strategy.process_responses(responses, 1)
+
+        assert len(result) == 400
+        assert all(r['extracted_answer'] == '7' for r in result)
+
+
+class TestSequentialSampling:
+    """sequential=wilson|sprt stops launching instances once the vote is settled."""
+
+    def test_stopping_rules(self):
+        from llm_consortium.sequential import majority_settled, wilson_lower_bound
+
+        assert wilson_lower_bound(3, 3) > 0.5
+        assert majority_settled(3, 3, 'wilson')
+        assert not majority_settled(3, 4, 'wilson')
+        assert not majority_settled(5, 5, 'sprt')
+        assert majority_settled(6, 6, 'sprt')
+        with pytest.raises(ValueError, match="Unknown stopping rule"):
+            majority_settled(3, 3, 'bayes')
+
+    def test_invalid_sequential_params(self):
+        with pytest.raises(ValueError, match="sequential must be one of"):
+            VotingStrategy(Mock(), {'sequential': 'always'})
+        with pytest.raises(ValueError, match="wave_size must be at least 1"):
+            VotingStrategy(Mock(), {'sequential': 'wilson', 'wave_size': 0})
+
+    def test_wave_size_only_in_sequential_mode(self):
+        assert VotingStrategy(Mock()).sampling_wave_size() is None
+        assert VotingStrategy(Mock(), {'sequential': 'wilson', 'wave_size': 2}).sampling_wave_size() == 2
+
+    def test_settled_on_agreement_not_on_disagreement(self):
+        strategy = VotingStrategy(Mock(), {'sequential': 'wilson', 'answer_extractor': 'number'})
+        strategy.initialize_state()
+        agree = [{'model': 'm', 'response': 'The result is 42'} for _ in range(3)]
+        split = [{'model': 'm', 'response': f'The result is {n}'} for n in (42, 42, 7)]
+
+        assert strategy.sampling_settled(agree, 1)
+        assert not strategy.sampling_settled(split, 1)
+        assert 'extracted_answer' not in agree[0]
+        assert [h['settled'] for h in strategy.iteration_state['sampling_history']] == [True, False]
+
+    @staticmethod
+    def _run(answers, params):
+        from unittest.mock import MagicMock, patch
+        from llm_consortium.orchestrator import create_consortium
+
+        calls = []
+
+        def prompt(*args, **kwargs):
+            response = MagicMock()
+            response.text.return_value = answers[len(calls) % len(answers)]
+            calls.append(response)
+            return response
+
+        member = MagicMock()
+        member.prompt.side_effect = prompt
+        arbiter = MagicMock()
+        arbiter.prompt.return_value.text.return_value = (
+            "<synthesis>42</synthesis><confidence>0.9</confidence><needs_iteration>false</needs_iteration>"
+        )
+        with patch('llm_consortium.orchestrator.llm.get_model',
+                   side_effect=lambda model_id: arbiter if model_id == 'arbiter' else member), \
+                patch('llm_consortium.orchestrator.save_consortium_run'), \
+                patch('llm_consortium.orchestrator.update_consortium_run'):
+            orchestrator = create_consortium(
+                models=['member:9'], arbiter='arbiter', max_iterations=1, manual_context=True,
+                strategy='voting', strategy_params={'answer_extractor': 'number', **params},
+            )
+            result = orchestrator.orchestrate("What is 6 x 7?")
+        return calls, result
+
+    def test_orchestrator_stops_after_first_agreeing_wave(self):
+        calls, result = self._run(['The result is 42'], {'sequential': 'wilson'})
+
+        assert len(calls) == 3
+        assert len(result['iterations'][0]['model_responses']) == 3
+
+    def test_orchestrator_spends_budget_on_disagreement(self):
+        calls, _ = self._run(['The result is 42', 'The result is 41', 'The result is 7'], {'sequential': 'wilson'})
+
+        assert len(calls) == 9
+
+    def test_without_sequential_all_instances_run(self):
+        calls, _ = self._run(['The result is 42'], {})
+
+        assert len(calls) == 9